@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+"""
+Backfill script that (re)computes the user_activity_daily_rollup table
+from the reading sessions, exercise sessions, exercises, bookmarks and
+learned words of the users.
+
+New activity is added to the rollup by the model listeners, so this only
+needs to run once after the migration, or to repair the rollup of some users
+(e.g. after rows of their activity were deleted in bulk, which bypasses the
+listeners).
+The rows of a batch of users are recomputed from scratch, so the script
+can be safely run again.
+
+Usage:
+    source ~/.venvs/z_env/bin/activate && python -m tools.backfill_user_activity_daily_rollup [--user-ids 1,2,3] [--batch-size N]
+"""
+
+import argparse
+from collections import defaultdict
+
+from sqlalchemy import bindparam, text
+
+from zeeguu.api.app import create_app
+from zeeguu.core.model import db, User, UserActivityDailyRollup
+
+app = create_app()
+app.app_context().push()
+
+db_session = db.session
+
+# every query returns user_id, date, language_id, and the values of the
+# given counters; the languages are the ones of UserActivityDailyRollup
+ROLLUP_QUERIES = [
+    (
+        ["reading_ms"],
+        """
+        SELECT urs.user_id, DATE(urs.start_time) AS date, a.language_id,
+            SUM(urs.duration)
+        FROM user_reading_session urs
+            JOIN article a ON urs.article_id = a.id
+        WHERE urs.user_id IN :user_ids AND urs.start_time IS NOT NULL
+        GROUP BY urs.user_id, DATE(urs.start_time), a.language_id
+        """,
+    ),
+    (
+        ["exercise_ms"],
+        """
+        SELECT ues.user_id, DATE(ues.start_time) AS date, sl.language_id,
+            SUM(ues.duration)
+        FROM user_exercise_session ues
+            JOIN (
+                SELECT DISTINCT e.session_id, p.language_id
+                FROM exercise e
+                    JOIN user_word uw ON e.user_word_id = uw.id
+                    JOIN meaning m ON uw.meaning_id = m.id
+                    JOIN phrase p ON m.origin_id = p.id
+                WHERE uw.user_id IN :user_ids
+            ) sl ON sl.session_id = ues.id
+        WHERE ues.user_id IN :user_ids AND ues.start_time IS NOT NULL
+        GROUP BY ues.user_id, DATE(ues.start_time), sl.language_id
+        """,
+    ),
+    (
+        ["exercises", "correct_first_try"],
+        """
+        SELECT uw.user_id, DATE(e.time) AS date, p.language_id, COUNT(*),
+            SUM(CASE WHEN o.outcome IN :correct_outcomes THEN 1 ELSE 0 END)
+        FROM exercise e
+            JOIN user_word uw ON e.user_word_id = uw.id
+            JOIN meaning m ON uw.meaning_id = m.id
+            JOIN phrase p ON m.origin_id = p.id
+            JOIN exercise_outcome o ON e.outcome_id = o.id
+        WHERE uw.user_id IN :user_ids
+        GROUP BY uw.user_id, DATE(e.time), p.language_id
+        """,
+    ),
+    (
+        ["translations"],
+        """
+        SELECT uw.user_id, DATE(b.time) AS date, p.language_id, COUNT(*)
+        FROM bookmark b
+            JOIN user_word uw ON b.user_word_id = uw.id
+            JOIN meaning m ON uw.meaning_id = m.id
+            JOIN phrase p ON m.origin_id = p.id
+        WHERE uw.user_id IN :user_ids AND b.time IS NOT NULL
+        GROUP BY uw.user_id, DATE(b.time), p.language_id
+        """,
+    ),
+    (
+        ["learned_words"],
+        """
+        SELECT uw.user_id, DATE(uw.learned_time) AS date, p.language_id, COUNT(*)
+        FROM user_word uw
+            JOIN meaning m ON uw.meaning_id = m.id
+            JOIN phrase p ON m.origin_id = p.id
+        WHERE uw.user_id IN :user_ids AND uw.learned_time IS NOT NULL
+        GROUP BY uw.user_id, DATE(uw.learned_time), p.language_id
+        """,
+    ),
+]
+
+
+def rollup_rows(user_ids):
+    totals = defaultdict(lambda: {k: 0 for k in UserActivityDailyRollup.COUNTERS})
+
+    for counters, query in ROLLUP_QUERIES:
+        statement = text(query).bindparams(bindparam("user_ids", expanding=True))
+        params = {"user_ids": user_ids}
+        if ":correct_outcomes" in query:
+            statement = statement.bindparams(
+                bindparam("correct_outcomes", expanding=True)
+            )
+            params["correct_outcomes"] = (
+                UserActivityDailyRollup.CORRECT_FIRST_TRY_OUTCOMES
+            )
+
+        for user_id, date, language_id, *values in db_session.execute(
+            statement, params
+        ):
+            if language_id is None:
+                # e.g. an article or a phrase without a language
+                continue
+            row = totals[(user_id, date, language_id)]
+            for counter, value in zip(counters, values):
+                row[counter] += int(value or 0)
+
+    return [
+        dict(user_id=user_id, date=date, language_id=language_id, **counters)
+        for (user_id, date, language_id), counters in totals.items()
+    ]
+
+
+def backfill(user_ids):
+    rows = rollup_rows(user_ids)
+    table = UserActivityDailyRollup.__table__
+    db_session.execute(table.delete().where(table.c.user_id.in_(user_ids)))
+    if rows:
+        db_session.execute(table.insert(), rows)
+    db_session.commit()
+    return len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--user-ids", help="comma separated ids of the users to backfill"
+    )
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.user_ids:
+        user_ids = [int(each) for each in args.user_ids.split(",")]
+    else:
+        user_ids = [id for (id,) in db_session.query(User.id).order_by(User.id)]
+
+    print(f"backfilling the activity rollup of {len(user_ids)} users")
+    total_rows = 0
+    for start in range(0, len(user_ids), args.batch_size):
+        batch = user_ids[start : start + args.batch_size]
+        total_rows += backfill(batch)
+        print(f"{start + len(batch)}/{len(user_ids)} users, {total_rows} rows")
+
+    print("done")
+
+
+if __name__ == "__main__":
+    main()
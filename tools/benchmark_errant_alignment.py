@@ -0,0 +1,73 @@
+"""
+Compares the time of the ERRANT alignment (the one used by the GEC
+tagging) with the original cell-by-cell implementation, on long
+sentences taken from the English test texts and corrupted with random
+swaps, deletions and replacements, and checks that both produce the
+same alignment.
+
+Usage:
+    python -m tools.benchmark_errant_alignment [sentence length in words] [pairs]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+from zeeguu.core.nlp_pipeline import SpacyWrappers
+from zeeguu.core.nlp_pipeline.alignment_errant import ERRANT_Alignment
+
+TEST_TEXT = (
+    Path(__file__).parent.parent
+    / "zeeguu"
+    / "core"
+    / "test"
+    / "test_data"
+    / "cnn_kathmandu.txt"
+)
+
+
+def corrupt(words, rng):
+    words = list(words)
+    for _ in range(max(1, len(words) // 6)):
+        a, b = rng.randrange(len(words)), rng.randrange(len(words))
+        words[a], words[b] = words[b], words[a]
+    for _ in range(max(1, len(words) // 10)):
+        del words[rng.randrange(len(words))]
+        words[rng.randrange(len(words))] = rng.choice(words)
+    return words
+
+
+def main():
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    pair_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    rng = random.Random(42)
+    nlp = SpacyWrappers["en"].spacy_pipe
+    words = TEST_TEXT.read_text().split()
+
+    pairs = []
+    for _ in range(pair_count):
+        start = rng.randrange(len(words) - length)
+        correct = words[start : start + length]
+        pairs.append((nlp(" ".join(corrupt(correct, rng))), nlp(" ".join(correct))))
+
+    start = time.time()
+    alignments = [ERRANT_Alignment(err, corr) for err, corr in pairs]
+    vectorized = time.time() - start
+
+    start = time.time()
+    reference = [alignment.align_cell_by_cell(False) for alignment in alignments]
+    cell_by_cell = time.time() - start
+
+    for alignment, (cost_matrix, op_matrix) in zip(alignments, reference):
+        assert alignment.cost_matrix == cost_matrix
+        assert alignment.op_matrix == op_matrix
+
+    print(f"{pair_count} pairs of {length} word sentences; identical alignments")
+    print(f"cell by cell: {cell_by_cell:.3f}s")
+    print(f"vectorized:   {vectorized:.3f}s ({cell_by_cell / vectorized:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
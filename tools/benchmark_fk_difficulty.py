@@ -0,0 +1,95 @@
+"""
+Compares the Flesch-Kincaid estimation of the test texts in
+zeeguu/core/test/test_data the way it used to be done (a new pyphen
+hyphenator for every distinct word) with the cached batch estimation.
+
+Usage:
+    python -m tools.benchmark_fk_difficulty [repetitions]
+"""
+
+import math
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import nltk
+import pyphen
+
+from zeeguu.core.language.strategies.flesch_kincaid_difficulty_estimator import (
+    FleschKincaidDifficultyEstimator,
+)
+from zeeguu.core.model.language import Language
+from zeeguu.core.util.text import split_words_from_text
+
+TEST_DATA = Path(__file__).parent.parent / "zeeguu" / "core" / "test" / "test_data"
+TEXTS = {
+    "cnn_kathmandu.txt": "en",
+    "der_kleine_prinz.txt": "de",
+    "faz_leichtathletik.txt": "de",
+    "spiegel_nancy.txt": "de",
+    "spiegel_venezuela.txt": "de",
+    "jp_article_example.txt": "da",
+    "verdensbedste_indonesien.txt": "da",
+    "verdensbedste_jorde.txt": "da",
+    "lemonde_formation.txt": "fr",
+}
+
+repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+
+def uncached_index(text, language):
+    # the estimation before the hyphenators and syllable counts were cached
+    words = [w.lower() for w in split_words_from_text(text)]
+    number_of_syllables = 0
+    for word, freq in Counter(words).items():
+        dic = pyphen.Pyphen(lang=language.code)
+        number_of_syllables += (len(dic.positions(word)) + 1) * freq
+    number_of_sentences = len(nltk.sent_tokenize(text))
+    constants = FleschKincaidDifficultyEstimator.get_constants_for_language(language)
+    try:
+        return (
+            constants["start"]
+            - constants["sentence"] * (len(words) / number_of_sentences)
+            - constants["word"] * (number_of_syllables / len(words))
+        )
+    except ZeroDivisionError:
+        return 0
+
+
+texts_by_language = {}
+for file_name, code in TEXTS.items():
+    text = (TEST_DATA / file_name).read_text()
+    texts_by_language.setdefault(code, []).append(text)
+languages = {code: Language(code, code) for code in texts_by_language}
+
+total_texts = len(TEXTS) * repetitions
+print(f"{len(TEXTS)} texts x {repetitions} repetitions")
+
+start = time.time()
+uncached = {
+    code: [uncached_index(t, languages[code]) for t in texts * repetitions]
+    for code, texts in texts_by_language.items()
+}
+uncached_time = time.time() - start
+
+start = time.time()
+batched = {
+    code: FleschKincaidDifficultyEstimator.flesch_kincaid_readability_indices(
+        texts * repetitions, languages[code]
+    )
+    for code, texts in texts_by_language.items()
+}
+batched_time = time.time() - start
+
+print(f"uncached: {uncached_time:.2f}s ({total_texts / uncached_time:.1f} texts/s)")
+print(f"batched:  {batched_time:.2f}s ({total_texts / batched_time:.1f} texts/s)")
+print(f"speedup: {uncached_time / batched_time:.2f}x")
+print(
+    "identical results:",
+    all(
+        math.isclose(a, b)
+        for code in uncached
+        for a, b in zip(uncached[code], batched[code])
+    ),
+)
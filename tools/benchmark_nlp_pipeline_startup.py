@@ -0,0 +1,70 @@
+"""
+Measures the time and the memory it takes a fresh process to import
+zeeguu.core.nlp_pipeline (the spaCy models are loaded lazily), and to
+then load the models of the given languages, the way they used to be
+loaded at import time.
+
+Every measurement runs in its own interpreter, so that nothing is
+cached between them.
+
+Usage:
+    python -m tools.benchmark_nlp_pipeline_startup [languages, default: en,da,de]
+"""
+
+import json
+import subprocess
+import sys
+
+MEASURE = """
+import json, resource, sys, time
+start = time.time()
+import zeeguu.core.nlp_pipeline as nlp_pipeline
+imported = time.time()
+languages = [code for code in sys.argv[1].split(",") if code]
+if languages:
+    nlp_pipeline.preload_nlp_pipelines(languages)
+loaded = time.time()
+print(json.dumps({
+    "import_s": imported - start,
+    "load_s": loaded - imported,
+    # kilobytes on linux
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def measure(languages):
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE, ",".join(languages)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    languages = (sys.argv[1] if len(sys.argv) > 1 else "en,da,de").split(",")
+
+    lazy = measure([])
+    print(
+        f"import only (lazy):      {lazy['import_s']:.2f}s, "
+        f"{lazy['max_rss_mb']:.0f} MB"
+    )
+
+    for code in languages:
+        one = measure([code])
+        print(
+            f"import + '{code}' on first use: {one['import_s'] + one['load_s']:.2f}s, "
+            f"{one['max_rss_mb']:.0f} MB"
+        )
+
+    eager = measure(languages)
+    print(
+        f"import + {','.join(languages)} (eager): "
+        f"{eager['import_s'] + eager['load_s']:.2f}s, {eager['max_rss_mb']:.0f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares the time it takes to look for the paywall, junk and disturbing
+content patterns in crawled articles: one str.find per pattern (the way
+the filters used to do it), and the MultiPatternMatcher.
+
+The articles are the most recent ones in the DB with --from-db,
+otherwise the texts and html pages of the test data.
+
+Usage:
+    python -m tools.benchmark_pattern_matching [--from-db N] [--repeat 20]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from zeeguu.core.content_cleaning.content_cleaner import JUNK_PATTERNS_TO_REMOVE
+from zeeguu.core.content_quality.disturbing_content_detection import (
+    DISTURBING_KEYWORDS,
+)
+from zeeguu.core.content_quality.quality_filter import (
+    HTML_READ_MORE_PATTERNS,
+    PLAIN_TEXT_PAYWALL_PATTERNS,
+)
+from zeeguu.core.util.multi_pattern_matcher import MultiPatternMatcher
+
+TEST_DATA = Path(__file__).parent.parent / "zeeguu" / "core" / "test" / "test_data"
+
+
+def corpus_from_test_data():
+    return [
+        path.read_text(encoding="utf-8")
+        for pattern in ["*.txt", "*.html"]
+        for path in sorted(TEST_DATA.glob(pattern))
+    ]
+
+
+def corpus_from_db(count):
+    from zeeguu.api.app import create_app
+    from zeeguu.core.model import Article
+
+    app = create_app()
+    app.app_context().push()
+    articles = Article.query.order_by(Article.id.desc()).limit(count).all()
+    return [article.get_content() for article in articles]
+
+
+def found_by_find(patterns, text):
+    return [i for i, pattern in enumerate(patterns) if text.find(pattern) >= 0]
+
+
+def measure(name, search, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            search(text)
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<12} {elapsed * 1000 / repeat:8.2f} ms per pass")
+
+
+def compare(title, patterns, texts, repeat):
+    print(f"{title}: {len(patterns)} patterns")
+    measure("str.find", lambda text: found_by_find(patterns, text), texts, repeat)
+    matcher = MultiPatternMatcher(patterns)
+    assert matcher.found(texts[0]) == found_by_find(patterns, texts[0])
+    measure("matcher", matcher.found, texts, repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--from-db", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    texts = corpus_from_db(args.from_db) if args.from_db else corpus_from_test_data()
+    print(f"{len(texts)} texts, {sum(map(len, texts)) / 1000:.0f}K characters")
+
+    compare("paywall patterns", PLAIN_TEXT_PAYWALL_PATTERNS, texts, args.repeat)
+    compare("read more (html)", HTML_READ_MORE_PATTERNS, texts, args.repeat)
+    compare("junk patterns", JUNK_PATTERNS_TO_REMOVE, texts, args.repeat)
+    lowercased = [text.lower() for text in texts]
+    for language, keywords in sorted(DISTURBING_KEYWORDS.items()):
+        keywords = [keyword.lower() for keyword in keywords]
+        compare(f"disturbing keywords ({language})", keywords, lowercased, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
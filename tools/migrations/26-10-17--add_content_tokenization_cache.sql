@@ -0,0 +1,6 @@
+-- Cache the full content tokenization (paragraphs, fragments, title) of articles;
+-- the cached tokens are only valid for the given content hash and tokenizer version
+ALTER TABLE article_tokenization_cache
+    ADD COLUMN tokenized_content MEDIUMTEXT DEFAULT NULL COMMENT 'JSON-encoded tokenized paragraphs, fragments and title',
+    ADD COLUMN content_hash CHAR(64) DEFAULT NULL COMMENT 'sha256 of the title, content and fragments that were tokenized',
+    ADD COLUMN tokenizer_version VARCHAR(64) DEFAULT NULL COMMENT 'tokenizer model and library version used';
@@ -0,0 +1,19 @@
+-- Per user, day and language totals of the activity, kept up to date
+-- incrementally by the model listeners; existing activity is filled in by
+-- tools/backfill_user_activity_daily_rollup.py
+CREATE TABLE user_activity_daily_rollup (
+    `id` INT NOT NULL AUTO_INCREMENT,
+    `user_id` INT NOT NULL,
+    `date` DATE NOT NULL,
+    `language_id` INT NOT NULL,
+    `reading_ms` BIGINT NOT NULL DEFAULT 0,
+    `exercise_ms` BIGINT NOT NULL DEFAULT 0,
+    `exercises` INT NOT NULL DEFAULT 0,
+    `correct_first_try` INT NOT NULL DEFAULT 0,
+    `translations` INT NOT NULL DEFAULT 0,
+    `learned_words` INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (`id`),
+    UNIQUE KEY `user_activity_daily_rollup_user_date_language` (`user_id`, `date`, `language_id`),
+    CONSTRAINT `user_activity_daily_rollup_ibfk_1` FOREIGN KEY (`user_id`) REFERENCES `user` (`id`),
+    CONSTRAINT `user_activity_daily_rollup_ibfk_2` FOREIGN KEY (`language_id`) REFERENCES `language` (`id`)
+) COLLATE utf8_bin;
@@ -1,163 +1,117 @@
 # coding=utf-8
-from zeeguu.core.elastic.indexing import (
-    create_or_update_doc_for_bulk,
-)
-from elasticsearch import Elasticsearch
-from elasticsearch.helpers import bulk, scan
-import zeeguu.core
-from zeeguu.core.model import Article
+"""
+Indexes the articles of the DB in Elasticsearch, batch by batch
+(see zeeguu.core.elastic.bulk_indexing).
+
+First we should only index with topics so we can do inference based on
+the articles that have topics.
+
+Usage:
+    python -m tools.mysql_to_elastic_for_articles [--delete-index]
+        [--without-topics] [--update-existing] [--limit N] [--batch-size N]
+        [--bulk-threads N] [--checkpoint FILE]
+
+    --delete-index      re-index from scratch
+    --without-topics    index the articles without a topic, instead of
+                        (only) the ones with a non-inferred topic
+    --update-existing   also update the articles that are already in ES
+                        (their embeddings are only recomputed if their
+                        content changed); by default they are skipped
+    --limit             stop after (about) that many articles
+    --checkpoint        save the progress in the file after every batch, and
+                        resume from it when it exists
+"""
+
+import argparse
+import os
 from datetime import datetime
-from sqlalchemy.orm.exc import NoResultFound
+
+import zeeguu.core
 from zeeguu.api.app import create_app
-from zeeguu.core.model import ArticleTopicMap
+from zeeguu.core.elastic.bulk_indexing import (
+    REINDEX_BATCH_SIZE,
+    REINDEX_BULK_THREADS,
+    reindex_articles,
+)
+from zeeguu.core.elastic.client import get_es_client
 from zeeguu.core.elastic.settings import ES_ZINDEX, ES_CONN_STRING
+from zeeguu.core.model import Article, ArticleTopicMap
 from zeeguu.core.model.article_topic_map import TopicOriginType
-import numpy as np
-from tqdm import tqdm
-import time
 
 app = create_app()
 app.app_context().push()
-# First we should only index with topics so we can do
-# inference based on the articles that have topics.
-
-# These parameters can be changed based on need.
-#   DELETE_INDEX - used to re-index from scratch. Default: False
-#   INDEX_WITH_TOPIC_ONLY - determines which articles are indexed. If set to True,
-# only the articles which have a topic assigned to them are index. If false, then
-# only the articles without the topic will be added. Default: True
-#   TOTAL_ITEMS - total items to be indexed, the IDs are sampled and this is used to
-# have a variety of different articles in ES. Default: 5000
-# NOTE: If you want to index all the articles, you shoud pass a number that's higher
-# or equal to the number of articles in the DB
-#   ITERATION_STEP - number of articles to index before reporting. Default: 1000
-DELETE_INDEX = False
-INDEX_WITH_TOPIC = True
-TOTAL_ITEMS = 1000
-ITERATION_STEP = 100
-
-print(ES_CONN_STRING)
-es = Elasticsearch(ES_CONN_STRING)
+
 db_session = zeeguu.core.model.db.session
-print(es.info())
 
 
-def fetch_articles_by_id(id_list):
-    for i in id_list:
-        try:
-            if es.exists(index=ES_ZINDEX, id=i):
-                print(f"Skipped for: '{i}', article already in ES.")
-                continue
-            article = Article.find_by_id(i)
-            if not article:
-                print(f"Skipped for: '{i}', article not in DB.")
-                continue
-            yield article
-        except NoResultFound:
-            print(f"fail for: '{i}'")
-        except Exception as e:
-            print(f"fail for: '{i}', {e}")
+def articles_to_index(with_topic):
+    query = Article.query
+    if with_topic:
+        query = query.filter(
+            Article.topics.any(
+                ArticleTopicMap.origin_type != TopicOriginType.INFERRED
+            )  # Do not index Inferred topics
+        )
+        # Filter out documents that are broken
+        query = query.filter(Article.broken != 1)
+        # query = query.filter(Article.language_id == 2)  # If only one language
+    else:
+        # Note: these two are exclusive;
+        # If you ever want to reindex everything, you'll have to modify this
+        query = query.filter(~Article.topics.any())
+    return query
 
 
-def gen_docs(articles_w_topics):
-    for article in articles_w_topics:
-        try:
-            yield create_or_update_doc_for_bulk(article, db_session)
-        except Exception as e:
-            print(f"fail for: '{article.id}', {e}")
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--delete-index", action="store_true")
+    parser.add_argument("--without-topics", action="store_true")
+    parser.add_argument("--update-existing", action="store_true")
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=REINDEX_BATCH_SIZE)
+    parser.add_argument("--bulk-threads", type=int, default=REINDEX_BULK_THREADS)
+    parser.add_argument("--checkpoint", default=None)
+    args = parser.parse_args()
 
+    print(ES_CONN_STRING)
+    es = get_es_client()
+    print(es.info())
 
-def main():
-    if DELETE_INDEX:
+    if args.delete_index:
         try:
             es.options(ignore_status=[400, 404], request_timeout=120).indices.delete(
                 index=ES_ZINDEX
             )
-            print("Deleted index 'zeeguu'!")
+            print(f"Deleted index '{ES_ZINDEX}'!")
         except Exception as e:
             print(f"Failed to delete: {e}")
+        if args.checkpoint and os.path.exists(args.checkpoint):
+            # the progress of the deleted index does not count anymore
+            os.remove(args.checkpoint)
 
-    # Sample Articles that have topics assigned and are not inferred
-    if INDEX_WITH_TOPIC:
-        target_ids = np.array(
-            [
-                a_id[0]
-                for a_id in db_session.query(Article.id)
-                .join(ArticleTopicMap)
-                .filter(
-                    ArticleTopicMap.origin_type != TopicOriginType.INFERRED
-                )  # Do not index Inferred topics
-                .filter(Article.broken != 1)  # Filter out documents that are broken
-                # .filter(Article.language_id == 2)  # If only one language
-                .distinct()
-            ]
-        )
-        print("Got articles with topics, total: ", len(target_ids))
-    else:
-        # index w/o topic
-        # Note: these two are exclusive;
-        # If you ever want to reindex everything, you'll have to modify this
-        articles_with_topic = set(
-            [
-                art_id_w_topic[0]
-                for art_id_w_topic in db_session.query(
-                    ArticleTopicMap.article_id
-                ).distinct()
-            ]
-        )
-        target_ids = np.array(
-            list(
-                set([a_id[0] for a_id in db_session.query(Article.id)])
-                - articles_with_topic
-            )
-        )
-        print("Got articles without topics, total: ", len(target_ids))
-
-    total_articles_in_es = 0
-    if len(target_ids) == 0:
-        print("No articles found! Exiting...")
-        return
-    if es.indices.exists(index=ES_ZINDEX):
-        es_query = {"query": {"match_all": {}}}
-        scan_results = scan(es, index=ES_ZINDEX, query=es_query)
-        ids_in_es = set(
-            [
-                int(hit["_source"]["article_id"])
-                for hit in scan_results
-                if "article_id" in hit["_source"]
-            ]
-        )
-        total_articles_in_es = len(ids_in_es)
-        target_ids_not_in_es = list(filter(lambda x: x not in ids_in_es, target_ids))
-    else:
-        # The index was deleted / doesn't exist:
-        target_ids_not_in_es = target_ids
-
-    print(f"""Total articles in ES: {total_articles_in_es}""")
-    print(f"""Total articles missing: {len(target_ids_not_in_es)}""")
-    print(f"""Indexing a total of: {TOTAL_ITEMS}, in batches of: {ITERATION_STEP}""")
-
-    # I noticed that if a document is not added then it won't let me query the ES search.
-    total_added = 0
-    errors_encountered = []
-    final_count_of_articles = min(TOTAL_ITEMS, len(target_ids_not_in_es))
-    sampled_ids = np.random.choice(
-        target_ids_not_in_es, final_count_of_articles, replace=False
+    progress = reindex_articles(
+        articles_to_index(with_topic=not args.without_topics),
+        db_session,
+        batch_size=args.batch_size,
+        bulk_threads=args.bulk_threads,
+        update_existing=args.update_existing,
+        limit=args.limit,
+        checkpoint_path=args.checkpoint,
     )
-    for i_start in tqdm(range(0, final_count_of_articles, ITERATION_STEP)):
-        sub_sample = sampled_ids[i_start : i_start + ITERATION_STEP]
-        res_bulk, error_bulk = bulk(
-            es, gen_docs(fetch_articles_by_id(sub_sample)), raise_on_error=False
-        )
-        total_added += res_bulk
-        errors_encountered += error_bulk
-        total_bulk_errors = len(error_bulk)
-        if total_bulk_errors > 0:
-            print(f"## Warning, {total_bulk_errors} failed to index. With errors: ")
-            print(error_bulk)
-        print(f"Batch finished. ADDED:{res_bulk} | ERRORS: {total_bulk_errors}")
-    print(errors_encountered)
-    print(f"Total articles added: {total_added}")
+
+    if progress.error_samples:
+        print("Some of the errors:")
+        for error in progress.error_samples:
+            print(error)
+    print(
+        f"Total: {progress.articles} articles, {progress.indexed} indexed, "
+        f"{progress.skipped_existing} already in ES, {progress.errors} errors"
+    )
+    print(
+        f"Embeddings: {progress.embeddings_computed} computed, "
+        f"{progress.embeddings_reused} reused"
+    )
+    print(f"Throughput: {progress.articles_per_second():.1f} articles/s")
 
 
 if __name__ == "__main__":
@@ -5,6 +5,9 @@ from zeeguu.core.language.difficulty_estimator_factory import DifficultyEstimato
 
 VERBOSE = False
 CHECKPOINT_STEP = 10000
+# the articles of a language are estimated in batches of this size,
+# so that the syllables of a word are counted once per batch
+BATCH_SIZE = 500
 
 app = create_app()
 app.app_context().push()
@@ -12,25 +15,35 @@ app.app_context().push()
 print("starting...")
 
 session = zeeguu.core.model.db.session
-articles_to_update = Article.query.filter(
-    Article.language.has(Language.code.in_(["es", "fr", "it", "nl", "ru"]))
-).all()
-for i, article in enumerate(articles_to_update):
-    if VERBOSE:
-        print(f"Article language: {article.language}")
-        print(f"Difficulty before: {article.fk_difficulty} for {article.title}")
-    fk_estimator = DifficultyEstimatorFactory.get_difficulty_estimator("fk")
-    fk_difficulty = fk_estimator.estimate_difficulty(
-        article.get_content(), article.language, None
-    )["grade"]
-
-    article.fk_difficulty = fk_difficulty
-    if VERBOSE:
-        print(f"Difficulty after: {article.fk_difficulty} for {article.title}\n")
-
-    session.add(article)
-    if (i + 1) % CHECKPOINT_STEP == 0:
-        print("Checkpointing changes, commiting...")
-        session.commit()
-        print(f"Checkpoint done, completed ({i+1}/{len(articles_to_update)}).")
+fk_estimator = DifficultyEstimatorFactory.get_difficulty_estimator("fk")
+
+updated = 0
+for language_code in ["es", "fr", "it", "nl", "ru"]:
+    language = Language.find(language_code)
+    articles_to_update = Article.query.filter(Article.language_id == language.id).all()
+    print(f"{len(articles_to_update)} articles in {language.name}")
+
+    for start in range(0, len(articles_to_update), BATCH_SIZE):
+        batch = articles_to_update[start : start + BATCH_SIZE]
+        difficulties = fk_estimator.estimate_difficulties(
+            [article.get_content() for article in batch], language
+        )
+
+        for article, difficulty in zip(batch, difficulties):
+            if VERBOSE:
+                print(f"Article language: {article.language}")
+                print(f"Difficulty before: {article.fk_difficulty} for {article.title}")
+
+            article.fk_difficulty = difficulty["grade"]
+            if VERBOSE:
+                print(
+                    f"Difficulty after: {article.fk_difficulty} for {article.title}\n"
+                )
+
+            session.add(article)
+            updated += 1
+            if updated % CHECKPOINT_STEP == 0:
+                print("Checkpointing changes, commiting...")
+                session.commit()
+                print(f"Checkpoint done, completed {updated} articles.")
 session.commit()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""
+Fills the translation cache with the (word, context) pairs that were
+translated most often, per language pair, as recorded by the bookmarks.
+
+Only the pairs that are not in the cache yet are sent to the translators,
+so the script can be run again (e.g. after the cache entries expire).
+The cache must be persistent (ZEEGUU_TRANSLATION_CACHE_DB or
+ZEEGUU_DATA_FOLDER set) for the API workers to see the results.
+
+Usage:
+    source ~/.venvs/z_env/bin/activate && python -m tools.warm_up_translation_cache [--languages da-en,de-en] [--top N] [--microsoft]
+"""
+
+import argparse
+
+from sqlalchemy import func
+from sqlalchemy.orm import aliased
+
+from zeeguu.api.app import create_app
+from zeeguu.core.model import db, Bookmark, Language, Meaning, Phrase, UserWord
+from zeeguu.core.model.bookmark_context import BookmarkContext
+from zeeguu.core.model.new_text import NewText
+
+app = create_app()
+app.app_context().push()
+
+from zeeguu.api.utils.translation_cache import TRANSLATION_CACHE_DB
+from zeeguu.api.utils.translator import (
+    google_contextual_translate,
+    microsoft_contextual_translate,
+)
+
+db_session = db.session
+
+Origin = aliased(Phrase)
+Translation = aliased(Phrase)
+OriginLanguage = aliased(Language)
+TranslationLanguage = aliased(Language)
+
+
+def language_pairs():
+    return (
+        db_session.query(OriginLanguage.code, TranslationLanguage.code)
+        .select_from(Meaning)
+        .join(Origin, Meaning.origin_id == Origin.id)
+        .join(Translation, Meaning.translation_id == Translation.id)
+        .join(OriginLanguage, Origin.language_id == OriginLanguage.id)
+        .join(TranslationLanguage, Translation.language_id == TranslationLanguage.id)
+        .distinct()
+        .all()
+    )
+
+
+def most_translated(from_lang_code, to_lang_code, top):
+    """
+    :return: the top (word, context, bookmark count) of the language pair
+    """
+    return (
+        db_session.query(Origin.content, NewText.content, func.count(Bookmark.id))
+        .select_from(Bookmark)
+        .join(UserWord, Bookmark.user_word_id == UserWord.id)
+        .join(Meaning, UserWord.meaning_id == Meaning.id)
+        .join(Origin, Meaning.origin_id == Origin.id)
+        .join(Translation, Meaning.translation_id == Translation.id)
+        .join(OriginLanguage, Origin.language_id == OriginLanguage.id)
+        .join(TranslationLanguage, Translation.language_id == TranslationLanguage.id)
+        .join(BookmarkContext, Bookmark.context_id == BookmarkContext.id)
+        .join(NewText, BookmarkContext.text_id == NewText.id)
+        .filter(OriginLanguage.code == from_lang_code)
+        .filter(TranslationLanguage.code == to_lang_code)
+        .group_by(Origin.content, NewText.content)
+        .order_by(func.count(Bookmark.id).desc())
+        .limit(top)
+        .all()
+    )
+
+
+def warm_up(translate, from_lang_code, to_lang_code, top):
+    from python_translators.translation_query import TranslationQuery
+
+    cached = translated = failed = 0
+    for word, context, _ in most_translated(from_lang_code, to_lang_code, top):
+        data = {
+            "source_language": from_lang_code,
+            "target_language": to_lang_code,
+            "word": word,
+            "context": context,
+        }
+        cache_key = tuple(data.get(key) for key in translate.cache_keys)
+        if translate.cache.get(cache_key) is not None:
+            cached += 1
+            continue
+
+        data["query"] = TranslationQuery.for_word_occurrence(word, context, 1, 7)
+        try:
+            if translate(data):
+                translated += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"  failed to translate '{word}': {e}")
+            failed += 1
+
+    return cached, translated, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--languages",
+        help="comma separated language pairs, e.g. da-en,de-en; "
+        "by default all the pairs of the existing meanings",
+    )
+    parser.add_argument("--top", type=int, default=1000)
+    parser.add_argument(
+        "--microsoft",
+        action="store_true",
+        help="also warm up the cache of the Microsoft translator",
+    )
+    args = parser.parse_args()
+
+    if not TRANSLATION_CACHE_DB:
+        print(
+            "-- the translation cache is not persistent; the API won't see the results"
+        )
+
+    if args.languages:
+        pairs = [tuple(pair.split("-")) for pair in args.languages.split(",")]
+    else:
+        pairs = language_pairs()
+
+    translators = [google_contextual_translate]
+    if args.microsoft:
+        translators.append(microsoft_contextual_translate)
+
+    for from_lang_code, to_lang_code in pairs:
+        if from_lang_code == to_lang_code:
+            continue
+        for translate in translators:
+            cached, translated, failed = warm_up(
+                translate, from_lang_code, to_lang_code, args.top
+            )
+            print(
+                f"{from_lang_code}-{to_lang_code} ({translate.__name__}): "
+                f"{cached} already cached, {translated} translated, {failed} failed"
+            )
+
+    print(google_contextual_translate.cache_info())
+    print("done")
+
+
+if __name__ == "__main__":
+    main()
@@ -237,4 +237,14 @@ def create_app(testing=False):
         else:
             warning("*** Stanza tokenizers will use lazy loading (PRELOAD_STANZA=False)")
 
+    # The spaCy models are loaded on first use, unless listed in
+    # ZEEGUU_SPACY_PRELOAD_LANGUAGES
+    from zeeguu.core.nlp_pipeline import SPACY_PRELOAD_LANGUAGES, preload_nlp_pipelines
+
+    if SPACY_PRELOAD_LANGUAGES and not testing:
+        start_time = time.time()
+        preload_nlp_pipelines()
+        elapsed = time.time() - start_time
+        warning(f"*** spaCy models preloaded for {SPACY_PRELOAD_LANGUAGES} in {elapsed:.2f}s")
+
     return app
@@ -63,8 +63,7 @@ def get_user_words_recommended_for_practice():
 def get_count_of_user_words_recommended_for_practice():
 
     user = User.find_by_id(flask.g.user_id)
-    to_study = BasicSRSchedule.user_words_to_study(user)
-    return json_result(len(to_study))
+    return json_result(BasicSRSchedule.count_of_user_words_to_study(user))
 
 
 @api.route(
@@ -0,0 +1,108 @@
+from . import api
+from zeeguu.api.utils import cross_domain, only_admins, requires_session
+from zeeguu.api.utils.json_result import json_result
+
+
+@api.route("/monitoring/elasticsearch", methods=["GET"])
+@cross_domain
+@requires_session
+@only_admins
+def elasticsearch_client_stats():
+    """
+    :return: request counters, pool waits and the latency histogram
+    of the Elasticsearch client of the worker that serves the request.
+    """
+    from zeeguu.core.elastic.client import es_client_stats
+
+    return json_result(es_client_stats())
+
+
+@api.route("/monitoring/tokenization_pool", methods=["GET"])
+@cross_domain
+@requires_session
+@only_admins
+def tokenization_pool_stats():
+    """
+    :return: queue depth, fallbacks and service time of the
+    tokenization pool of the worker that serves the request.
+    """
+    from zeeguu.core.tokenization.tokenization_pool import (
+        tokenization_pool_stats as pool_stats,
+    )
+
+    return json_result(pool_stats())
+
+
+@api.route("/monitoring/background_jobs", methods=["GET"])
+@cross_domain
+@requires_session
+@only_admins
+def background_jobs_stats():
+    """
+    :return: queue depth, rejected and failed jobs of the background
+    job queues of the worker that serves the request.
+    """
+    from zeeguu.core.background_jobs import background_jobs_stats as queue_stats
+
+    return json_result(queue_stats())
+
+
+@api.route("/monitoring/nlp_pipelines", methods=["GET"])
+@cross_domain
+@requires_session
+@only_admins
+def nlp_pipelines_stats():
+    """
+    :return: the languages whose spaCy models are loaded in the worker
+    that serves the request.
+    """
+    from zeeguu.core.nlp_pipeline import loaded_nlp_pipelines
+
+    return json_result(loaded_nlp_pipelines())
+
+
+@api.route("/monitoring/translation_cache", methods=["GET"])
+@cross_domain
+@requires_session
+@only_admins
+def translation_cache_stats():
+    """
+    :return: size, hits, misses and evictions of the translation
+    caches of the worker that serves the request.
+    """
+    from zeeguu.api.utils.translation_cache import (
+        translation_cache_stats as cache_stats,
+    )
+
+    return json_result(cache_stats())
+
+
+@api.route("/monitoring/translation_providers", methods=["GET"])
+@cross_domain
+@requires_session
+@only_admins
+def translation_providers_stats():
+    """
+    :return: p50/p95 latencies and failures of the translation
+    providers, and the hedged and timed out translations, of the
+    worker that serves the request.
+    """
+    from zeeguu.api.utils.translation_dispatcher import translation_provider_stats
+
+    return json_result(translation_provider_stats())
+
+
+@api.route("/monitoring/embedding_store", methods=["GET"])
+@cross_domain
+@requires_session
+@only_admins
+def embedding_store_stats():
+    """
+    :return: size, hits and misses of the embedding store of the
+    worker that serves the request.
+    """
+    from zeeguu.core.semantic_vector_api.embedding_store import (
+        embedding_store_stats as store_stats,
+    )
+
+    return json_result(store_stats())
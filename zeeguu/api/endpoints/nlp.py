@@ -5,7 +5,7 @@ from zeeguu.api.utils.json_result import json_result
 from flask import request
 
 from zeeguu.core.nlp_pipeline import SpacyWrappers, NoiseWordsGenerator
-from zeeguu.core.nlp_pipeline import AutoGECTagging, ContextReducer
+from zeeguu.core.nlp_pipeline import AutoGECTagger, ContextReducer
 from zeeguu.core.model.language import Language
 from zeeguu.core.tokenization import get_tokenizer, TOKENIZER_MODEL
 
@@ -57,7 +57,7 @@ def annotate_clues():
     if language not in SpacyWrappers.keys():
         return "Language not supported"
 
-    updated_words = AutoGECTagging(SpacyWrappers[language], language).anottate_clues(
+    updated_words = AutoGECTagger[language].anottate_clues(
         word_with_props, original_sentence
     )
 
@@ -80,7 +80,7 @@ def get_shorter_similar_sents_in_article():
     nlp_pipe = SpacyWrappers[language]
 
     result_json = ContextReducer.get_similar_sentences(
-        nlp_pipe, article_text, bookmark_context
+        nlp_pipe, sentence=bookmark_context, article=article_text
     )
 
     return json_result(result_json)
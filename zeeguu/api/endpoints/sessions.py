@@ -5,6 +5,7 @@ from zeeguu.core.model import Session, User
 from zeeguu.api.utils.abort_handling import make_error
 
 from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
+from zeeguu.api.utils.session_cache import session_cache
 from . import api, db_session
 
 DAYS_BEFORE_EXPIRE = 30  # Days
@@ -18,6 +19,7 @@ def force_user_to_relog(session_object, reason: str = ""):
     print(
         f"Session for user '{session_object.user_id}' was terminated. Reason: '{reason}'"
     )
+    session_cache.invalidate(session_object.uuid)
     db_session.delete(session_object)
     db_session.commit()
 
@@ -146,6 +148,7 @@ def logout():
 
     try:
         session_uuid = request.args["session"]
+        session_cache.invalidate(session_uuid)
         session = Session.find(session_uuid)
         db_session.delete(session)
         db_session.commit()
@@ -6,11 +6,16 @@ from zeeguu.core.model import Cohort, User, Language
 from zeeguu.core.sql.teacher.teachers_for_cohort import teachers_for_cohort
 from zeeguu.core.user_statistics.exercise_corectness import (
     exercise_count_and_correctness_percentage,
+    exercise_count_and_correctness_percentage_for_cohort,
 )
 from zeeguu.core.user_statistics.exercise_sessions import (
     total_time_in_exercise_sessions,
+    total_time_in_exercise_sessions_for_cohort,
+)
+from zeeguu.core.user_statistics.reading_sessions import (
+    summarize_reading_activity,
+    summarize_reading_activity_for_cohort,
 )
-from zeeguu.core.user_statistics.reading_sessions import summarize_reading_activity
 
 
 def student_info_for_teacher_dashboard(user, cohort, from_date: str, to_date: str):
@@ -36,10 +41,23 @@ def all_user_info_from_cohort(id, from_date: str, to_date: str):
 
     c = Cohort.query.filter_by(id=id).one()
     users = User.query.join(UserCohortMap).filter_by(cohort_id=c.id).all()
-    users_info = []
+    user_ids = [u.id for u in users]
+
+    # the statistics of all the students, a query per kind of statistic
+    reading = summarize_reading_activity_for_cohort(user_ids, c.id, from_date, to_date)
+    exercise_time = total_time_in_exercise_sessions_for_cohort(
+        user_ids, c.id, from_date, to_date
+    )
+    exercises = exercise_count_and_correctness_percentage_for_cohort(
+        user_ids, c.id, from_date, to_date
+    )
 
+    users_info = []
     for u in users:
-        info = student_info_for_teacher_dashboard(u, c, from_date, to_date)
+        info = {"id": u.id, "name": u.name, "email": u.email}
+        info.update(reading[u.id])
+        info.update(exercise_time[u.id])
+        info.update(exercises[u.id])
 
         users_info.append(info)
     return users_info
@@ -6,14 +6,15 @@ import flask
 from flask import request
 from python_translators.translation_query import TranslationQuery
 
+from zeeguu.api.utils.abort_handling import make_error
 from zeeguu.api.utils.json_result import json_result
 from zeeguu.api.utils.parse_json_boolean import parse_json_boolean
 from zeeguu.api.utils.route_wrappers import cross_domain, requires_session
 from zeeguu.api.utils.translator import (
     get_next_results,
     contribute_trans,
-    google_contextual_translate,
-    microsoft_contextual_translate,
+    contextual_translate,
+    all_contextual_translations,
 )
 from zeeguu.core.crowd_translations import (
     get_own_past_translation,
@@ -122,13 +123,17 @@ def get_one_translation(from_lang_code, to_lang_code):
                 "context": context,
             }
             # The API Mux is misbehaving and will only serve the non-contextual translators after a while
-            # For now hardcoding google on the first place and msft as a backup
+            # For now hardcoding google on the first place and msft as a backup, which is
+            # also asked when google is slow
 
-            t1 = google_contextual_translate(data)
-            if not t1:
-                t1 = microsoft_contextual_translate(data)
+            t1 = contextual_translate(data)
 
             elapsed = time.time() - start_time
+            if not t1:
+                log(
+                    f"[TRANSLATION-TIMING] No translation after {elapsed:.3f}s for word='{word_str}'"
+                )
+                return make_error(504, "Translation not available")
             log(
                 f"[TRANSLATION-TIMING] Translation API call completed in {elapsed:.3f}s, result='{t1.get('translation', 'N/A')}'"
             )
@@ -218,8 +223,7 @@ def get_multiple_translations(from_lang_code, to_lang_code):
         "query": query,
         "context": context,
     }
-    t1 = google_contextual_translate(data)
-    t2 = microsoft_contextual_translate(data)
+    t1, t2 = all_contextual_translations(data)
 
     return json_result(dict(translations=[t1, t2]))
 
@@ -121,12 +121,9 @@ def saved_articles(page: int = None):
     else:
         saves = PersonalCopy.all_for(user)
 
-    article_infos = [
-        UserArticle.user_article_info(
-            user, UserArticle.select_appropriate_article_for_user(user, e)
-        )
-        for e in saves
-    ]
+    article_infos = UserArticle.user_article_info_many(
+        user, UserArticle.select_appropriate_articles_for_user(user, saves)
+    )
 
     return json_result(article_infos)
 
@@ -137,12 +134,9 @@ def saved_articles():
     user = User.find_by_id(flask.g.user_id)
     saves = PersonalCopy.all_for(user)
 
-    article_infos = [
-        UserArticle.user_article_info(
-            user, UserArticle.select_appropriate_article_for_user(user, e)
-        )
-        for e in saves
-    ]
+    article_infos = UserArticle.user_article_info_many(
+        user, UserArticle.select_appropriate_articles_for_user(user, saves)
+    )
 
     return json_result(article_infos)
 
@@ -179,12 +173,9 @@ def user_articles_topic_filtered():
     # Filter out hidden articles
     filtered_articles = UserArticle.filter_hidden_articles(user, articles)
 
-    article_infos = [
-        UserArticle.user_article_info(
-            user, UserArticle.select_appropriate_article_for_user(user, a)
-        )
-        for a in filtered_articles
-    ]
+    article_infos = UserArticle.user_article_info_many(
+        user, UserArticle.select_appropriate_articles_for_user(user, filtered_articles)
+    )
 
     return json_result(article_infos)
 
@@ -235,11 +226,8 @@ def user_articles_foryou():
     # Filter out hidden articles
     filtered_articles = UserArticle.filter_hidden_articles(user, articles)
 
-    article_infos = [
-        UserArticle.user_article_info(
-            user, UserArticle.select_appropriate_article_for_user(user, a)
-        )
-        for a in filtered_articles
-    ]
+    article_infos = UserArticle.user_article_info_many(
+        user, UserArticle.select_appropriate_articles_for_user(user, filtered_articles)
+    )
 
     return json_result(article_infos)
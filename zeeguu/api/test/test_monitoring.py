@@ -0,0 +1,15 @@
+from fixtures import logged_in_client as client
+
+
+def test_monitoring_requires_a_session(client):
+    response = client.client.get("/monitoring/translation_cache")
+    assert response.status_code == 401
+
+
+def test_monitoring_is_only_for_admins(client):
+    response = client.client.get(client.append_session("/monitoring/translation_cache"))
+    assert response.status_code == 401
+
+    client.client.application.config["ADMIN_EMAILS"] = [client.email]
+    response = client.client.get(client.append_session("/monitoring/translation_cache"))
+    assert response.status_code == 200
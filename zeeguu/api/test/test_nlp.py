@@ -0,0 +1,24 @@
+from unittest.mock import patch
+
+from fixtures import logged_in_client as client
+
+from zeeguu.core.test.stub_nlp_pipeline import animal_pipeline
+
+
+def test_shorter_similar_sents_come_from_the_article(client):
+    with patch("zeeguu.api.endpoints.nlp.SpacyWrappers", {"en": animal_pipeline()}):
+        result = client.post(
+            "/get_shorter_similar_sents_in_article",
+            data=dict(
+                article_text="Cars honk. Dogs bark. Cats sleep.",
+                bookmark_context="Cats purr.",
+                language="en",
+            ),
+        )
+
+    assert result["top_1_sent"] == "Cats sleep."
+    assert [text for _, text in result["top_10_sents_w_sim"]] == [
+        "Cats sleep.",
+        "Dogs bark.",
+        "Cars honk.",
+    ]
@@ -0,0 +1,69 @@
+import sys
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from zeeguu.api.utils.session_cache import LocalSessionCache, RedisSessionCache
+
+
+class LocalSessionCacheTest(TestCase):
+    def test_least_recently_used_is_evicted(self):
+        cache = LocalSessionCache(max_size=2, ttl=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_expired_entries_are_dropped(self):
+        cache = LocalSessionCache(max_size=10, ttl=60)
+        with patch("zeeguu.api.utils.session_cache.time.time", return_value=1000):
+            cache.put("a", 1)
+        with patch("zeeguu.api.utils.session_cache.time.time", return_value=1061):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate(self):
+        cache = LocalSessionCache()
+        cache.put("a", 1)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+
+
+class _RedisError(Exception):
+    pass
+
+
+class _UnreachableRedis:
+    def get(self, key):
+        raise _RedisError("connection refused")
+
+    def setex(self, key, ttl, value):
+        raise _RedisError("connection refused")
+
+    def delete(self, key):
+        raise _RedisError("connection refused")
+
+
+# stands in for the redis package, which is optional
+_failing_redis = SimpleNamespace(
+    RedisError=_RedisError,
+    Redis=SimpleNamespace(from_url=lambda url: _UnreachableRedis()),
+)
+
+
+class RedisSessionCacheTest(TestCase):
+    def setUp(self):
+        with patch.dict(sys.modules, {"redis": _failing_redis}):
+            self.cache = RedisSessionCache("redis://localhost")
+
+    def test_unreachable_redis_is_a_cache_miss(self):
+        assert self.cache.get("a") is None
+
+    def test_unreachable_redis_does_not_fail_the_writes(self):
+        self.cache.put("a", 1)
+        self.cache.invalidate("a")
@@ -1,4 +1,4 @@
-from fixtures import logged_in_teacher as client
+from fixtures import add_source_types, logged_in_teacher as client
 
 
 def test_is_teacher(client):
@@ -30,6 +30,109 @@ def test_add_student(client):
     assert users[0]["email"] == STUDENT_DATA["email"]
 
 
+def test_users_from_cohort_include_statistics(client):
+    client.post("/create_own_cohort", data=FRENCH_B1_COHORT)
+
+    STUDENT_DATA["invite_code"] = FRENCH_B1_COHORT["inv_code"]
+    client.post(f'/add_user/{STUDENT_DATA["email"]}', data=STUDENT_DATA)
+
+    users = client.get("/users_from_cohort/1/14")
+    assert users[0]["number_of_texts"] == 0
+    assert users[0]["reading_time"] == 0
+    assert users[0]["exercise_time_in_sec"] == 0
+    assert users[0]["number_of_exercises"] == 0
+
+
+def test_users_from_cohort_statistics_are_per_student(client):
+    from zeeguu.core.model import User
+
+    add_source_types()
+    client.post("/create_own_cohort", data=FRENCH_B1_COHORT)
+    student_ids = []
+    for email, reading_minutes, outcomes in [
+        ("student1@gmail.com", 10, ["C", "Wrong", "C"]),
+        ("student2@gmail.com", 25, ["Wrong"]),
+    ]:
+        client.post(
+            f"/add_user/{email}",
+            data=dict(
+                STUDENT_DATA, email=email, invite_code=FRENCH_B1_COHORT["inv_code"]
+            ),
+        )
+        student = User.find(email)
+        _add_activity(student, "fr", reading_minutes, outcomes)
+        student_ids.append(student.id)
+
+    users = {each["id"]: each for each in client.get("/users_from_cohort/1/14")}
+
+    for student_id in student_ids:
+        individually = client.post(
+            "/user_info",
+            data={"student_id": student_id, "cohort_id": 1, "number_of_days": 14},
+        )
+        for key in [
+            "number_of_texts",
+            "reading_time",
+            "average_text_length",
+            "exercise_time_in_sec",
+            "number_of_exercises",
+            "correct_on_1st_try",
+        ]:
+            assert users[student_id][key] == individually[key], key
+
+    assert users[student_ids[0]]["reading_time"] == 10 * 60
+    assert users[student_ids[1]]["reading_time"] == 25 * 60
+    assert users[student_ids[0]]["number_of_exercises"] == 3
+    assert users[student_ids[1]]["number_of_exercises"] == 1
+
+
+def _add_activity(student, language_code, reading_minutes, outcomes):
+    from datetime import datetime, timedelta
+
+    from zeeguu.core.model import (
+        Exercise,
+        ExerciseOutcome,
+        Language,
+        UserExerciseSession,
+        UserReadingSession,
+    )
+    from zeeguu.core.model.db import db
+    from zeeguu.core.test.rules.article_rule import ArticleRule
+    from zeeguu.core.test.rules.exercise_source_rule import ExerciseSourceRule
+    from zeeguu.core.test.rules.meaning_rule import MeaningRule
+    from zeeguu.core.test.rules.user_word_rule import UserWordRule
+
+    language = Language.find(language_code)
+    an_hour_ago = datetime.now() - timedelta(hours=1)
+
+    article = ArticleRule().article
+    article.language = language
+    reading_session = UserReadingSession(student.id, article.id, an_hour_ago)
+    reading_session.duration = reading_minutes * 60 * 1000
+    db.session.add(reading_session)
+
+    exercise_session = UserExerciseSession(
+        student.id, an_hour_ago, current_time=an_hour_ago + timedelta(minutes=5)
+    )
+    db.session.add(exercise_session)
+    db.session.flush()
+
+    for outcome in outcomes:
+        user_word = UserWordRule(student, MeaningRule().meaning).user_word
+        user_word.meaning.origin.language = language
+        db.session.add(
+            Exercise(
+                ExerciseOutcome.find_or_create(db.session, outcome),
+                ExerciseSourceRule().random,
+                1000,
+                an_hour_ago,
+                exercise_session.id,
+                user_word,
+            )
+        )
+    db.session.commit()
+
+
 def test_get_class_info(client):
     client.post("/create_own_cohort", data=FRENCH_B1_COHORT)
     cohorts = client.get("/cohorts_info")
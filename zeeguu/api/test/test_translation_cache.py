@@ -0,0 +1,72 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from zeeguu.api.utils.caching_decorator import cache_on_data_keys
+from zeeguu.api.utils.translation_cache import TranslationCache, translation_caches
+
+
+class TranslationCacheTest(TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.folder.name, "translation_cache.sqlite")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TranslationCache("test", max_size=2, db_path=None)
+        cache.put(("da", "en", "hund"), {"translation": "dog"})
+        cache.put(("da", "en", "kat"), {"translation": "cat"})
+        assert cache.get(("da", "en", "hund")) == {"translation": "dog"}
+        cache.put(("da", "en", "hest"), {"translation": "horse"})
+
+        assert cache.get(("da", "en", "kat")) is None
+        assert len(cache) == 2
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["evictions"] == 1
+
+    def test_persistent_tier_is_shared(self):
+        writer = TranslationCache("test", db_path=self.db_path)
+        writer.put(("da", "en", "hund"), {"translation": "dog"})
+
+        # e.g. another worker, or the same one after a restart
+        reader = TranslationCache("test", db_path=self.db_path)
+        assert reader.get(("da", "en", "hund")) == {"translation": "dog"}
+        assert reader.get(("da", "en", "hund")) == {"translation": "dog"}
+        assert reader.stats()["persistent_hits"] == 1
+        assert reader.stats()["hits"] == 1
+
+        assert (
+            TranslationCache("other", db_path=self.db_path).get(("da", "en", "hund"))
+            is None
+        )
+
+    def test_expired_entries_are_dropped(self):
+        cache = TranslationCache("test", ttl=60, db_path=self.db_path)
+        with patch("zeeguu.core.util.two_tier_cache.time.time", return_value=1000):
+            cache.put(("da", "en", "hund"), {"translation": "dog"})
+        with patch("zeeguu.core.util.two_tier_cache.time.time", return_value=1061):
+            assert cache.get(("da", "en", "hund")) is None
+
+    def test_decorator_does_not_cache_empty_results(self):
+        calls = []
+
+        # not the developer's (or the server's) persistent cache
+        @cache_on_data_keys("source_language", "word", db_path=self.db_path)
+        def translate(data):
+            calls.append(data["word"])
+            return {"translation": "dog"} if data["word"] == "hund" else None
+
+        self.addCleanup(translation_caches.pop, "translate", None)
+
+        for _ in range(2):
+            assert translate({"source_language": "da", "word": "hund"})
+            assert translate({"source_language": "da", "word": "xyz"}) is None
+
+        assert calls == ["hund", "xyz", "xyz"]
+        assert translate.cache_info()["hits"] == 1
+        assert translate.cache_info()["persistent_size"] == 1
@@ -0,0 +1,93 @@
+import time
+from unittest import TestCase
+
+from zeeguu.api.utils.translation_dispatcher import (
+    hedged_translate,
+    translate_all,
+    translation_provider_stats,
+)
+
+
+def stub_translator(translation, delay=0.0, fails=False):
+    calls = []
+
+    def translate(data):
+        calls.append(data["word"])
+        time.sleep(delay)
+        if fails:
+            raise ValueError("translator is down")
+        return {"translation": translation}
+
+    translate.calls = calls
+    return translate
+
+
+class TranslationDispatcherTest(TestCase):
+    def test_fast_primary_is_not_hedged(self):
+        primary = stub_translator("dog")
+        secondary = stub_translator("hound")
+
+        result = hedged_translate(
+            {"word": "hund"},
+            [("primary", primary), ("secondary", secondary)],
+            hedge_delay_ms=200,
+            budget_ms=1000,
+        )
+
+        assert result == {"translation": "dog"}
+        assert secondary.calls == []
+
+    def test_slow_primary_is_hedged(self):
+        primary = stub_translator("dog", delay=0.5)
+        secondary = stub_translator("hound")
+
+        start = time.time()
+        result = hedged_translate(
+            {"word": "hund"},
+            [("slow", primary), ("fast", secondary)],
+            hedge_delay_ms=50,
+            budget_ms=1000,
+        )
+
+        assert result == {"translation": "hound"}
+        assert time.time() - start < 0.4
+
+    def test_failing_primary_is_hedged_at_once(self):
+        primary = stub_translator("dog", fails=True)
+        secondary = stub_translator("hound")
+
+        start = time.time()
+        result = hedged_translate(
+            {"word": "hund"},
+            [("failing", primary), ("backup", secondary)],
+            hedge_delay_ms=500,
+            budget_ms=1000,
+        )
+
+        assert result == {"translation": "hound"}
+        assert time.time() - start < 0.4
+        assert translation_provider_stats()["providers"]["failing"]["failures"] >= 1
+
+    def test_gives_up_after_the_budget(self):
+        slow = stub_translator("dog", delay=0.5)
+
+        start = time.time()
+        result = hedged_translate(
+            {"word": "hund"}, [("slower", slow)], hedge_delay_ms=10, budget_ms=100
+        )
+
+        assert result is None
+        assert time.time() - start < 0.4
+
+    def test_translate_all(self):
+        results = translate_all(
+            {"word": "hund"},
+            [
+                ("one", stub_translator("dog")),
+                ("two", stub_translator("hound", fails=True)),
+                ("three", stub_translator("canine", delay=0.5)),
+            ],
+            budget_ms=100,
+        )
+
+        assert results == [{"translation": "dog"}, None, None]
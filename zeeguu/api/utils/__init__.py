@@ -1,3 +1,3 @@
-from .route_wrappers import cross_domain, requires_session
+from .route_wrappers import cross_domain, only_admins, requires_session
 from .json_result import json_result
 from .parse_json_boolean import parse_json_boolean
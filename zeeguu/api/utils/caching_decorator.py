@@ -1,28 +1,46 @@
 # Claude's Idea
 from functools import wraps
 
+from zeeguu.api.utils.translation_cache import (
+    TRANSLATION_CACHE_DB,
+    TranslationCache,
+    translation_caches,
+)
 
-def cache_on_data_keys(*cache_keys):
-    """Decorator that caches functions taking 'data' as first parameter"""
+
+def cache_on_data_keys(*cache_keys, db_path=TRANSLATION_CACHE_DB):
+    """
+    Decorator that caches functions taking 'data' as first parameter,
+    in a bounded (and, when configured, persistent) TranslationCache.
+
+    Empty results (e.g. a translator that did not answer) are not cached,
+    so that they are retried the next time.
+
+    :param db_path: the SQLite file of the persistent tier, if any
+    """
 
     def decorator(func):
-        cache = {}
+        cache = TranslationCache(func.__name__, db_path=db_path)
+        translation_caches[func.__name__] = cache
 
         @wraps(func)
         def wrapper(data, *args, **kwargs):
             # Create cache key from specified dictionary keys
             cache_key = tuple(data.get(key) for key in cache_keys)
 
-            if cache_key not in cache:
-                cache[cache_key] = func(data, *args, **kwargs)
+            result = cache.get(cache_key)
+            if result is None:
+                result = func(data, *args, **kwargs)
+                if result:
+                    cache.put(cache_key, result)
 
-            return cache[cache_key]
+            return result
 
         # Add cache management methods
-        wrapper.cache_clear = lambda: cache.clear()
-        wrapper.cache_info = (
-            lambda: f"Cache size: {len(cache)}, Keys: {list(cache.keys())}"
-        )
+        wrapper.cache = cache
+        wrapper.cache_keys = cache_keys
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_info = cache.stats
 
         return wrapper
 
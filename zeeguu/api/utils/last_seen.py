@@ -0,0 +1,91 @@
+"""
+
+Coalesces the updates of User.last_seen.
+
+last_seen only has a resolution of a day, so there is no need to load the
+user and commit on every request. Instead, requires_session reports the
+user id here; the first report of a user on a given day is queued, and a
+background thread writes all the queued users with a single UPDATE every
+LAST_SEEN_FLUSH_INTERVAL seconds, and once more when the process exits
+(e.g. when gunicorn recycles a worker).
+
+"""
+
+import atexit
+import os
+import threading
+from datetime import datetime
+
+LAST_SEEN_FLUSH_INTERVAL = int(os.environ.get("ZEEGUU_LAST_SEEN_FLUSH_INTERVAL", 60))
+
+
+class LastSeenCoalescer:
+    def __init__(self, flush_interval=LAST_SEEN_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._seen_today = set()
+        self._day = None
+        self._pending = set()
+        self._app = None
+        self._thread = None
+
+    def user_seen(self, app, user_id):
+        today = datetime.now().date()
+        with self._lock:
+            if self._day != today:
+                self._day = today
+                self._seen_today = set()
+            if user_id in self._seen_today:
+                return
+            self._seen_today.add(user_id)
+            self._pending.add(user_id)
+            self._app = app
+            self._start_flushing_thread()
+
+    def _start_flushing_thread(self):
+        # the thread is (re)started lazily: threads don't survive forks
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._flush_periodically, name="last-seen-flush", daemon=True
+            )
+            self._thread.start()
+
+    def _flush_periodically(self):
+        stop = threading.Event()
+        while not stop.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            user_ids = self._pending
+            self._pending = set()
+            app = self._app
+        if not user_ids:
+            return
+
+        from sqlalchemy import or_
+        from zeeguu.core.model import User
+        from zeeguu.core.model.db import db
+
+        now = datetime.now()
+        start_of_today = datetime.combine(now.date(), datetime.min.time())
+        try:
+            with app.app_context():
+                User.query.filter(User.id.in_(user_ids)).filter(
+                    or_(User.last_seen == None, User.last_seen < start_of_today)
+                ).update({User.last_seen: now}, synchronize_session=False)
+                db.session.commit()
+                db.session.remove()
+        except Exception as e:
+            print(f"-- Could not update last_seen for {len(user_ids)} users: {e}")
+            # retried at the next flush
+            with self._lock:
+                self._pending |= user_ids
+
+
+last_seen_coalescer = LastSeenCoalescer()
+
+
+@atexit.register
+def _flush_last_seen():
+    last_seen_coalescer.flush()
@@ -4,13 +4,11 @@ from werkzeug.exceptions import BadRequestKeyError
 
 from zeeguu.logging import log
 from zeeguu.core.model.session import Session
+from zeeguu.api.utils.session_cache import session_cache
+from zeeguu.api.utils.last_seen import last_seen_coalescer
 
-from datetime import datetime, timedelta
 import zeeguu
 
-SESSION_CACHE = {}
-SESSION_CACHE_TIMEOUT = 60  # Seconds
-
 
 def requires_session(view):
     """
@@ -35,14 +33,8 @@ def requires_session(view):
         try:
             session_uuid = flask.request.args["session"]
 
-            user_id, session_expiry_time = SESSION_CACHE.get(
-                session_uuid,
-                (
-                    None,
-                    None,
-                ),
-            )
-            if session_expiry_time is None or datetime.now() > session_expiry_time:
+            user_id = session_cache.get(session_uuid)
+            if user_id is None:
                 from zeeguu.api.endpoints.sessions import (
                     is_session_too_old,
                     force_user_to_relog,
@@ -57,24 +49,16 @@ def requires_session(view):
                     force_user_to_relog(session_object)
                     flask.abort(401)
                 user_id = session_object.user_id
-                SESSION_CACHE[session_uuid] = (
-                    user_id,
-                    datetime.now() + timedelta(0, SESSION_CACHE_TIMEOUT),
-                )
+                session_cache.put(session_uuid, user_id)
 
             flask.g.user_id = user_id
             flask.g.session_uuid = session_uuid
 
-            # Update user's last_seen timestamp (once per day maximum)
-            from zeeguu.core.model import User
-            from zeeguu.core.model.db import db
-
-            user = User.find_by_id(user_id)
-
-            if user:
-                user.update_last_seen_if_needed(db.session)
-                # Commit immediately since this is a simple timestamp update
-                db.session.commit()
+            # Update user's last_seen timestamp (once per day maximum);
+            # written in the background, not on the request path
+            last_seen_coalescer.user_seen(
+                flask.current_app._get_current_object(), user_id
+            )
         except BadRequestKeyError as e:
             # This surely happens for missing session key
             # I'm not sure in which way the request could be bad
@@ -99,6 +83,26 @@ def requires_session(view):
     return wrapped_view
 
 
+def only_admins(view):
+    """
+    Decorator checks that the user of the session is an admin,
+    i.e. that their email is in the ADMIN_EMAILS of the config.
+
+    Must come after @requires_session.
+    """
+
+    @functools.wraps(view)
+    def wrapped_view(*args, **kwargs):
+        from zeeguu.core.model import User
+
+        user = User.find_by_id(flask.g.user_id)
+        if user.email not in flask.current_app.config.get("ADMIN_EMAILS", []):
+            flask.abort(401)
+        return view(*args, **kwargs)
+
+    return wrapped_view
+
+
 def cross_domain(view):
     """
     Decorator enables x-origin requests from any domain.
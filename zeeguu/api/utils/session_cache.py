@@ -0,0 +1,105 @@
+"""
+
+Cache from session uuid to user id, used by requires_session to avoid
+looking up the session in the DB on every request.
+
+By default every worker process keeps its own bounded LRU cache whose
+entries expire after SESSION_CACHE_TIMEOUT seconds. When
+ZEEGUU_SESSION_CACHE_REDIS_URL is set (and the redis package is installed)
+the cache lives in Redis instead, so that all the gunicorn workers share
+the hits, and a logout is seen by all of them at once.
+
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from zeeguu.logging import warning
+
+SESSION_CACHE_TIMEOUT = int(os.environ.get("ZEEGUU_SESSION_CACHE_TIMEOUT", 60))
+SESSION_CACHE_MAX_SIZE = int(os.environ.get("ZEEGUU_SESSION_CACHE_MAX_SIZE", 10000))
+SESSION_CACHE_REDIS_URL = os.environ.get("ZEEGUU_SESSION_CACHE_REDIS_URL")
+
+
+class LocalSessionCache:
+    def __init__(self, max_size=SESSION_CACHE_MAX_SIZE, ttl=SESSION_CACHE_TIMEOUT):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_uuid):
+        with self._lock:
+            entry = self._entries.get(session_uuid)
+            if entry is None:
+                return None
+            user_id, expires_at = entry
+            if time.time() > expires_at:
+                del self._entries[session_uuid]
+                return None
+            self._entries.move_to_end(session_uuid)
+            return user_id
+
+    def put(self, session_uuid, user_id):
+        with self._lock:
+            self._entries[session_uuid] = (user_id, time.time() + self.ttl)
+            self._entries.move_to_end(session_uuid)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, session_uuid):
+        with self._lock:
+            self._entries.pop(session_uuid, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisSessionCache:
+    """
+    When Redis is unreachable the cache is simply skipped: a miss sends
+    requires_session to the DB, and a failed write is only logged.
+    """
+
+    KEY_PREFIX = "zeeguu:session:"
+
+    def __init__(self, url, ttl=SESSION_CACHE_TIMEOUT):
+        import redis
+
+        self.ttl = ttl
+        self._redis = redis.Redis.from_url(url)
+        self._redis_error = redis.RedisError
+
+    def get(self, session_uuid):
+        try:
+            user_id = self._redis.get(self.KEY_PREFIX + session_uuid)
+        except self._redis_error as e:
+            warning(f"-- session cache unavailable: {e}")
+            return None
+        return int(user_id) if user_id is not None else None
+
+    def put(self, session_uuid, user_id):
+        try:
+            self._redis.setex(self.KEY_PREFIX + session_uuid, self.ttl, user_id)
+        except self._redis_error as e:
+            warning(f"-- session cache unavailable: {e}")
+
+    def invalidate(self, session_uuid):
+        try:
+            self._redis.delete(self.KEY_PREFIX + session_uuid)
+        except self._redis_error as e:
+            warning(f"-- session cache unavailable: {e}")
+
+
+def _create_session_cache():
+    if SESSION_CACHE_REDIS_URL:
+        try:
+            return RedisSessionCache(SESSION_CACHE_REDIS_URL)
+        except ImportError:
+            print("-- redis is not installed; using a per-worker session cache")
+    return LocalSessionCache()
+
+
+session_cache = _create_session_cache()
@@ -0,0 +1,46 @@
+"""
+
+Cache of the results of the third party translators, used by
+cache_on_data_keys: a TwoTierCache (see zeeguu.core.util.two_tier_cache)
+per translation function.
+
+Every worker process keeps a bounded LRU of the most recently used
+translations. Behind it, only when ZEEGUU_TRANSLATION_CACHE_DB is set to
+the path of a file, the translations are also saved in a local SQLite
+database, so that they survive restarts and are shared by all the gunicorn
+workers of the machine.
+
+Entries expire after ZEEGUU_TRANSLATION_CACHE_TTL seconds in both tiers.
+
+"""
+
+import os
+
+from zeeguu.core.util.two_tier_cache import TwoTierCache
+
+TRANSLATION_CACHE_MAX_SIZE = int(
+    os.environ.get("ZEEGUU_TRANSLATION_CACHE_MAX_SIZE", 10000)
+)
+TRANSLATION_CACHE_TTL = int(
+    os.environ.get("ZEEGUU_TRANSLATION_CACHE_TTL", 30 * 24 * 60 * 60)
+)
+TRANSLATION_CACHE_DB = os.environ.get("ZEEGUU_TRANSLATION_CACHE_DB")
+
+
+class TranslationCache(TwoTierCache):
+    def __init__(
+        self,
+        namespace,
+        max_size=TRANSLATION_CACHE_MAX_SIZE,
+        ttl=TRANSLATION_CACHE_TTL,
+        db_path=TRANSLATION_CACHE_DB,
+    ):
+        super().__init__(namespace, max_size, ttl=ttl, db_path=db_path)
+
+
+# all the caches of the process, by namespace
+translation_caches = {}
+
+
+def translation_cache_stats():
+    return {namespace: cache.stats() for namespace, cache in translation_caches.items()}
@@ -0,0 +1,186 @@
+"""
+
+Runs the contextual translators concurrently, so that a slow provider does
+not directly become click-to-translate latency.
+
+hedged_translate() starts the first (primary) provider, and if it has not
+answered after ZEEGUU_TRANSLATION_HEDGE_DELAY_MS (or as soon as it fails)
+it also starts the next one. The first good answer wins. If none arrives
+within ZEEGUU_TRANSLATION_BUDGET_MS the call gives up; the providers that
+are still running are left to finish in the background, so that their
+answers still end up in the translation cache.
+
+The latency of every provider call is recorded; translation_provider_stats()
+returns the p50/p95 of the recent ones, per provider.
+
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from zeeguu.logging import log
+
+TRANSLATION_HEDGE_DELAY_MS = int(
+    os.environ.get("ZEEGUU_TRANSLATION_HEDGE_DELAY_MS", 700)
+)
+TRANSLATION_BUDGET_MS = int(os.environ.get("ZEEGUU_TRANSLATION_BUDGET_MS", 4000))
+TRANSLATION_DISPATCH_WORKERS = int(
+    os.environ.get("ZEEGUU_TRANSLATION_DISPATCH_WORKERS", 16)
+)
+
+# the number of recent calls per provider the percentiles are computed on
+LATENCY_SAMPLES = 1000
+
+
+class _ProviderStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = {}
+            self.failures = {}
+            self.latencies_ms = {}
+            self.hedges = 0
+            self.timeouts = 0
+
+    def record(self, provider, elapsed_ms, failed):
+        with self._lock:
+            self.calls[provider] = self.calls.get(provider, 0) + 1
+            if failed:
+                self.failures[provider] = self.failures.get(provider, 0) + 1
+            self.latencies_ms.setdefault(
+                provider, deque(maxlen=LATENCY_SAMPLES)
+            ).append(elapsed_ms)
+
+    def record_hedge(self):
+        with self._lock:
+            self.hedges += 1
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def as_dict(self):
+        with self._lock:
+            providers = {}
+            for provider, latencies in self.latencies_ms.items():
+                ordered = sorted(latencies)
+                providers[provider] = {
+                    "calls": self.calls[provider],
+                    "failures": self.failures.get(provider, 0),
+                    "p50_ms": round(_percentile(ordered, 50), 1),
+                    "p95_ms": round(_percentile(ordered, 95), 1),
+                }
+            return {
+                "pid": os.getpid(),
+                "hedges": self.hedges,
+                "timeouts": self.timeouts,
+                "providers": providers,
+            }
+
+
+def _percentile(ordered, percent):
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+_stats = _ProviderStats()
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    # threads do not survive the fork of the gunicorn workers
+    global _executor, _executor_pid
+    if _executor_pid != os.getpid():
+        with _executor_lock:
+            if _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(
+                    max_workers=TRANSLATION_DISPATCH_WORKERS,
+                    thread_name_prefix="translation",
+                )
+                _executor_pid = os.getpid()
+    return _executor
+
+
+def _timed_call(provider, translate, data):
+    start = time.time()
+    failed = True
+    try:
+        result = translate(data)
+        failed = not result
+        return result
+    except Exception as e:
+        log(f"translation provider {provider} failed: {e}")
+        return None
+    finally:
+        _stats.record(provider, (time.time() - start) * 1000, failed)
+
+
+def hedged_translate(
+    data,
+    providers,
+    hedge_delay_ms=TRANSLATION_HEDGE_DELAY_MS,
+    budget_ms=TRANSLATION_BUDGET_MS,
+):
+    """
+    :param providers: the (name, translate function) pairs to try, in order
+        of preference; every function takes the translation data and
+        returns the translation, or None
+    :return: the first good translation, or None if no provider found one
+        within the budget
+    """
+    executor = _get_executor()
+    deadline = time.time() + budget_ms / 1000
+    waiting = list(providers)
+    running = set()
+
+    while waiting or running:
+        # the first provider, or the next one: the previous ones failed or
+        # did not answer within the hedge delay
+        if waiting:
+            if running:
+                _stats.record_hedge()
+            name, translate = waiting.pop(0)
+            running.add(executor.submit(_timed_call, name, translate, data))
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            _stats.record_timeout()
+            break
+        # wait for the hedge delay if there is another provider to start
+        timeout = min(remaining, hedge_delay_ms / 1000) if waiting else remaining
+        done, running = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.result():
+                return future.result()
+
+    return None
+
+
+def translate_all(data, providers, budget_ms=TRANSLATION_BUDGET_MS):
+    """
+    Runs all the providers at once.
+
+    :return: the result of every provider, in the order of providers;
+        None for those that failed or did not answer within the budget
+    """
+    executor = _get_executor()
+    futures = [
+        executor.submit(_timed_call, name, translate, data)
+        for name, translate in providers
+    ]
+    wait(futures, timeout=budget_ms / 1000)
+    return [future.result() if future.done() else None for future in futures]
+
+
+def translation_provider_stats():
+    return _stats.as_dict()
@@ -2,6 +2,7 @@ import json
 import os
 
 from zeeguu.api.utils.caching_decorator import cache_on_data_keys
+from zeeguu.api.utils.translation_dispatcher import hedged_translate, translate_all
 from zeeguu.logging import log
 
 from apimux.api_base import BaseThirdPartyAPIService
@@ -234,6 +235,8 @@ def google_contextual_translate(data):
     gtx = GoogleTranslateWithContext()
 
     response = gtx.get_result(data)
+    if response is None:
+        return None
     t = response.translations[0]
 
     t["likelihood"] = t.pop("quality")
@@ -247,9 +250,35 @@ def microsoft_contextual_translate(data):
     gtx = MicrosoftTranslateWithContext()
 
     response = gtx.get_result(data)
+    if response is None:
+        return None
     t = response.translations[0]
 
     t["likelihood"] = t.pop("quality")
     t["source"] = t["service_name"]
 
     return t
+
+
+# in order of preference; the next one is only asked when the previous
+# ones are too slow, or fail
+CONTEXTUAL_TRANSLATORS = [
+    ("Google - with context", google_contextual_translate),
+    ("Microsoft - with context", microsoft_contextual_translate),
+]
+
+
+def contextual_translate(data):
+    """
+    :return: the first good translation of the contextual translators, or
+    None if none of them answered within the latency budget
+    """
+    return hedged_translate(data, CONTEXTUAL_TRANSLATORS)
+
+
+def all_contextual_translations(data):
+    """
+    :return: the translations of all the contextual translators, asked in
+    parallel; None for those that failed
+    """
+    return translate_all(data, CONTEXTUAL_TRANSLATORS)
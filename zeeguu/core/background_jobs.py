@@ -0,0 +1,198 @@
+"""
+
+Bounded pools of background threads for work that should not block a
+request, e.g. classifying a newly created meaning with an LLM.
+
+A BackgroundJobQueue is keyed: submitting a key that is already waiting or
+being processed is a no-op, so a burst of requests for the same item results
+in a single job. The keys waiting in the queue are handed to the handler in
+batches of up to max_batch_size, so that the handler can do its work with a
+single call for many items. When more than max_pending keys are waiting, new
+keys are rejected (and counted), rather than piling up without bound.
+
+At exit, every queue stops accepting keys and waits (up to drain_timeout
+seconds) for the pending ones to be processed.
+
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from zeeguu.logging import log
+
+_queues = []
+
+
+class BackgroundJobQueue:
+    def __init__(
+        self,
+        name,
+        handle_batch,
+        workers=2,
+        max_pending=1000,
+        max_batch_size=10,
+        batch_wait=1.0,
+        drain_timeout=30,
+    ):
+        """
+        :param handle_batch: called from a worker thread with a list of keys
+        :param batch_wait: seconds a worker waits for more keys to arrive
+            before handling a batch that is not full
+        """
+        self.name = name
+        self.handle_batch = handle_batch
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_batch_size = max_batch_size
+        self.batch_wait = batch_wait
+        self.drain_timeout = drain_timeout
+
+        self._pending = OrderedDict()
+        self._in_progress = set()
+        self._condition = threading.Condition()
+        self._threads = []
+        self._pid = None
+        self._accepting = True
+
+        self.submitted = 0
+        self.duplicates = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+        self.batches = 0
+        self.max_pending_seen = 0
+
+        _queues.append(self)
+
+    def submit(self, key):
+        """
+        :return: False if the key was rejected because the queue is full
+            or shutting down
+        """
+        with self._condition:
+            if not self._accepting:
+                self.rejected += 1
+                return False
+            if key in self._pending or key in self._in_progress:
+                self.duplicates += 1
+                return True
+            if len(self._pending) >= self.max_pending:
+                self.rejected += 1
+                log(f"{self.name}: queue full, dropping {key}")
+                return False
+
+            self._pending[key] = None
+            self.submitted += 1
+            self.max_pending_seen = max(self.max_pending_seen, len(self._pending))
+            self._start_workers()
+            self._condition.notify()
+            return True
+
+    def _start_workers(self):
+        # threads don't survive a fork, so they are started
+        # lazily in the process that submits the first job
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"{self.name}-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _next_batch(self):
+        with self._condition:
+            while not self._pending:
+                self._condition.wait()
+
+            # give the burst a chance to fill up the batch
+            deadline = time.time() + self.batch_wait
+            while len(self._pending) < self.max_batch_size and self._accepting:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = []
+            while self._pending and len(batch) < self.max_batch_size:
+                key, _ = self._pending.popitem(last=False)
+                batch.append(key)
+            self._in_progress.update(batch)
+            return batch
+
+    def _work(self):
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                # another worker took the keys while we were waiting
+                continue
+            failed = False
+            try:
+                self.handle_batch(batch)
+            except Exception as e:
+                failed = True
+                log(f"{self.name}: failed to handle {batch}: {e}")
+            with self._condition:
+                self._in_progress.difference_update(batch)
+                self.batches += 1
+                if failed:
+                    self.failed += len(batch)
+                else:
+                    self.processed += len(batch)
+                self._condition.notify_all()
+
+    def drain(self, timeout=None):
+        """
+        Stops accepting keys, and waits for the pending ones to be handled.
+        :return: True if the queue was drained within the timeout
+        """
+        timeout = self.drain_timeout if timeout is None else timeout
+        deadline = time.time() + timeout
+        with self._condition:
+            self._accepting = False
+            self._condition.notify_all()
+            if self._pid != os.getpid():
+                # no workers in this process
+                return not self._pending
+            while self._pending or self._in_progress:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    log(
+                        f"{self.name}: {len(self._pending) + len(self._in_progress)} "
+                        f"jobs still pending at shutdown"
+                    )
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def stats(self):
+        with self._condition:
+            return {
+                "name": self.name,
+                "pid": os.getpid(),
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": len(self._pending),
+                "in_progress": len(self._in_progress),
+                "max_pending_seen": self.max_pending_seen,
+                "submitted": self.submitted,
+                "duplicates": self.duplicates,
+                "rejected": self.rejected,
+                "processed": self.processed,
+                "failed": self.failed,
+                "batches": self.batches,
+            }
+
+
+def background_jobs_stats():
+    return [queue.stats() for queue in _queues]
+
+
+@atexit.register
+def _drain_all_queues():
+    for queue in _queues:
+        queue.drain()
@@ -4,6 +4,8 @@ from nltk.tokenize import sent_tokenize
 import os
 import json
 
+from zeeguu.core.util.multi_pattern_matcher import matcher_for
+
 JUNK_PATTERNS_TO_REMOVE = [
     "\nAdvertisement\n",
     "\ntrue\n",
@@ -73,6 +75,7 @@ JUNK_COUNT_FILEPATH = os.path.join(
 with open(JUNK_COUNT_FILEPATH, "r", encoding="utf-8") as f:
     json_data = json.load(f)
     JUNK_COUNT_PATTERNS = [sent for lang in json_data.values() for sent in lang]
+JUNK_COUNT_PATTERNS_SET = frozenset(JUNK_COUNT_PATTERNS)
 
 JUNK_PREFIXES = [
     "Der er ikke oplæsning af denne artikel, så den oplæses derfor med maskinstemme."
@@ -123,25 +126,46 @@ def filter_noise_patterns(
     return clean_artcile.strip()
 
 
+def _remove_junk_patterns(text: str, on_removed=None):
+    """
+    Removes the JUNK_PATTERNS_TO_REMOVE from the text one after the other,
+    in the order of the list.
+
+    Only the patterns that occur in the text need to be replaced. Since a
+    removal can join the text around it into a later pattern, the patterns
+    are found again after every removal.
+    """
+    matcher = matcher_for("junk_patterns_to_remove", JUNK_PATTERNS_TO_REMOVE)
+    next_id = 0
+    while True:
+        found = [i for i in matcher.found(text) if i >= next_id]
+        if not found:
+            return text
+
+        junk_pattern = JUNK_PATTERNS_TO_REMOVE[found[0]]
+        text = text.replace(junk_pattern, "")
+        print(f"- cleaned: {junk_pattern}")
+        if on_removed:
+            on_removed(junk_pattern)
+        next_id = found[0] + 1
+
+
 def cleanup_non_content_bits_w_crawl_report(text: str, crawl_report, feed, url) -> str:
     new_text = text
     new_text = filter_noise_patterns(
-        text, set(JUNK_COUNT_PATTERNS), crawl_report, feed, url
+        text, JUNK_COUNT_PATTERNS_SET, crawl_report, feed, url
+    )
+    new_text = _remove_junk_patterns(
+        new_text,
+        lambda junk_pattern: crawl_report.add_sent_removed(feed, junk_pattern, url),
     )
-    for junk_pattern in JUNK_PATTERNS_TO_REMOVE:
-        cleaned = new_text.replace(junk_pattern, "")
-
-        if cleaned != new_text:
-            crawl_report.add_sent_removed(feed, junk_pattern, url)
-            print(f"- cleaned: {junk_pattern}")
-            new_text = cleaned
 
     clean_text = ""
     for junk_prefix in JUNK_PREFIXES:
         for each in new_text.split("\n"):
             if each.startswith(junk_prefix):
                 print(">>>> dropping the Paragraph: " + each)
-                crawl_report.add_sent_removed(feed, junk_pattern, url)
+                crawl_report.add_sent_removed(feed, junk_prefix, url)
                 continue
             clean_text += each + "\n"
 
@@ -150,14 +174,8 @@ def cleanup_non_content_bits_w_crawl_report(text: str, crawl_report, feed, url)
 
 def cleanup_non_content_bits(text: str):
     new_text = text
-    new_text = filter_noise_patterns(text, set(JUNK_COUNT_PATTERNS))
-
-    for junk_pattern in JUNK_PATTERNS_TO_REMOVE:
-        cleaned = new_text.replace(junk_pattern, "")
-
-        if cleaned != new_text:
-            print(f"- cleaned: {junk_pattern}")
-            new_text = cleaned
+    new_text = filter_noise_patterns(text, JUNK_COUNT_PATTERNS_SET)
+    new_text = _remove_junk_patterns(new_text)
 
     clean_text = ""
     for junk_prefix in JUNK_PREFIXES:
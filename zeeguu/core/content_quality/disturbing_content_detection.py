@@ -5,6 +5,8 @@ This provides fast keyword-based detection before expensive LLM processing.
 Articles flagged here will still be saved but marked appropriately.
 """
 
+from zeeguu.core.util.multi_pattern_matcher import matcher_for
+
 # Keywords by language for detecting disturbing content
 # Focus on words that appear in headlines/titles about violent/tragic current events
 DISTURBING_KEYWORDS = {
@@ -187,7 +189,9 @@ def is_disturbing_content_based_on_keywords(title: str = None, content: str = No
         return False, ""
 
     # Get keywords for this language, fallback to English
-    keywords = DISTURBING_KEYWORDS.get(language, DISTURBING_KEYWORDS["en"])
+    if language not in DISTURBING_KEYWORDS:
+        language = "en"
+    keywords = DISTURBING_KEYWORDS[language]
 
     # Combine title and content for checking
     text_to_check = ""
@@ -197,11 +201,11 @@ def is_disturbing_content_based_on_keywords(title: str = None, content: str = No
         # Only check first 500 chars of content to focus on headline/intro
         text_to_check += " " + content[:500].lower()
 
-    # Check for disturbing keywords
-    matched_keywords = []
-    for keyword in keywords:
-        if keyword.lower() in text_to_check:
-            matched_keywords.append(keyword)
+    # Check for disturbing keywords, all at once
+    matcher = matcher_for(
+        f"disturbing_keywords:{language}", keywords, ignore_case=True
+    )
+    matched_keywords = [keywords[i] for i in matcher.found(text_to_check)]
 
     # Require at least one keyword match
     if matched_keywords:
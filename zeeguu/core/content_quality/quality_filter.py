@@ -2,6 +2,7 @@ import newspaper
 from langdetect import detect
 from zeeguu.core.model import Article, LowQualityTypes
 from zeeguu.core.ml_models import is_paywalled, ID_TO_LABEL_PAYWALL
+from zeeguu.core.util.multi_pattern_matcher import matcher_for
 
 HTML_READ_MORE_PATTERNS = [
     "To continue reading this premium",  # New Scientist
@@ -67,13 +68,15 @@ LIVE_BLOG_KIND_OF_PATTERNS = [
 
 
 def sufficient_quality_html(html):
-    for each in HTML_READ_MORE_PATTERNS:
-        if html.find(each) > 0:
-            return (
-                False,
-                f"Incomplete Article (based on HTML analysis). Contains: {each}",
-                LowQualityTypes.HTML_PATTERN,
-            )
+    matcher = matcher_for("html_read_more_patterns", HTML_READ_MORE_PATTERNS)
+    # a pattern that starts the html does not count
+    pattern_id = matcher.first_found(html, min_start=1)
+    if pattern_id is not None:
+        return (
+            False,
+            f"Incomplete Article (based on HTML analysis). Contains: {HTML_READ_MORE_PATTERNS[pattern_id]}",
+            LowQualityTypes.HTML_PATTERN,
+        )
     return True, "", ""
 
 
@@ -93,13 +96,14 @@ def sufficient_quality_plain_text(text, lang_code=None):
             LowQualityTypes.TOO_LONG,
         )
 
-    for each in PLAIN_TEXT_PAYWALL_PATTERNS:
-        if text.find(each) >= 0:
-            return (
-                False,
-                f"Incomplete pattern in text: {each}",
-                LowQualityTypes.TEXT_PAYWALL_PATTERN,
-            )
+    matcher = matcher_for("plain_text_paywall_patterns", PLAIN_TEXT_PAYWALL_PATTERNS)
+    pattern_id = matcher.first_found(text)
+    if pattern_id is not None:
+        return (
+            False,
+            f"Incomplete pattern in text: {PLAIN_TEXT_PAYWALL_PATTERNS[pattern_id]}",
+            LowQualityTypes.TEXT_PAYWALL_PATTERN,
+        )
 
     if text.endswith(incomplete_suggesting_terminations):
         return (
@@ -116,9 +120,10 @@ def sufficient_quality_plain_text(text, lang_code=None):
             LowQualityTypes.LANGUAGE_DOES_NOT_MATCH_FEED,
         )
 
-    for each in LIVE_BLOG_KIND_OF_PATTERNS:
-        if text.find(each) >= 0:
-            return False, "Live blog kind of article", LowQualityTypes.LIVE_BLOG
+    if matcher_for("live_blog_patterns", LIVE_BLOG_KIND_OF_PATTERNS).first_found(
+        text
+    ) is not None:
+        return False, "Live blog kind of article", LowQualityTypes.LIVE_BLOG
 
     paywall_pred = is_paywalled(text)
     if paywall_pred > 0:
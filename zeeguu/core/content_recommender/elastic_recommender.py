@@ -7,7 +7,7 @@ Still uses MySQL to find relations between the user and things such as:
 
 """
 
-from elasticsearch import Elasticsearch
+from zeeguu.core.elastic.client import get_es_client
 from elasticsearch_dsl import Search, Q
 
 from zeeguu.core.elastic.basic_ops import es_get_es_id_from_article_id
@@ -17,21 +17,20 @@ from zeeguu.core.elastic.elastic_query_builder import (
     build_elastic_more_like_this_query,
     build_elastic_search_query_for_videos,
 )
-from zeeguu.core.elastic.settings import ES_CONN_STRING, ES_ZINDEX
+from zeeguu.core.elastic.settings import ES_ZINDEX
 from zeeguu.core.model import (
     Article,
     Video,
-    TopicFilter,
-    TopicSubscription,
-    SearchFilter,
-    SearchSubscription,
     UserArticle,
     UserVideo,
     Language,
     UserPreference,
 )
-from zeeguu.core.model.user_activitiy_data import UserActivityData
+from zeeguu.core.content_recommender.user_recommendation_profile import (
+    recommendation_profile_for,
+)
 from zeeguu.core.util.timer_logging_decorator import time_this
+from zeeguu.logging import warning
 
 
 def filter_hits_on_score(hits, score_threshold):
@@ -39,62 +38,17 @@ def filter_hits_on_score(hits, score_threshold):
 
 
 def _prepare_user_constraints(user):
-    language = user.learned_language
-
-    # 0. Ensure appropriate difficulty
-    declared_level_min, declared_level_max = user.levels_for(language)
-    lower_bounds = declared_level_min * 10
-    upper_bounds = declared_level_max * 10
-
-    # 1. Unwanted user topics
-    # ==============================
-    user_search_filters = SearchFilter.all_for_user(user)
-    unwanted_user_searches = []
-    for user_search_filter in user_search_filters:
-        unwanted_user_searches.append(user_search_filter.search.keywords)
-    print(f"keywords to exclude: {unwanted_user_searches}")
-
-    # 2. Topics to exclude / filter out
-    # =================================
-    excluded_topics = TopicFilter.all_for_user(user)
-    topics_to_exclude = [
-        each.topic.title for each in excluded_topics if each is not None
-    ]
-    print(f"Topics to exclude: {excluded_topics}")
-
-    # 3. Topics subscribed, and thus to include
-    # =========================================
-    topic_subscriptions = TopicSubscription.all_for_user(user)
-    topics_to_include = [
-        subscription.topic.title
-        for subscription in topic_subscriptions
-        if subscription is not None
-    ]
-    print(f"Topics to include: {topic_subscriptions}")
-
-    # 6. Wanted user topics
-    # =========================================
-    user_subscriptions = SearchSubscription.all_for_user(user)
-
-    wanted_user_searches = []
-    for sub in user_subscriptions:
-        wanted_user_searches.append(sub.search.keywords)
-    print(f"keywords to include: {wanted_user_searches}")
-
-    # 7. User ignored sources
-    # =========================================
-    user_ignored_sources = UserActivityData.get_sources_ignored_by_user(user)
-    # Debug logging removed for cleaner output
+    profile = recommendation_profile_for(user)
 
     return (
-        language,
-        upper_bounds,
-        lower_bounds,
-        _topics_to_string(topics_to_include),
-        _topics_to_string(topics_to_exclude),
-        _list_to_string(wanted_user_searches),
-        _list_to_string(unwanted_user_searches),
-        user_ignored_sources,
+        user.learned_language,
+        profile.upper_bounds,
+        profile.lower_bounds,
+        _topics_to_string(profile.topics_to_include),
+        _topics_to_string(profile.topics_to_exclude),
+        _list_to_string(profile.wanted_user_searches),
+        _list_to_string(profile.unwanted_user_searches),
+        profile.user_ignored_sources,
     )
 
 
@@ -140,7 +94,7 @@ def article_recommendations_for_user(
         user_ignored_sources,
     ) = _prepare_user_constraints(user)
 
-    es = Elasticsearch(ES_CONN_STRING)
+    es = get_es_client()
 
     # Check if user has enabled disturbing content filtering
     filter_disturbing = UserPreference.is_filter_disturbing_content_enabled(user)
@@ -164,31 +118,38 @@ def article_recommendations_for_user(
         page=page,
     )
 
-    res = es.search(index=ES_ZINDEX, body=query_body)
-    hit_list = res["hits"].get("hits")
-    # Handle both articles and videos in organic recommendations
-    content_objects = [
-        (
-            _get_article_from_ES_hit(h)
-            if "article_id" in h["_source"]
-            else _get_video_from_ES_hit(h)
-        )
-        for h in hit_list
-    ]
-    final_article_mix.extend([c for c in content_objects if c is not None])
-
-    # Get articles based on Search preferences
-    articles_from_searches = []
+    # The queries for the searches the user has saved are sent together
+    # with the main query, in a single round trip to ES
+    searches = [{"index": ES_ZINDEX}, query_body]
     for search in wanted_user_searches.split():
-        articles_from_searches += article_and_video_search_for_user(
-            user,
+        search_query_body = build_elastic_search_query(
             1,
             search,
-            page,
-            score_threshold=score_threshold_for_search,
+            language,
+            upper_bounds,
+            lower_bounds,
+            page=page,
             use_published_priority=True,
             use_readability_priority=True,
         )
+        searches += [{"index": ES_ZINDEX}, search_query_body]
+
+    responses = es.msearch(searches=searches)["responses"]
+
+    # only the saved searches may fail silently; without the main
+    # query there is no feed, and the caller must know it
+    hit_list = _hits_from_msearch_response(responses[0], raise_on_error=True)
+    # Handle both articles and videos in organic recommendations
+    final_article_mix.extend(_to_content_from_ES_hits(hit_list))
+
+    # Get articles based on Search preferences
+    search_hits = []
+    for response in responses[1:]:
+        hits = _hits_from_msearch_response(response)
+        if score_threshold_for_search > 0:
+            hits = filter_hits_on_score(hits, score_threshold_for_search)
+        search_hits += hits
+    articles_from_searches = _to_content_from_ES_hits(search_hits)
 
     # Limit the searched added content to a maximum of 10 extra items.
     content = [
@@ -223,7 +184,7 @@ def video_recommendations_for_user(
         user_ignored_sources,
     ) = _prepare_user_constraints(user)
 
-    es = Elasticsearch(ES_CONN_STRING)
+    es = get_es_client()
     video_query = build_elastic_search_query_for_videos(
         count,
         wanted_user_searches,
@@ -283,27 +244,14 @@ def article_and_video_search_for_user(
         use_readability_priority,
     )
 
-    es = Elasticsearch(ES_CONN_STRING)
+    es = get_es_client()
     res = es.search(index=ES_ZINDEX, body=query_body)
     hit_list = res["hits"].get("hits")
 
     if score_threshold > 0:
         hit_list = filter_hits_on_score(hit_list, score_threshold)
 
-    content_objects = [
-        (
-            _get_article_from_ES_hit(h)
-            if "article_id" in h["_source"]
-            else _get_video_from_ES_hit(h)
-        )
-        for h in hit_list
-    ]
-
-    final_mix = [
-        each for each in content_objects if each is not None and not each.broken
-    ]
-
-    return final_mix
+    return _to_content_from_ES_hits(hit_list)
 
 
 def topic_filter_for_user(
@@ -316,7 +264,7 @@ def topic_filter_for_user(
     difficulty_level,
     topic,
 ):
-    es = Elasticsearch(ES_CONN_STRING)
+    es = get_es_client()
 
     s = Search().query(Q("term", language=user.learned_language.code()))
 
@@ -367,6 +315,17 @@ def topic_filter_for_user(
     return articles
 
 
+def _hits_from_msearch_response(response, raise_on_error=False):
+    # a failing sub-query of a msearch does not raise,
+    # it is reported in its own response instead
+    if "error" in response:
+        if raise_on_error:
+            raise Exception(f"ES query failed: {response['error']}")
+        warning(f"ES sub-query failed: {response['error']}")
+        return []
+    return response["hits"].get("hits")
+
+
 def _list_to_string(input_list):
     return " ".join([each for each in input_list]) or ""
 
@@ -375,35 +334,54 @@ def _topics_to_string(input_list):
     return ",".join(input_list)
 
 
-def _get_video_from_ES_hit(hit):
-    return Video.find_by_id(hit["_source"]["video_id"])
+def _to_content_from_ES_hits(hits, with_score=False):
+    """
+        Turns a list of ES hits into the corresponding Article and Video
+        objects, keeping the order of the hits (i.e. the ES score order).
 
+        All the articles are loaded with a single query, and so are all the
+        videos; hits whose row is missing from the DB or is broken are dropped.
+    """
+    article_ids = [
+        h["_source"]["article_id"] for h in hits if "article_id" in h["_source"]
+    ]
+    video_ids = [
+        h["_source"]["video_id"] for h in hits if "video_id" in h["_source"]
+    ]
+    articles = Article.find_by_ids(article_ids)
+    videos = Video.find_by_ids(video_ids)
 
-def _get_article_from_ES_hit(hit):
-    return Article.find_by_id(hit["_source"]["article_id"])
+    content = []
+    for hit in hits:
+        source = hit["_source"]
+        if "article_id" in source:
+            each = articles.get(source["article_id"])
+        elif "video_id" in source:
+            each = videos.get(source["video_id"])
+        else:
+            each = None
 
+        if each is None or each.broken:
+            continue
 
-def _to_articles_from_ES_hits(hits, with_score=False):
-    articles = []
-    for hit in hits:
-        article = _get_article_from_ES_hit(hit)
         if with_score:
-            articles.append((hit.get("_score", 0), article))
+            content.append((hit.get("_score", 0), each))
         else:
-            articles.append(article)
+            content.append(each)
 
-    return articles
+    return content
+
+
+def _to_articles_from_ES_hits(hits, with_score=False):
+    return _to_content_from_ES_hits(
+        [h for h in hits if "article_id" in h["_source"]], with_score
+    )
 
 
 def _to_videos_from_ES_hits(hits, with_score=False):
-    videos = []
-    for hit in hits:
-        video = _get_video_from_ES_hit(hit)
-        if with_score:
-            videos.append((hit.get("_score", 0), video))
-        else:
-            videos.append(video)
-    return videos
+    return _to_content_from_ES_hits(
+        [h for h in hits if "video_id" in h["_source"]], with_score
+    )
 
 
 def _difficuty_level_bounds(level):
@@ -426,7 +404,7 @@ def __find_articles_like(
     article_age: int,
     language_id: int,
 ) -> "list[Article]":
-    es = Elasticsearch(ES_CONN_STRING)
+    es = get_es_client()
     fields = ["content", "title"]
     language = Language.find_by_id(language_id)
     like_documents = [
@@ -463,11 +441,15 @@ def content_recommendations(user_id: int, language_id: int):
 
 
 def get_user_info_from_content_recommendations(user, content_list):
+    articles = [each for each in content_list if type(each) is Article]
+    article_infos = iter(
+        UserArticle.user_article_info_many(
+            user, UserArticle.select_appropriate_articles_for_user(user, articles)
+        )
+    )
     return [
         (
-            UserArticle.user_article_info(
-                user, UserArticle.select_appropriate_article_for_user(user, each)
-            )
+            next(article_infos)
             if type(each) is Article
             else UserVideo.user_video_info(user, each)
         )
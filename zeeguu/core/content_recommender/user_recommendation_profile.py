@@ -0,0 +1,169 @@
+"""
+
+The constraints that the recommender applies for a user: difficulty bounds,
+included / excluded topics and searches, and ignored sources.
+
+Computing them takes half a dozen queries, and a single home page load
+needs them once for the main recommendation and once more for every saved
+search. The profiles are thus cached per user in every worker process.
+
+Every entry is tagged with the version of the user's profile at the time it
+was built. Committed writes to the tables the profile is computed from bump
+the version (see the listeners at the end of the module), so a cached profile
+is never returned after the user changed their filters or subscriptions in
+this process. The version is only bumped after the commit: were it bumped at
+flush time, a concurrent request could still rebuild the profile from the
+old rows and cache it under the new version. Writes served by other workers are only seen after
+RECOMMENDATION_PROFILE_TTL seconds.
+
+"""
+
+import os
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from zeeguu.core.constants import EVENT_USER_CLICKED_ARTICLE
+from zeeguu.core.model import (
+    TopicFilter,
+    TopicSubscription,
+    SearchFilter,
+    SearchSubscription,
+    UserLanguage,
+)
+from zeeguu.core.model.user_activitiy_data import UserActivityData
+
+RECOMMENDATION_PROFILE_TTL = int(
+    os.environ.get("ZEEGUU_RECOMMENDATION_PROFILE_TTL", 60)
+)
+
+
+class UserRecommendationProfile:
+    """
+    The recommendation constraints of a user for their learned language.
+
+    Only plain values are kept, so that a profile can outlive
+    the DB session in which it was computed.
+    """
+
+    def __init__(self, user, language):
+        self.language_id = language.id
+
+        # 0. Ensure appropriate difficulty
+        declared_level_min, declared_level_max = user.levels_for(language)
+        self.lower_bounds = declared_level_min * 10
+        self.upper_bounds = declared_level_max * 10
+
+        # 1. Unwanted user topics
+        # ==============================
+        self.unwanted_user_searches = [
+            each.search.keywords for each in SearchFilter.all_for_user(user)
+        ]
+
+        # 2. Topics to exclude / filter out
+        # =================================
+        self.topics_to_exclude = [
+            each.topic.title
+            for each in TopicFilter.all_for_user(user)
+            if each is not None
+        ]
+
+        # 3. Topics subscribed, and thus to include
+        # =========================================
+        self.topics_to_include = [
+            subscription.topic.title
+            for subscription in TopicSubscription.all_for_user(user)
+            if subscription is not None
+        ]
+
+        # 4. Wanted user topics
+        # =========================================
+        self.wanted_user_searches = [
+            sub.search.keywords for sub in SearchSubscription.all_for_user(user)
+        ]
+
+        # 5. User ignored sources
+        # =========================================
+        self.user_ignored_sources = UserActivityData.get_sources_ignored_by_user(user)
+
+
+_profiles = {}
+_versions = {}
+_lock = threading.Lock()
+
+
+def recommendation_profile_for(user) -> UserRecommendationProfile:
+    """
+    Returns the cached profile of the user for their current learned
+    language, computing it if it is missing, outdated or expired.
+    """
+    language = user.learned_language
+    key = (user.id, language.id)
+
+    with _lock:
+        version = _versions.get(user.id, 0)
+        cached = _profiles.get(key)
+    if cached is not None:
+        cached_version, expires_at, profile = cached
+        if cached_version == version and time.time() < expires_at:
+            return profile
+
+    profile = UserRecommendationProfile(user, language)
+
+    with _lock:
+        # if the profile was invalidated while we were computing it,
+        # we still return it to this caller, but we don't cache it
+        if _versions.get(user.id, 0) == version:
+            _profiles[key] = (
+                version,
+                time.time() + RECOMMENDATION_PROFILE_TTL,
+                profile,
+            )
+    return profile
+
+
+def invalidate_recommendation_profile(user_id):
+    with _lock:
+        _versions[user_id] = _versions.get(user_id, 0) + 1
+        for key in [k for k in _profiles if k[0] == user_id]:
+            del _profiles[key]
+
+
+_SESSION_INFO_KEY = "recommendation_profiles_to_invalidate"
+
+
+def _invalidate_for_target(mapper, connection, target):
+    # called at flush time: the user ids are only collected on the
+    # session, and their profiles invalidated once it commits (the ids
+    # of a rolled back flush are kept; invalidating too often is harmless)
+    session = object_session(target)
+    if target.user_id is not None and session is not None:
+        session.info.setdefault(_SESSION_INFO_KEY, set()).add(target.user_id)
+
+
+def _invalidate_for_clicked_article(mapper, connection, target):
+    # the ignored sources are derived from the clicked article events only
+    if target.event == EVENT_USER_CLICKED_ARTICLE:
+        _invalidate_for_target(mapper, connection, target)
+
+
+def _invalidate_after_commit(session):
+    for user_id in session.info.pop(_SESSION_INFO_KEY, ()):
+        invalidate_recommendation_profile(user_id)
+
+
+for _model in [
+    TopicFilter,
+    TopicSubscription,
+    SearchFilter,
+    SearchSubscription,
+    UserLanguage,
+]:
+    for _event in ["after_insert", "after_update", "after_delete"]:
+        event.listen(_model, _event, _invalidate_for_target)
+
+event.listen(UserActivityData, "after_insert", _invalidate_for_clicked_article)
+
+event.listen(Session, "after_commit", _invalidate_after_commit)
@@ -70,12 +70,17 @@ SOURCE_CONTENT_FILTERS = {
 
 def _cache_article_tokenization(article, session):
     """
-    Pre-tokenize and cache article summary and title to avoid expensive CPU work
-    during user requests. This runs during feed crawling so users never experience
-    the slow first-time tokenization.
+    Pre-tokenize and cache article summary, title and full content to avoid
+    expensive CPU work during user requests. This runs during feed crawling so
+    users never experience the slow first-time tokenization.
     """
     import json
-    from zeeguu.core.tokenization import get_tokenizer, TOKENIZER_MODEL
+    from zeeguu.core.tokenization import (
+        get_tokenizer,
+        get_tokenizer_version,
+        TOKENIZER_MODEL,
+    )
+    from zeeguu.core.model.article_fragment import ArticleFragment
     from zeeguu.core.model.article_tokenization_cache import ArticleTokenizationCache
 
     try:
@@ -84,9 +89,24 @@ def _cache_article_tokenization(article, session):
         # Create cache entry
         cache = ArticleTokenizationCache(article_id=article.id)
 
+        # Tokenize the content, the title and all the fragments in one go
+        fragments = ArticleFragment.get_all_article_fragments_in_order(article.id)
+        tokenized = ArticleTokenizationCache.tokenize_content(
+            article, fragments, tokenizer
+        )
+        if tokenizer.degraded:
+            logp("  - Tokenizer fell back to a cheaper model, not caching")
+            return
+        cache.set_tokenized_content(
+            ArticleTokenizationCache.content_hash_for(article, fragments),
+            get_tokenizer_version(TOKENIZER_MODEL),
+            tokenized,
+        )
+        logp(f"  - Cached tokenized content ({len(fragments)} fragments)")
+
         # Cache tokenized title (always present)
         if article.title:
-            tokenized_title = tokenizer.tokenize_text(article.title, flatten=False)
+            tokenized_title = tokenized["tokenized_title"]
             cache.tokenized_title = json.dumps(tokenized_title)
             logp(f"  - Cached tokenized title ({len(tokenized_title)} sentences)")
 
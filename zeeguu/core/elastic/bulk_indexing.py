@@ -0,0 +1,277 @@
+"""
+
+Streaming (re)indexing of many articles, batch by batch:
+
+1. the articles are read from the DB by keyset pagination (id > the last
+   id of the previous batch), together with their topics, source text,
+   url and language;
+2. the ES documents that already exist for the batch are found with one
+   terms query (and one mget for the legacy documents whose ES id is the
+   article id);
+3. the embeddings of the new and changed articles are requested in
+   parallel; the others keep the ones in their document;
+4. the documents are written with parallel_bulk.
+
+After every batch the id of its last article is saved in the checkpoint
+file (if any), so that an interrupted reindex can be resumed.
+
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+
+from elasticsearch import NotFoundError
+from elasticsearch.helpers import parallel_bulk
+from sqlalchemy.orm import joinedload, selectinload
+
+from zeeguu.core.elastic.client import get_es_client
+from zeeguu.core.elastic.indexing import (
+    document_from_article,
+    embedding_generation_required,
+)
+from zeeguu.core.elastic.settings import ES_ZINDEX
+from zeeguu.core.model import Article, Url
+from zeeguu.core.model.article_classification import (
+    ArticleClassification,
+    ClassificationType,
+)
+from zeeguu.core.model.article_topic_map import ArticleTopicMap, TopicOriginType
+from zeeguu.core.model.source import Source
+from zeeguu.core.semantic_vector_api import get_embeddings_from_texts
+
+REINDEX_BATCH_SIZE = int(os.environ.get("ZEEGUU_REINDEX_BATCH_SIZE", 200))
+REINDEX_BULK_THREADS = int(os.environ.get("ZEEGUU_REINDEX_BULK_THREADS", 4))
+
+
+@dataclass
+class ReindexProgress:
+    last_article_id: int = 0
+    articles: int = 0
+    indexed: int = 0
+    skipped_existing: int = 0
+    embeddings_computed: int = 0
+    embeddings_reused: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    error_samples: list = field(default_factory=list)
+
+    def articles_per_second(self):
+        return self.articles / self.seconds if self.seconds else 0
+
+    def save(self, checkpoint_path):
+        tmp_path = checkpoint_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp_path, checkpoint_path)
+
+    @classmethod
+    def load(cls, checkpoint_path):
+        if not checkpoint_path or not os.path.exists(checkpoint_path):
+            return cls()
+        with open(checkpoint_path) as f:
+            return cls(**json.load(f))
+
+
+def article_batches(query, batch_size=REINDEX_BATCH_SIZE, after_id=0):
+    """
+    :param query: the articles to index, e.g. Article.query.filter(...)
+    :return: batches of articles ordered by id, with the relationships
+        that their documents need already loaded
+    """
+    query = query.options(
+        selectinload(Article.topics).joinedload(ArticleTopicMap.topic),
+        joinedload(Article.source).joinedload(Source.source_text),
+        joinedload(Article.url).joinedload(Url.domain),
+        joinedload(Article.language),
+    ).order_by(Article.id)
+
+    last_id = after_id
+    while True:
+        batch = query.filter(Article.id > last_id).limit(batch_size).all()
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1].id
+
+
+def _topics_of(article):
+    topics, inferred = [], []
+    for topic_map in article.topics:
+        if topic_map.origin_type == TopicOriginType.INFERRED:
+            inferred.append(topic_map.topic)
+        else:
+            topics.append(topic_map.topic)
+    return topics, inferred
+
+
+def _disturbing_article_ids(article_ids):
+    return {
+        article_id
+        for (article_id,) in ArticleClassification.query.with_entities(
+            ArticleClassification.article_id
+        ).filter(
+            ArticleClassification.article_id.in_(article_ids),
+            ArticleClassification.classification_type == ClassificationType.DISTURBING,
+        )
+    }
+
+
+def existing_documents(es, article_ids):
+    """
+    :return: dict of article id to the (ES id, source) of its document
+    """
+    found = {}
+    try:
+        response = es.search(
+            index=ES_ZINDEX,
+            body={
+                "query": {"terms": {"article_id": article_ids}},
+                "_source": ["article_id", "content", "sem_vec"],
+                # a few articles may have more than one document
+                "size": 2 * len(article_ids),
+            },
+        )
+    except NotFoundError:
+        # the index does not exist (yet)
+        return found
+    for hit in response["hits"]["hits"]:
+        article_id = int(hit["_source"]["article_id"])
+        found.setdefault(article_id, (hit["_id"], hit["_source"]))
+
+    # documents indexed before ES assigned the ids have the article id as id
+    missing = [str(each) for each in article_ids if each not in found]
+    if missing:
+        response = es.mget(
+            index=ES_ZINDEX,
+            ids=missing,
+            source_includes=["article_id", "content", "sem_vec"],
+        )
+        for doc in response["docs"]:
+            if doc.get("found"):
+                found[int(doc["_id"])] = (doc["_id"], doc["_source"])
+    return found
+
+
+def bulk_actions(articles, session, existing, progress, update_existing=True):
+    """
+    :param existing: the existing_documents of the articles
+    :return: the bulk actions that (re)index the articles
+    """
+    if not update_existing:
+        progress.skipped_existing += sum(1 for a in articles if a.id in existing)
+        articles = [a for a in articles if a.id not in existing]
+
+    to_embed = [
+        article
+        for article in articles
+        if embedding_generation_required(
+            article, existing[article.id][1] if article.id in existing else None
+        )
+    ]
+    embeddings = get_embeddings_from_texts(
+        (a.get_content(), a.language.name.lower()) for a in to_embed
+    )
+    embedding_of = {a.id: e for a, e in zip(to_embed, embeddings)}
+    disturbing = _disturbing_article_ids([a.id for a in articles])
+
+    actions = []
+    for article in articles:
+        es_id, current_doc = existing.get(article.id, (None, None))
+        sem_vec = embedding_of.get(article.id)
+        if article.id in embedding_of:
+            if sem_vec is None:
+                progress.errors += 1
+                continue
+            progress.embeddings_computed += 1
+        else:
+            progress.embeddings_reused += 1
+
+        try:
+            doc = document_from_article(
+                article,
+                session,
+                current_doc=current_doc,
+                topics=_topics_of(article),
+                is_disturbing=article.id in disturbing,
+                sem_vec=sem_vec,
+            )
+        except Exception as e:
+            progress.errors += 1
+            print(f"fail for: '{article.id}', {e}")
+            continue
+
+        if es_id:
+            actions.append(
+                {"_index": ES_ZINDEX, "_op_type": "update", "_id": es_id, "doc": doc}
+            )
+        else:
+            actions.append({"_index": ES_ZINDEX, "_op_type": "create", "_source": doc})
+    return actions
+
+
+def reindex_articles(
+    query,
+    session,
+    batch_size=REINDEX_BATCH_SIZE,
+    bulk_threads=REINDEX_BULK_THREADS,
+    update_existing=True,
+    limit=None,
+    checkpoint_path=None,
+    report=print,
+):
+    """
+    (Re)indexes the articles of the query, resuming after the last article
+    of the checkpoint, if there is one.
+
+    :param update_existing: if False, the articles that already have a
+        document are skipped
+    :param limit: stop after (about) that many articles
+    :return: the ReindexProgress
+    """
+    es = get_es_client()
+    progress = ReindexProgress.load(checkpoint_path)
+    if progress.last_article_id:
+        report(f"Resuming after article {progress.last_article_id}")
+
+    start = time.time() - progress.seconds
+    for articles in article_batches(query, batch_size, progress.last_article_id):
+        batch_start = time.time()
+        existing = existing_documents(es, [a.id for a in articles])
+        actions = bulk_actions(articles, session, existing, progress, update_existing)
+
+        for ok, info in parallel_bulk(
+            es,
+            actions,
+            thread_count=bulk_threads,
+            chunk_size=max(1, batch_size // bulk_threads),
+            raise_on_error=False,
+            raise_on_exception=False,
+        ):
+            if ok:
+                progress.indexed += 1
+            else:
+                progress.errors += 1
+                if len(progress.error_samples) < 20:
+                    progress.error_samples.append(str(info)[:500])
+
+        progress.articles += len(articles)
+        progress.last_article_id = articles[-1].id
+        progress.seconds = time.time() - start
+        if checkpoint_path:
+            progress.save(checkpoint_path)
+        # the articles of the batch are not needed anymore
+        session.expunge_all()
+
+        report(
+            f"{progress.articles} articles (up to id {progress.last_article_id}): "
+            f"{progress.indexed} indexed, {progress.skipped_existing} skipped, "
+            f"{progress.errors} errors | batch of {len(articles)} in "
+            f"{time.time() - batch_start:.1f}s | "
+            f"{progress.articles_per_second():.1f} articles/s"
+        )
+        if limit and progress.articles >= limit:
+            break
+
+    return progress
@@ -0,0 +1,154 @@
+"""
+
+Process-wide Elasticsearch client.
+
+Creating an `Elasticsearch` object is not free: every instance owns its own
+connection pool, so building one per call means a new TCP (and possibly TLS)
+handshake for every query. All the code that talks to ES should use
+`get_es_client()` instead, which lazily builds one client per worker process
+and reuses it from all the threads of that process.
+
+The client is keyed by pid because gunicorn forks its workers after the app
+is imported; sockets inherited from the parent must not be shared.
+
+The node class used by the client also counts requests, pool waits and
+latencies; `es_client_stats()` returns them for monitoring.
+
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from elastic_transport import Urllib3HttpNode
+from elasticsearch import Elasticsearch
+
+from zeeguu.core.elastic.settings import (
+    ES_CONN_STRING,
+    ES_CONNECTIONS_PER_NODE,
+    ES_REQUEST_TIMEOUT,
+    ES_MAX_RETRIES,
+    ES_RETRY_ON_TIMEOUT,
+)
+
+# Upper bounds (in ms) of the latency histogram buckets; the last
+# bucket collects everything slower than the largest bound
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class _ClientStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.failed_requests = 0
+            self.pool_waits = 0
+            self.total_latency_ms = 0.0
+            self.latency_histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, elapsed_ms, waited_for_pool, failed):
+        with self._lock:
+            self.requests += 1
+            if failed:
+                self.failed_requests += 1
+            if waited_for_pool:
+                self.pool_waits += 1
+            self.total_latency_ms += elapsed_ms
+            self.latency_histogram[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def as_dict(self):
+        with self._lock:
+            labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [
+                f">{LATENCY_BUCKETS_MS[-1]}ms"
+            ]
+            return {
+                "pid": os.getpid(),
+                "requests": self.requests,
+                "failed_requests": self.failed_requests,
+                "pool_waits": self.pool_waits,
+                "avg_latency_ms": (
+                    round(self.total_latency_ms / self.requests, 2)
+                    if self.requests
+                    else 0
+                ),
+                "latency_histogram": dict(zip(labels, self.latency_histogram)),
+            }
+
+
+_stats = _ClientStats()
+
+
+class InstrumentedHttpNode(Urllib3HttpNode):
+    """
+    The default urllib3 node, which additionally records every request
+    in the module level stats.
+
+    The urllib3 pool is created with block=True, so when no idle connection
+    is left in it, the request has to wait for another thread to return one.
+    We count those as pool waits; if they are frequent, the
+    ZEEGUU_ES_CONNECTIONS_PER_NODE setting is too low for the worker.
+    """
+
+    def perform_request(self, *args, **kwargs):
+        waited_for_pool = self._pool_is_exhausted()
+        start = time.time()
+        failed = True
+        try:
+            response = super().perform_request(*args, **kwargs)
+            failed = False
+            return response
+        finally:
+            _stats.record((time.time() - start) * 1000, waited_for_pool, failed)
+
+    def _pool_is_exhausted(self):
+        idle_connections = getattr(getattr(self, "pool", None), "pool", None)
+        if idle_connections is None:
+            return False
+        return idle_connections.qsize() == 0
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_es_client() -> Elasticsearch:
+    """
+    Returns the Elasticsearch client of the current process,
+    creating it on first use.
+    """
+    pid = os.getpid()
+    client = _clients.get(pid)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(pid)
+        if client is None:
+            # a client left over from the parent process (before a fork)
+            # must not be used in this one; we simply forget about it
+            _clients.clear()
+            client = Elasticsearch(
+                ES_CONN_STRING,
+                node_class=InstrumentedHttpNode,
+                connections_per_node=ES_CONNECTIONS_PER_NODE,
+                request_timeout=ES_REQUEST_TIMEOUT,
+                max_retries=ES_MAX_RETRIES,
+                retry_on_timeout=ES_RETRY_ON_TIMEOUT,
+            )
+            _clients[pid] = client
+        return client
+
+
+def es_client_stats():
+    stats = _stats.as_dict()
+    stats["connections_per_node"] = ES_CONNECTIONS_PER_NODE
+    stats["client_created"] = os.getpid() in _clients
+    return stats
+
+
+def reset_es_client_stats():
+    _stats.reset()
@@ -3,8 +3,8 @@ from zeeguu.core.model.article_url_keyword_map import ArticleUrlKeywordMap
 from zeeguu.core.model.article_topic_map import TopicOriginType, ArticleTopicMap
 from zeeguu.core.model.article_classification import ArticleClassification, ClassificationType
 
-from elasticsearch import Elasticsearch
-from zeeguu.core.elastic.settings import ES_CONN_STRING, ES_ZINDEX
+from zeeguu.core.elastic.client import get_es_client
+from zeeguu.core.elastic.settings import ES_ZINDEX
 from zeeguu.core.elastic.basic_ops import es_update, es_index, es_exists, es_delete
 from zeeguu.core.semantic_vector_api import (
     get_embedding_from_article,
@@ -22,7 +22,7 @@ def get_doc_in_es(es_id: str, get_source_dict=True, verbose=False):
     allowing ES to auto assign documents. It seems the generated ids can be alphanumeric,
     resembling hashes rather than integers.
     """
-    es = Elasticsearch(ES_CONN_STRING)
+    es = get_es_client()
     if es.exists(index=ES_ZINDEX, id=es_id):
         doc = es.get(index=ES_ZINDEX, id=es_id)
         return doc["_source"] if get_source_dict else doc
@@ -41,7 +41,7 @@ def get_article_hit_in_es(article_id, verbose=False):
      >>> "article_id" in hit
      >   True
     """
-    es = Elasticsearch(ES_CONN_STRING)
+    es = get_es_client()
     s = Search(using=es, index=ES_ZINDEX).query("match", article_id=article_id)
     response = s.execute()
     if len(response) > 1:
@@ -54,6 +54,29 @@ def get_article_hit_in_es(article_id, verbose=False):
     return response[0] if len(response) >= 1 else None
 
 
+def get_video_hit_in_es(video_id):
+    es = get_es_client()
+    s = Search(using=es, index=ES_ZINDEX).filter("term", video_id=video_id)
+    response = s.execute()
+    return response[0] if len(response) >= 1 else None
+
+
+def stored_sem_vec(article):
+    """
+    :return: the embedding in the ES document of the article, if the
+    document exists and its content is the current one; None otherwise
+    """
+    hit = get_article_hit_in_es(article.id)
+    if hit is None:
+        return None
+    current_doc = hit.to_dict()
+    if "sem_vec" not in current_doc:
+        return None
+    if embedding_generation_required(article, current_doc):
+        return None
+    return list(current_doc["sem_vec"])
+
+
 def find_topics_article(article_id, session):
     article_topics = (
         session.query(Topic)
@@ -106,7 +129,6 @@ def find_filter_url_keywords(article_id, session):
 
 def document_from_video(video, session, current_doc=None):
     topics, topics_inferred = find_topics_video(video.id, session)
-    embedding_generation_required = True
     video_text = video.get_content()
     summary = video_text[:MAX_CHAR_COUNT_IN_SUMMARY]
     doc = {
@@ -125,28 +147,46 @@ def document_from_video(video, session, current_doc=None):
         "language": video.language.name,
         "fk_difficulty": video.source.fk_difficulty,
     }
-    if not embedding_generation_required and current_doc is not None:
-        doc["sem_vec"] = current_doc["sem_vec"]
+    if not embedding_generation_required(video, current_doc):
+        doc["sem_vec"] = list(current_doc["sem_vec"])
     else:
         doc["sem_vec"] = get_embedding_from_video(video)
 
     return doc
 
 
-def document_from_article(article, session, current_doc=None):
-    topics, topics_inferred = find_topics_article(article.id, session)
-    embedding_generation_required = current_doc is None
+def embedding_generation_required(article_or_video, current_doc=None):
     # Embeddings only need to be re-computed if the document
     # doesn't exist or the text is updated.
     # This is the most expensive operation in the indexing process, so it
     # saves time by skipping it.
-    if current_doc is not None:
-        embedding_generation_required = current_doc["content"] != article.get_content()
+    if current_doc is None or "sem_vec" not in current_doc:
+        return True
+    return current_doc.get("content") != article_or_video.get_content()
+
+
+def document_from_article(
+    article,
+    session,
+    current_doc=None,
+    topics=None,
+    is_disturbing=None,
+    sem_vec=None,
+):
+    """
+    The bulk indexing passes the (topics, inferred topics), the disturbing
+    classification and the embedding it already looked up for a whole batch
+    of articles; otherwise they are looked up for this article.
+    """
+    if topics is None:
+        topics = find_topics_article(article.id, session)
+    topics, topics_inferred = topics
 
     # Check if article has disturbing content classification
-    is_disturbing = ArticleClassification.has_classification(
-        article, ClassificationType.DISTURBING
-    )
+    if is_disturbing is None:
+        is_disturbing = ArticleClassification.has_classification(
+            article, ClassificationType.DISTURBING
+        )
 
     doc = {
         "article_id": article.id,
@@ -168,7 +208,9 @@ def document_from_article(article, session, current_doc=None):
         "video": article.video,
         "is_disturbing": is_disturbing,
     }
-    if not embedding_generation_required and current_doc is not None:
+    if sem_vec is not None:
+        doc["sem_vec"] = sem_vec
+    elif not embedding_generation_required(article, current_doc):
         doc["sem_vec"] = list(current_doc["sem_vec"])
     else:
         doc["sem_vec"] = get_embedding_from_article(article)
@@ -177,12 +219,12 @@ def document_from_article(article, session, current_doc=None):
 
 def create_or_update_article(article, session):
 
-    pre_existing_hit = get_article_hit_in_es(article)
+    pre_existing_hit = get_article_hit_in_es(article.id)
 
     if pre_existing_hit:
-        doc = document_from_article(article, session, pre_existing_hit["_source"])
+        doc = document_from_article(article, session, pre_existing_hit.to_dict())
         # Note, this might be replaced with delete + index given that update is for specific fields
-        res = es_update(id=pre_existing_hit["_id"], body={"doc": doc})
+        res = es_update(id=pre_existing_hit.meta.id, body={"doc": doc})
     else:
         doc = document_from_article(article, session)
         res = es_index(body=doc)
@@ -192,8 +234,14 @@ def create_or_update_article(article, session):
 
 def index_video(video, session):
 
-    doc = document_from_video(video, session)
-    res = es_index(body=doc)
+    pre_existing_hit = get_video_hit_in_es(video.id)
+
+    if pre_existing_hit:
+        doc = document_from_video(video, session, pre_existing_hit.to_dict())
+        res = es_update(id=pre_existing_hit.meta.id, body={"doc": doc})
+    else:
+        doc = document_from_video(video, session)
+        res = es_index(body=doc)
     return res
 
 
@@ -5,3 +5,12 @@ import os
 ES_CONN_STRING = os.environ.get("ZEEGUU_ES_CONN_STRING", "http://127.0.0.1:9200")
 # what index to use in elasticsearch
 ES_ZINDEX = "zeeguu"
+
+# Connection pool and retry policy of the shared client (see client.py)
+# Each worker process keeps at most this many open HTTP connections to ES
+ES_CONNECTIONS_PER_NODE = int(os.environ.get("ZEEGUU_ES_CONNECTIONS_PER_NODE", 10))
+# Seconds before a single request to ES is considered timed out
+ES_REQUEST_TIMEOUT = float(os.environ.get("ZEEGUU_ES_REQUEST_TIMEOUT", 10))
+# How many times a failed request is retried on another connection
+ES_MAX_RETRIES = int(os.environ.get("ZEEGUU_ES_MAX_RETRIES", 2))
+ES_RETRY_ON_TIMEOUT = int(os.environ.get("ZEEGUU_ES_RETRY_ON_TIMEOUT", 1)) == 1
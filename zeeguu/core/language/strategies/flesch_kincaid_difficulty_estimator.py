@@ -1,4 +1,5 @@
 import nltk
+import os
 import pyphen
 import math
 
@@ -9,6 +10,9 @@ from zeeguu.core.util.text import split_words_from_text
 from zeeguu.core.model.language import Language
 from collections import Counter
 
+# bound of the memoized syllable counts, per language
+FK_SYLLABLE_CACHE_SIZE = int(os.environ.get("ZEEGUU_FK_SYLLABLE_CACHE_SIZE", 100000))
+
 
 class FleschKincaidDifficultyEstimator(DifficultyEstimatorStrategy):
     """
@@ -19,6 +23,12 @@ class FleschKincaidDifficultyEstimator(DifficultyEstimatorStrategy):
     AVERAGE_SYLLABLE_LENGTH = 2.5  # Simplifies the syllable counting
     CUSTOM_NAMES = ["fk", "fkindex", "flesch-kincaid"]
 
+    # language code -> pyphen.Pyphen; building one loads the whole
+    # hyphenation dictionary, so we do it once per language
+    _hyphenators = {}
+    # language code -> {word: number of syllables}
+    _syllable_counts = {}
+
     @classmethod
     def estimate_difficulty(cls, text: str, language: "Language", user: "User"):
         """
@@ -42,32 +52,66 @@ class FleschKincaidDifficultyEstimator(DifficultyEstimatorStrategy):
 
         return difficulty_scores
 
+    @classmethod
+    def estimate_difficulties(cls, texts: "list[str]", language: "Language"):
+        """
+        Same as estimate_difficulty, for many texts of the same language at once.
+        :rtype: list
+        :return: one difficulty dictionary per text, in the order of the texts
+        """
+        return [
+            dict(
+                normalized=cls.normalize_difficulty(index),
+                discrete=cls.discrete_difficulty(index),
+                grade=cls.grade_difficulty(index),
+                cefr_level=cls.discrete_difficulty_CEFR(index),
+            )
+            for index in cls.flesch_kincaid_readability_indices(texts, language)
+        ]
+
     @classmethod
     def flesch_kincaid_readability_index(cls, text: str, language: "Language"):
-        words = [w.lower() for w in split_words_from_text(text)]
+        return cls.flesch_kincaid_readability_indices([text], language)[0]
 
-        number_of_syllables = 0
-        number_of_words = len(words)
-        for word, freq in Counter(words).items():
-            syllables_in_word = cls.estimate_number_of_syllables_in_word_pyphen(
-                word, language
-            )
-            number_of_syllables += syllables_in_word * freq
+    @classmethod
+    def flesch_kincaid_readability_indices(
+        cls, texts: "list[str]", language: "Language"
+    ):
+        """
+        Computes the readability index of every text. The syllables of a word
+        are counted only once for the whole batch, and remembered for the
+        following batches of the same language.
+        """
+        word_counts_per_text = [
+            Counter(w.lower() for w in split_words_from_text(text)) for text in texts
+        ]
 
-        number_of_sentences = len(nltk.sent_tokenize(text))
+        unique_words = set()
+        for word_counts in word_counts_per_text:
+            unique_words.update(word_counts)
+        syllables = cls.syllables_in_words(unique_words, language)
 
         constants = cls.get_constants_for_language(language)
 
-        try:
-            index = (
-                constants["start"]
-                - constants["sentence"] * (number_of_words / number_of_sentences)
-                - constants["word"] * (number_of_syllables / number_of_words)
+        indices = []
+        for text, word_counts in zip(texts, word_counts_per_text):
+            number_of_words = sum(word_counts.values())
+            number_of_syllables = sum(
+                syllables[word] * freq for word, freq in word_counts.items()
             )
-        except ZeroDivisionError:
-            index = 0
+            number_of_sentences = len(nltk.sent_tokenize(text))
+
+            try:
+                index = (
+                    constants["start"]
+                    - constants["sentence"] * (number_of_words / number_of_sentences)
+                    - constants["word"] * (number_of_syllables / number_of_words)
+                )
+            except ZeroDivisionError:
+                index = 0
+            indices.append(index)
 
-        return index
+        return indices
 
     @classmethod
     def get_constants_for_language(cls, language: "language"):
@@ -100,19 +144,44 @@ class FleschKincaidDifficultyEstimator(DifficultyEstimatorStrategy):
     def estimate_number_of_syllables_in_word_pyphen(
         cls, word: str, language: "Language"
     ):
+        return cls.syllables_in_words([word], language)[word]
 
+    @classmethod
+    def syllables_in_words(cls, words, language: "Language"):
+        """
+        :return: dictionary from each of the words to its number of syllables
+        """
         if language.code == "zh-CN":
-            if len(word) < cls.AVERAGE_SYLLABLE_LENGTH:
-                syllables = 1  # Always at least 1 syllable
-            else:
-                syllables = len(word) / cls.AVERAGE_SYLLABLE_LENGTH
-            return int(math.floor(syllables))  # Truncate the number of syllables
-        else:
+            return {
+                word: cls.estimate_number_of_syllables_in_word(word, language)
+                for word in words
+            }
+
+        counts = cls._syllable_counts.setdefault(language.code, {})
+        hyphenator = None
+        result = {}
+        for word in words:
+            syllables = counts.get(word)
+            if syllables is None:
+                if hyphenator is None:
+                    hyphenator = cls._hyphenator_for(language)
+                syllables = len(hyphenator.positions(word)) + 1
+                if len(counts) >= FK_SYLLABLE_CACHE_SIZE:
+                    # a crude bound, but cheap and safe to share between threads
+                    counts.clear()
+                counts[word] = syllables
+            result[word] = syllables
+        return result
+
+    @classmethod
+    def _hyphenator_for(cls, language: "Language"):
+        hyphenator = cls._hyphenators.get(language.code)
+        if hyphenator is None:
             # pyphen can't hyphenate on 'no' - so we use 'nb' instead
             code = "nb" if language.code == "no" else language.code
-            dic = pyphen.Pyphen(lang=code)
-            syllables = len(dic.positions(word)) + 1
-            return syllables
+            hyphenator = pyphen.Pyphen(lang=code)
+            cls._hyphenators[language.code] = hyphenator
+        return hyphenator
 
     @classmethod
     def normalize_difficulty(cls, score: int):
@@ -68,6 +68,7 @@ from .topic_filter import TopicFilter
 
 from .user_reading_session import UserReadingSession
 from .user_exercise_session import UserExerciseSession
+from .user_activity_daily_rollup import UserActivityDailyRollup
 
 
 # bookmark scheduling
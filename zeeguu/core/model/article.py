@@ -479,19 +479,19 @@ class Article(db.Model):
             from zeeguu.core.model.context_type import ContextType
 
             from zeeguu.core.model.article_fragment import ArticleFragment
-            from zeeguu.core.tokenization import get_tokenizer, TOKENIZER_MODEL
+            from zeeguu.core.tokenization.zeeguu_tokenizer import ZeeguuTokenizer
+
+            fragments = ArticleFragment.get_all_article_fragments_in_order(self.id)
+            tokenized = self.get_tokenized_content(fragments)
 
-            tokenizer = get_tokenizer(self.language, TOKENIZER_MODEL)
             content = self.get_content()
             result_dict["content"] = content
             result_dict["htmlContent"] = self.htmlContent
-            result_dict["paragraphs"] = tokenizer.split_into_paragraphs(content)
-            result_dict["tokenized_paragraphs"] = tokenizer.tokenize_text(
-                content, flatten=False
-            )
+            result_dict["paragraphs"] = ZeeguuTokenizer.split_into_paragraphs(content)
+            result_dict["tokenized_paragraphs"] = tokenized["tokenized_paragraphs"]
             result_dict["tokenized_fragments"] = []
 
-            for fragment in ArticleFragment.get_all_article_fragments_in_order(self.id):
+            for fragment, tokens in zip(fragments, tokenized["tokenized_fragments"]):
                 result_dict["tokenized_fragments"].append(
                     {
                         "context_identifier": ContextIdentifier(
@@ -499,9 +499,7 @@ class Article(db.Model):
                             article_fragment_id=fragment.id,
                         ).as_dictionary(),
                         "formatting": fragment.formatting,
-                        "tokens": tokenizer.tokenize_text(
-                            fragment.text.content, flatten=False
-                        ),
+                        "tokens": tokens,
                     }
                 )
 
@@ -511,11 +509,9 @@ class Article(db.Model):
                     ContextType.ARTICLE_TITLE,
                     article_id=self.id,
                 ).as_dictionary(),
-                "tokens": tokenizer.tokenize_text(self.title, flatten=False),
+                "tokens": tokenized["tokenized_title"],
             }
-            result_dict["tokenized_title"] = tokenizer.tokenize_text(
-                self.title, flatten=False
-            )
+            result_dict["tokenized_title"] = tokenized["tokenized_title"]
 
         result_dict["has_uploader"] = True if self.uploader_id else False
 
@@ -525,6 +521,47 @@ class Article(db.Model):
 
         return result_dict
 
+    def get_tokenized_content(self, fragments):
+        """
+            The tokenized paragraphs, fragments and title of the article.
+
+            Served from the ArticleTokenizationCache when it was computed
+            for the current content and tokenizer; otherwise tokenized
+            and saved in the cache for the next reader.
+        """
+        from zeeguu.core.model.article_tokenization_cache import (
+            ArticleTokenizationCache,
+        )
+        from zeeguu.core.tokenization import (
+            get_tokenizer,
+            get_tokenizer_version,
+            TOKENIZER_MODEL,
+        )
+
+        content_hash = ArticleTokenizationCache.content_hash_for(self, fragments)
+        tokenizer_version = get_tokenizer_version(TOKENIZER_MODEL)
+
+        cache = self.tokenization_cache
+        if cache:
+            tokenized = cache.get_tokenized_content(content_hash, tokenizer_version)
+            if tokenized is not None:
+                return tokenized
+
+        tokenizer = get_tokenizer(self.language, TOKENIZER_MODEL)
+        tokenized = ArticleTokenizationCache.tokenize_content(
+            self, fragments, tokenizer
+        )
+        if tokenizer.degraded:
+            return tokenized
+
+        if not cache:
+            cache = ArticleTokenizationCache(article_id=self.id)
+        cache.set_tokenized_content(content_hash, tokenizer_version, tokenized)
+        db.session.add(cache)
+        # Don't commit here - let Flask teardown handle it to avoid transaction conflicts
+
+        return tokenized
+
     def article_info_for_teacher(self):
         from zeeguu.core.model import CohortArticleMap
 
@@ -1201,6 +1238,43 @@ class Article(db.Model):
     def find_by_id(cls, id: int):
         return Article.query.filter(Article.id == id).first()
 
+    @classmethod
+    def find_by_ids(cls, ids: "list[int]"):
+        """
+            Loads all the articles with the given ids in a single query,
+            together with the relationships that article_info needs, so that
+            rendering a list of articles does not lazy load them one by one.
+
+        :return: dict from article id to article; missing ids are absent
+        """
+        if not ids:
+            return {}
+
+        articles = (
+            Article.query.filter(Article.id.in_(set(ids)))
+            .options(*cls.article_info_loader_options())
+            .all()
+        )
+        return {article.id: article for article in articles}
+
+    @classmethod
+    def article_info_loader_options(cls):
+        """
+            The eager loading options for the relationships used by article_info
+        """
+        from sqlalchemy.orm import joinedload, selectinload
+
+        return [
+            joinedload(Article.source),
+            joinedload(Article.cefr_assessment),
+            joinedload(Article.feed),
+            joinedload(Article.url),
+            joinedload(Article.img_url),
+            joinedload(Article.language),
+            joinedload(Article.uploader),
+            selectinload(Article.topics).joinedload(ArticleTopicMap.topic),
+        ]
+
     @classmethod
     def find_by_source_id(cls, source_id: int):
         return Article.query.filter(Article.source_id == source_id).first()
@@ -56,6 +56,22 @@ class ArticleDifficultyFeedback(db.Model):
         except NoResultFound:
             return None
 
+    @classmethod
+    def find_for_user_and_articles(cls, user: User, article_ids):
+        """
+        :return: dict from article id to the latest feedback of the user
+        """
+        if not article_ids:
+            return {}
+        latest = {}
+        for each in (
+            cls.query.filter(cls.user_id == user.id)
+            .filter(cls.article_id.in_(article_ids))
+            .order_by(cls.date.desc())
+        ):
+            latest.setdefault(each.article_id, each)
+        return latest
+
     @classmethod
     def find_or_create(
         cls, session, user: User, article: Article, date: datetime, difficulty
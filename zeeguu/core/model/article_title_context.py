@@ -73,3 +73,30 @@ class ArticleTitleContext(db.Model):
         ).all()
 
         return [each.to_json(True) if as_json_serializable else each for each in result]
+
+    @classmethod
+    def get_all_user_bookmarks_for_article_titles(
+        cls, user_id: int, article_ids, as_json_serializable: bool = True
+    ):
+        """
+        Same as get_all_user_bookmarks_for_article_title, for many articles at once.
+        :return: dict from article id to the list of bookmarks
+        """
+        from zeeguu.core.model.user_word import UserWord
+
+        if not article_ids:
+            return {}
+
+        result = {}
+        for article_id, bookmark in (
+            db.session.query(ArticleTitleContext.article_id, Bookmark)
+            .select_from(Bookmark)
+            .join(ArticleTitleContext, ArticleTitleContext.bookmark_id == Bookmark.id)
+            .join(UserWord, Bookmark.user_word_id == UserWord.id)
+            .filter(ArticleTitleContext.article_id.in_(article_ids))
+            .filter(UserWord.user_id == user_id)
+        ):
+            result.setdefault(article_id, []).append(
+                bookmark.to_json(True) if as_json_serializable else bookmark
+            )
+        return result
@@ -1,4 +1,7 @@
-from sqlalchemy import Column, Integer, UnicodeText, ForeignKey, DateTime
+import hashlib
+import json
+
+from sqlalchemy import Column, Integer, UnicodeText, ForeignKey, DateTime, String
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from zeeguu.core.model.db import db
@@ -9,6 +12,11 @@ class ArticleTokenizationCache(db.Model):
     Caches tokenized summary and title for articles to avoid expensive CPU-bound
     Stanza tokenization on every request.
 
+    The full content tokenization (paragraphs, fragments and title, as needed by
+    article_info with_content) is cached too. It is only valid for the
+    content_hash and tokenizer_version it was computed with, so editing the
+    article or upgrading the tokenizer invalidates it without further ado.
+
     1-to-1 relationship with Article - keeps article table lean while providing
     fast lookups for cached tokenization.
     """
@@ -17,6 +25,9 @@ class ArticleTokenizationCache(db.Model):
     article_id = Column(Integer, ForeignKey("article.id", ondelete="CASCADE"), primary_key=True)
     tokenized_summary = Column(UnicodeText)
     tokenized_title = Column(UnicodeText)
+    tokenized_content = Column(UnicodeText)
+    content_hash = Column(String(64))
+    tokenizer_version = Column(String(64))
     created_at = Column(DateTime, default=datetime.now)
 
     article = relationship("Article", back_populates="tokenization_cache")
@@ -30,7 +41,73 @@ class ArticleTokenizationCache(db.Model):
             session.add(cache)
         return cache
 
+    @classmethod
+    def find_or_create_many(cls, session, articles):
+        """Same as find_or_create, for many articles; returns dict from article id to cache"""
+        ids = {article.id for article in articles}
+        if not ids:
+            return {}
+        caches = {
+            cache.article_id: cache
+            for cache in session.query(cls).filter(cls.article_id.in_(ids))
+        }
+        for article_id in ids - caches.keys():
+            cache = cls(article_id=article_id)
+            session.add(cache)
+            caches[article_id] = cache
+        return caches
+
     @classmethod
     def get_for_article(cls, session, article_id):
         """Get cache for article, returns None if not found"""
         return session.query(cls).filter_by(article_id=article_id).first()
+
+    @classmethod
+    def content_hash_for(cls, article, fragments):
+        """Hash of everything that the full content tokenization depends on"""
+        digest = hashlib.sha256()
+        for each in [article.title or "", article.get_content() or ""]:
+            digest.update(each.encode("utf-8"))
+            digest.update(b"\0")
+        for fragment in fragments:
+            digest.update(f"{fragment.order}:{fragment.formatting}:".encode("utf-8"))
+            digest.update(fragment.text.content.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @classmethod
+    def tokenize_content(cls, article, fragments, tokenizer):
+        """
+        The tokenization article_info needs for the reader; the fragment
+        tokens are in the same order as the fragments
+        """
+        tokenized_content, tokenized_title, *tokenized_fragments = (
+            tokenizer.tokenize_many(
+                [article.get_content(), article.title]
+                + [fragment.text.content for fragment in fragments],
+                flatten=False,
+            )
+        )
+        return {
+            "tokenized_paragraphs": tokenized_content,
+            "tokenized_fragments": tokenized_fragments,
+            "tokenized_title": tokenized_title,
+        }
+
+    def get_tokenized_content(self, content_hash, tokenizer_version):
+        """Returns the cached full content tokenization, or None if outdated"""
+        if (
+            not self.tokenized_content
+            or self.content_hash != content_hash
+            or self.tokenizer_version != tokenizer_version
+        ):
+            return None
+        try:
+            return json.loads(self.tokenized_content)
+        except (json.JSONDecodeError, TypeError):
+            return None
+
+    def set_tokenized_content(self, content_hash, tokenizer_version, tokenized):
+        self.tokenized_content = json.dumps(tokenized)
+        self.content_hash = content_hash
+        self.tokenizer_version = tokenizer_version
@@ -75,6 +75,24 @@ class ArticleTopicUserFeedback(db.Model):
         except sqlalchemy.orm.exc.NoResultFound:
             return None
 
+    @classmethod
+    def find_for_user_and_articles(cls, user: User, article_ids):
+        """
+        :return: dict from article id to the list of feedbacks of the user
+        """
+        from sqlalchemy.orm import joinedload
+
+        if not article_ids:
+            return {}
+        result = {}
+        for each in (
+            cls.query.filter(cls.user_id == user.id)
+            .filter(cls.article_id.in_(article_ids))
+            .options(joinedload(cls.topic))
+        ):
+            result.setdefault(each.article_id, []).append(each)
+        return result
+
     @classmethod
     def all_for_user(cls, user):
         return cls.query.filter(cls.user == user).all()
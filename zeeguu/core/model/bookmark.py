@@ -474,6 +474,23 @@ class Bookmark(db.Model):
             .all()
         )
 
+    @classmethod
+    def find_all_for_user_and_sources(cls, user, source_ids):
+        """
+        :return: dict from source id to the bookmarks of the user in it
+        """
+        source_ids = [each for each in source_ids if each is not None]
+        if not source_ids:
+            return {}
+        result = {}
+        for each in (
+            cls.query.join(UserWord, Bookmark.user_word_id == UserWord.id)
+            .filter(UserWord.user_id == user.id)
+            .filter(Bookmark.source_id.in_(source_ids))
+        ):
+            result.setdefault(each.source_id, []).append(each)
+        return result
+
     @classmethod
     def find_all_for_text_and_user(cls, text, user):
         # TODO: Tiago remember to also delete the only places that calls this
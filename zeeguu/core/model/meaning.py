@@ -1,3 +1,4 @@
+import os
 from enum import Enum
 
 from sqlalchemy.exc import NoResultFound
@@ -235,56 +236,66 @@ class Meaning(db.Model):
         """
         Classify meaning frequency and phrase type asynchronously.
         """
-        import threading
+        _meaning_classification_queue().submit(meaning_id)
+
+    @classmethod
+    def _classify_meanings_in_background(cls, meaning_ids):
+        """
+        Runs in a worker thread of the meaning classification queue.
+        """
         from zeeguu.core.model.meaning_frequency_classifier import (
             MeaningFrequencyClassifier,
         )
 
-        def classify_in_background():
-            try:
+        # Import Flask app to create proper application context
+        import zeeguu.core
 
-                # Import Flask app to create proper application context
-                import zeeguu.core
-
-                app = zeeguu.core.app
-
-                # Create application context for this thread
-                with app.app_context():
-
-                    # Import db within the app context
-                    from zeeguu.core.model import db
-
-                    # Get meaning using the thread-safe session
-                    meaning = db.session.query(cls).get(meaning_id)
-
-                    if meaning and (not meaning.frequency or not meaning.phrase_type):
-                        try:
-                            classifier = MeaningFrequencyClassifier()
-                            classifier.classify_and_update_meaning(meaning, db.session)
-                            logp(
-                                f">>> Successfully classified meaning {meaning.origin.content} as {meaning.frequency},{meaning.phrase_type} in background"
-                            )
-                        except ValueError as ve:
-                            logp(
-                                f"Classification disabled for meaning {meaning_id}: {str(ve)}"
-                            )
-                        except Exception as ce:
-                            logp(
-                                f"Classification failed for meaning {meaning_id}: {str(ce)}"
-                            )
-                    else:
-                        print(
-                            f">>>> Meaning {meaning_id} already classified or not found"
-                        )
+        app = zeeguu.core.app
 
-            except Exception as e:
-                logp(f"Error classifying meaning {meaning_id} in background: {str(e)}")
+        # Create application context for this thread
+        with app.app_context():
 
-        # Start background thread
-        thread = threading.Thread(target=classify_in_background)
-        thread.daemon = True  # Thread will die when main program exits
-        thread.start()
-        print(f">>>> Classification thread started for meaning {meaning_id}")
+            # Import db within the app context
+            from zeeguu.core.model import db
+
+            try:
+                meanings = [
+                    meaning
+                    for meaning in db.session.query(cls)
+                    .filter(cls.id.in_(meaning_ids))
+                    .all()
+                    if not meaning.frequency or not meaning.phrase_type
+                ]
+                if not meanings:
+                    print(f">>>> Meanings {meaning_ids} already classified or not found")
+                    return
+
+                try:
+                    classifier = MeaningFrequencyClassifier()
+                except ValueError as ve:
+                    logp(f"Classification disabled for meanings {meaning_ids}: {str(ve)}")
+                    return
+
+                if len(meanings) > 1:
+                    classifier.classify_and_update_meanings_batch(meanings, db.session)
+
+                # the single item prompt is more reliable; it's used for
+                # lone meanings and for those that the batch failed to classify
+                for meaning in meanings:
+                    if meaning.frequency:
+                        continue
+                    try:
+                        classifier.classify_and_update_meaning(meaning, db.session)
+                    except Exception as ce:
+                        logp(f"Classification failed for meaning {meaning.id}: {str(ce)}")
+
+                for meaning in meanings:
+                    if meaning.frequency:
+                        logp(
+                            f">>> Successfully classified meaning {meaning.origin.content} as {meaning.frequency},{meaning.phrase_type} in background"
+                        )
+            except Exception as e:
+                logp(f"Error classifying meanings {meaning_ids} in background: {str(e)}")
 
     @classmethod
     def exists(cls, origin, translation):
@@ -293,3 +304,25 @@ class Meaning(db.Model):
             return True
         except NoResultFound:
             return False
+
+
+_classification_queue = None
+
+
+def _meaning_classification_queue():
+    global _classification_queue
+    if _classification_queue is None:
+        from zeeguu.core.background_jobs import BackgroundJobQueue
+
+        _classification_queue = BackgroundJobQueue(
+            "meaning-classification",
+            Meaning._classify_meanings_in_background,
+            workers=int(os.environ.get("ZEEGUU_MEANING_CLASSIFICATION_WORKERS", 2)),
+            max_pending=int(
+                os.environ.get("ZEEGUU_MEANING_CLASSIFICATION_MAX_PENDING", 1000)
+            ),
+            max_batch_size=int(
+                os.environ.get("ZEEGUU_MEANING_CLASSIFICATION_BATCH_SIZE", 15)
+            ),
+        )
+    return _classification_queue
@@ -32,6 +32,20 @@ class PersonalCopy(db.Model):
             PersonalCopy.query.filter_by(user_id=user.id, article_id=article.id).all()
         )
 
+    @classmethod
+    def article_ids_saved_by(cls, user, article_ids):
+        """
+        :return: the subset of the article_ids of which the user has a copy
+        """
+        if not article_ids:
+            return set()
+        return {
+            article_id
+            for (article_id,) in db.session.query(PersonalCopy.article_id)
+            .filter(PersonalCopy.user_id == user.id)
+            .filter(PersonalCopy.article_id.in_(article_ids))
+        }
+
     @classmethod
     def get_page_for(cls, user, page):
         return (
@@ -0,0 +1,361 @@
+from datetime import datetime
+
+from sqlalchemy import UniqueConstraint, event, select
+from sqlalchemy.orm.attributes import get_history
+
+from zeeguu.core.model.article import Article
+from zeeguu.core.model.bookmark import Bookmark
+from zeeguu.core.model.db import db
+from zeeguu.core.model.exercise import Exercise
+from zeeguu.core.model.exercise_outcome import ExerciseOutcome
+from zeeguu.core.model.language import Language
+from zeeguu.core.model.meaning import Meaning
+from zeeguu.core.model.phrase import Phrase
+from zeeguu.core.model.user import User
+from zeeguu.core.model.user_exercise_session import UserExerciseSession
+from zeeguu.core.model.user_reading_session import UserReadingSession
+from zeeguu.core.model.user_word import UserWord
+
+
+class UserActivityDailyRollup(db.Model):
+    """
+    The activity of a user in a day and language, so that the history of
+    a user and the statistics of a class can be computed without
+    aggregating all their sessions and exercises.
+
+    The language is the one of the article for the reading time, and the
+    one of the word for the exercises, translations and learned words. An
+    exercise session does not have a language of its own: its time counts
+    in the language of each of the words exercised in it, as the teacher
+    dashboard always did.
+
+    The counters are updated by the listeners at the end of the module
+    whenever the underlying rows are inserted, updated or deleted through
+    the ORM; bulk deletes bypass them, so the rollup of the affected users
+    must then be recomputed with tools/backfill_user_activity_daily_rollup.py
+    which also computes the rows of the activity before the table existed.
+    """
+
+    __tablename__ = "user_activity_daily_rollup"
+    __table_args__ = (
+        UniqueConstraint("user_id", "date", "language_id"),
+        {"mysql_collate": "utf8_bin"},
+    )
+
+    COUNTERS = [
+        "reading_ms",
+        "exercise_ms",
+        "exercises",
+        "correct_first_try",
+        "translations",
+        "learned_words",
+    ]
+
+    # the outcomes that the teacher dashboard counts as correct on the first try
+    CORRECT_FIRST_TRY_OUTCOMES = [ExerciseOutcome.CORRECT, "Correct"]
+
+    id = db.Column(db.Integer, primary_key=True)
+
+    user_id = db.Column(db.Integer, db.ForeignKey(User.id), nullable=False)
+    user = db.relationship(User)
+
+    date = db.Column(db.Date, nullable=False)
+
+    language_id = db.Column(db.Integer, db.ForeignKey(Language.id), nullable=False)
+    language = db.relationship(Language)
+
+    reading_ms = db.Column(db.BigInteger, nullable=False, default=0)
+    exercise_ms = db.Column(db.BigInteger, nullable=False, default=0)
+    exercises = db.Column(db.Integer, nullable=False, default=0)
+    correct_first_try = db.Column(db.Integer, nullable=False, default=0)
+    translations = db.Column(db.Integer, nullable=False, default=0)
+    learned_words = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (
+            f"<UserActivityDailyRollup u:{self.user_id} {self.date} "
+            f"l:{self.language_id}>"
+        )
+
+    @classmethod
+    def increment(cls, connection, user_id, date, language_id, **deltas):
+        """
+        Adds the deltas to the counters of the user in the given date (or
+        the date of the given datetime) and language, creating the row if
+        needed, with a single upsert statement.
+        """
+        deltas = {k: int(v) for k, v in deltas.items() if v}
+        if user_id is None or date is None or language_id is None or not deltas:
+            return
+        if isinstance(date, datetime):
+            date = date.date()
+
+        table = cls.__table__
+        values = dict(user_id=user_id, date=date, language_id=language_id)
+        values.update({counter: deltas.get(counter, 0) for counter in cls.COUNTERS})
+
+        if connection.dialect.name in ["mysql", "mariadb"]:
+            from sqlalchemy.dialects.mysql import insert
+
+            statement = insert(table).values(values)
+            statement = statement.on_duplicate_key_update(
+                {k: table.c[k] + statement.inserted[k] for k in deltas}
+            )
+        else:
+            if connection.dialect.name == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            statement = insert(table).values(values)
+            statement = statement.on_conflict_do_update(
+                index_elements=["user_id", "date", "language_id"],
+                set_={k: table.c[k] + statement.excluded[k] for k in deltas},
+            )
+
+        connection.execute(statement)
+
+
+def _changed_value(target, attribute, is_insert):
+    """
+    :return: (old, new) values of the attribute in the current flush,
+        or None if it did not change or the old value is not known
+    """
+    history = get_history(target, attribute)
+    if not history.added:
+        return None
+    if is_insert:
+        return None, history.added[0]
+    if not history.deleted:
+        return None
+    return history.deleted[0], history.added[0]
+
+
+def _ms(duration):
+    # the durations are computed as floats, but saved (rounded) as integers
+    return round(duration or 0)
+
+
+def _load_old_value_on_set(attribute):
+    # without this, setting an attribute that was expired (e.g. by a commit)
+    # does not load its old value, and the change could not be computed
+    event.listen(attribute, "set", lambda *args: None, active_history=True)
+
+
+def _user_and_language_of_user_word(connection, user_word_id):
+    row = connection.execute(
+        select(UserWord.user_id, Phrase.language_id)
+        .join(Meaning, UserWord.meaning_id == Meaning.id)
+        .join(Phrase, Meaning.origin_id == Phrase.id)
+        .where(UserWord.id == user_word_id)
+    ).first()
+    return (row[0], row[1]) if row else (None, None)
+
+
+def _exercised_languages(connection, session_id, except_exercise_id=None):
+    """
+    :return: the languages of the words exercised in the session, as they
+        are in the database, without the given exercise
+    """
+    query = (
+        select(Phrase.language_id)
+        .distinct()
+        .select_from(Exercise)
+        .join(UserWord, Exercise.user_word_id == UserWord.id)
+        .join(Meaning, UserWord.meaning_id == Meaning.id)
+        .join(Phrase, Meaning.origin_id == Phrase.id)
+        .where(Exercise.session_id == session_id)
+    )
+    if except_exercise_id is not None:
+        query = query.where(Exercise.id != except_exercise_id)
+    return [language_id for (language_id,) in connection.execute(query)]
+
+
+def _languages_of_reading_session(connection, target):
+    return [
+        connection.scalar(
+            select(Article.language_id).where(Article.id == target.article_id)
+        )
+    ]
+
+
+def _languages_of_exercise_session(connection, target):
+    return _exercised_languages(connection, target.id)
+
+
+def _session_duration_listener(counter, languages_of, is_insert):
+    def listener(mapper, connection, target):
+        change = _changed_value(target, "duration", is_insert)
+        if change is None or target.start_time is None:
+            return
+        old, new = change
+        for language_id in languages_of(connection, target):
+            UserActivityDailyRollup.increment(
+                connection,
+                target.user_id,
+                target.start_time,
+                language_id,
+                **{counter: _ms(new) - _ms(old)},
+            )
+
+    return listener
+
+
+def _session_deleted_listener(counter, languages_of):
+    # before the delete, so that the row and the article can still be read
+    def listener(mapper, connection, target):
+        if target.start_time is None:
+            return
+        for language_id in languages_of(connection, target):
+            UserActivityDailyRollup.increment(
+                connection,
+                target.user_id,
+                target.start_time,
+                language_id,
+                **{counter: -_ms(target.duration)},
+            )
+
+    return listener
+
+
+for _session_class, _counter, _languages_of in [
+    (UserReadingSession, "reading_ms", _languages_of_reading_session),
+    (UserExerciseSession, "exercise_ms", _languages_of_exercise_session),
+]:
+    _load_old_value_on_set(_session_class.duration)
+    event.listen(
+        _session_class,
+        "after_insert",
+        _session_duration_listener(_counter, _languages_of, True),
+    )
+    event.listen(
+        _session_class,
+        "after_update",
+        _session_duration_listener(_counter, _languages_of, False),
+    )
+    event.listen(
+        _session_class,
+        "before_delete",
+        _session_deleted_listener(_counter, _languages_of),
+    )
+
+
+def _exercise_session_time(connection, target, language_id, sign):
+    """
+    The first exercise of a language in a session adds the time of the
+    session (so far) to that language, and deleting the last one removes
+    it; the later changes of the duration are added by the session listener
+    to all the languages already exercised in it.
+    """
+    if target.session_id is None or language_id is None:
+        return
+    if language_id in _exercised_languages(
+        connection, target.session_id, except_exercise_id=target.id
+    ):
+        return
+    session = connection.execute(
+        select(
+            UserExerciseSession.user_id,
+            UserExerciseSession.start_time,
+            UserExerciseSession.duration,
+        ).where(UserExerciseSession.id == target.session_id)
+    ).first()
+    if session is None or session.start_time is None:
+        return
+    UserActivityDailyRollup.increment(
+        connection,
+        session.user_id,
+        session.start_time,
+        language_id,
+        exercise_ms=sign * _ms(session.duration),
+    )
+
+
+def _exercise_counters(connection, target, sign):
+    if target.time is None:
+        return
+    outcome = target.__dict__.get("outcome")
+    outcome = (
+        outcome.outcome
+        if outcome is not None
+        else connection.scalar(
+            select(ExerciseOutcome.outcome).where(
+                ExerciseOutcome.id == target.outcome_id
+            )
+        )
+    )
+    user_id, language_id = _user_and_language_of_user_word(
+        connection, target.user_word_id
+    )
+    UserActivityDailyRollup.increment(
+        connection,
+        user_id,
+        target.time,
+        language_id,
+        exercises=sign,
+        correct_first_try=(
+            sign if outcome in UserActivityDailyRollup.CORRECT_FIRST_TRY_OUTCOMES else 0
+        ),
+    )
+    _exercise_session_time(connection, target, language_id, sign)
+
+
+@event.listens_for(Exercise, "after_insert")
+def _exercise_inserted(mapper, connection, target):
+    _exercise_counters(connection, target, 1)
+
+
+@event.listens_for(Exercise, "before_delete")
+def _exercise_deleted(mapper, connection, target):
+    _exercise_counters(connection, target, -1)
+
+
+def _bookmark_counters(connection, target, sign):
+    if target.time is None:
+        return
+    user_id, language_id = _user_and_language_of_user_word(
+        connection, target.user_word_id
+    )
+    UserActivityDailyRollup.increment(
+        connection, user_id, target.time, language_id, translations=sign
+    )
+
+
+@event.listens_for(Bookmark, "after_insert")
+def _bookmark_inserted(mapper, connection, target):
+    _bookmark_counters(connection, target, 1)
+
+
+@event.listens_for(Bookmark, "before_delete")
+def _bookmark_deleted(mapper, connection, target):
+    _bookmark_counters(connection, target, -1)
+
+
+_load_old_value_on_set(UserWord.learned_time)
+
+
+@event.listens_for(UserWord, "after_update")
+def _user_word_updated(mapper, connection, target):
+    change = _changed_value(target, "learned_time", False)
+    if change is None:
+        return
+    old, new = change
+    user_id, language_id = _user_and_language_of_user_word(connection, target.id)
+    if old is None and new is not None:
+        UserActivityDailyRollup.increment(
+            connection, user_id, new, language_id, learned_words=1
+        )
+    elif old is not None and new is None:
+        UserActivityDailyRollup.increment(
+            connection, user_id, old, language_id, learned_words=-1
+        )
+
+
+@event.listens_for(UserWord, "before_delete")
+def _user_word_deleted(mapper, connection, target):
+    if target.learned_time is None:
+        return
+    user_id, language_id = _user_and_language_of_user_word(connection, target.id)
+    UserActivityDailyRollup.increment(
+        connection, user_id, target.learned_time, language_id, learned_words=-1
+    )
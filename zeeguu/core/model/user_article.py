@@ -275,15 +275,16 @@ class UserArticle(db.Model):
 
         user_articles = cls.all_starred_or_liked_articles_of_user(user)
 
-        return [
-            cls.user_article_info(
-                user,
-                cls.select_appropriate_article_for_user(user, each.article),
-                with_translations=False,
-            )
+        articles = [
+            each.article
             for each in user_articles
             if each.last_interaction() is not None
         ]
+        return cls.user_article_info_many(
+            user,
+            cls.select_appropriate_articles_for_user(user, articles),
+            with_translations=False,
+        )
 
     @classmethod
     def exists(cls, obj):
@@ -374,6 +375,35 @@ class UserArticle(db.Model):
 
         return article.get_appropriate_version_for_user_level(user_cefr_level)
 
+    @classmethod
+    def select_appropriate_articles_for_user(
+        cls, user: User, articles: "list[Article]"
+    ) -> "list[Article]":
+        """
+        Same as select_appropriate_article_for_user, for a whole page of
+        articles: the simplified versions of all of them are loaded at once.
+        """
+        from sqlalchemy.orm import joinedload, selectinload
+
+        try:
+            user_cefr_level = user.cefr_level_for_learned_language()
+        except (AttributeError, IndexError, TypeError):
+            user_cefr_level = None
+
+        if user_cefr_level and articles:
+            original_ids = {a.parent_article_id or a.id for a in articles}
+            Article.query.filter(Article.id.in_(original_ids)).options(
+                joinedload(Article.cefr_assessment),
+                selectinload(Article.simplified_versions).options(
+                    *Article.article_info_loader_options()
+                ),
+            ).all()
+
+        return [
+            article.get_appropriate_version_for_user_level(user_cefr_level)
+            for article in articles
+        ]
+
     @classmethod
     def user_article_info(
         cls, user: User, article: Article, with_content=False, with_translations=True, with_summary=True
@@ -389,6 +419,26 @@ class UserArticle(db.Model):
             with_translations: Whether to include translation data
             with_summary: Whether to include tokenized summary/title (default True for homepage performance)
         """
+        return cls.user_article_info_many(
+            user,
+            [article],
+            with_content=with_content,
+            with_translations=with_translations,
+            with_summary=with_summary,
+        )[0]
+
+    @classmethod
+    def user_article_info_many(
+        cls, user: User, articles: "list[Article]", with_content=False, with_translations=True, with_summary=True
+    ):
+        """
+        Same as user_article_info, for a list of articles, e.g. a page of
+        recommendations. The user specific data of all the articles is
+        prefetched with one query per kind of data, whatever the number of
+        articles.
+
+        :return: list of article infos, in the order of the articles
+        """
 
         from zeeguu.core.model.bookmark import Bookmark
         from zeeguu.core.model.article_title_context import ArticleTitleContext
@@ -396,115 +446,182 @@ class UserArticle(db.Model):
             ArticleFragmentContext,
         )
 
-        # Initialize returned info with the article info
-        # Use teacher version if user is a teacher (includes CEFR assessments)
-        if user.isTeacher():
-            returned_info = article.article_info_for_teacher()
-            # Merge content if requested
-            if with_content:
-                content_info = article.article_info(with_content=True)
-                returned_info.update(
-                    {
-                        k: v
-                        for k, v in content_info.items()
-                        if k.startswith("content")
-                        or k.startswith("tokenized")
-                        or k == "paragraphs"
-                        or k == "htmlContent"
-                    }
-                )
-        else:
-            returned_info = article.article_info(with_content=with_content)
-        user_article_info = UserArticle.find(user, article)
-        user_diff_feedback = ArticleDifficultyFeedback.find(user, article)
-        user_topics_feedback = ArticleTopicUserFeedback.find_given_user_article(
-            article, user
-        )
-        if user_topics_feedback:
-            article_topic_list = returned_info["topics_list"]
-            topic_list = []
-            topics_to_remove = set(
-                [
-                    untf.topic.title
-                    for untf in user_topics_feedback
-                    if untf.feedback == ArticleTopicUserFeedback.DO_NOT_SHOW_FEEDBACK
-                ]
+        article_ids = list({article.id for article in articles})
+
+        user_articles = {
+            each.article_id: each
+            for each in cls.query.filter(cls.user_id == user.id).filter(
+                cls.article_id.in_(article_ids)
             )
-            for each in article_topic_list:
-                title, _ = each
-                if title not in topics_to_remove:
-                    topic_list.append(each)
-            returned_info["topics_list"] = topic_list
-            returned_info["topics"] = ",".join([t for t, _ in topic_list])
-
-        if not user_article_info:
-            returned_info["starred"] = False
-            returned_info["opened"] = False
-            returned_info["liked"] = None
-            returned_info["hidden"] = False
-            returned_info["reading_completion"] = 0.0
-            returned_info["translations"] = []
+        } if article_ids else {}
+        difficulty_feedbacks = ArticleDifficultyFeedback.find_for_user_and_articles(
+            user, article_ids
+        )
+        topic_feedbacks = ArticleTopicUserFeedback.find_for_user_and_articles(
+            user, article_ids
+        )
+        saved_article_ids = PersonalCopy.article_ids_saved_by(user, article_ids)
 
-        else:
-            # Use stored reading completion - no more expensive calculations!
-            returned_info["reading_completion"] = (
-                user_article_info.reading_completion or 0.0
+        translations_by_source = {}
+        if with_translations:
+            translations_by_source = Bookmark.find_all_for_user_and_sources(
+                user,
+                {a.source_id for a in articles if a.id in user_articles},
             )
-            returned_info["starred"] = user_article_info.starred is not None
-            returned_info["opened"] = user_article_info.opened is not None
-            returned_info["liked"] = user_article_info.liked
-            returned_info["hidden"] = user_article_info.hidden is not None
-            if user_article_info.starred:
-                returned_info["starred_time"] = datetime_to_json(
-                    user_article_info.starred
+
+        is_teacher = user.isTeacher()
+        infos = []
+        for article in articles:
+            # Initialize returned info with the article info
+            # Use teacher version if user is a teacher (includes CEFR assessments)
+            if is_teacher:
+                returned_info = article.article_info_for_teacher()
+                # Merge content if requested
+                if with_content:
+                    content_info = article.article_info(with_content=True)
+                    returned_info.update(
+                        {
+                            k: v
+                            for k, v in content_info.items()
+                            if k.startswith("content")
+                            or k.startswith("tokenized")
+                            or k == "paragraphs"
+                            or k == "htmlContent"
+                        }
+                    )
+            else:
+                returned_info = article.article_info(with_content=with_content)
+            user_article_info = user_articles.get(article.id)
+            user_diff_feedback = difficulty_feedbacks.get(article.id)
+            user_topics_feedback = topic_feedbacks.get(article.id)
+            if user_topics_feedback:
+                article_topic_list = returned_info["topics_list"]
+                topic_list = []
+                topics_to_remove = set(
+                    [
+                        untf.topic.title
+                        for untf in user_topics_feedback
+                        if untf.feedback == ArticleTopicUserFeedback.DO_NOT_SHOW_FEEDBACK
+                    ]
                 )
+                for each in article_topic_list:
+                    title, _ = each
+                    if title not in topics_to_remove:
+                        topic_list.append(each)
+                returned_info["topics_list"] = topic_list
+                returned_info["topics"] = ",".join([t for t, _ in topic_list])
+
+            if not user_article_info:
+                returned_info["starred"] = False
+                returned_info["opened"] = False
+                returned_info["liked"] = None
+                returned_info["hidden"] = False
+                returned_info["reading_completion"] = 0.0
+                returned_info["translations"] = []
 
-            if user_diff_feedback is not None:
-                returned_info["relative_difficulty"] = (
-                    user_diff_feedback.difficulty_feedback
+            else:
+                # Use stored reading completion - no more expensive calculations!
+                returned_info["reading_completion"] = (
+                    user_article_info.reading_completion or 0.0
                 )
+                returned_info["starred"] = user_article_info.starred is not None
+                returned_info["opened"] = user_article_info.opened is not None
+                returned_info["liked"] = user_article_info.liked
+                returned_info["hidden"] = user_article_info.hidden is not None
+                if user_article_info.starred:
+                    returned_info["starred_time"] = datetime_to_json(
+                        user_article_info.starred
+                    )
 
-            if with_translations:
-                translations = Bookmark.find_all_for_user_and_article(user, article)
-                returned_info["translations"] = [
-                    each.as_dictionary() for each in translations
-                ]
-            if "tokenized_fragments" in returned_info:
-                for i, fragment in enumerate(returned_info["tokenized_fragments"]):
-                    returned_info["tokenized_fragments"][i]["past_bookmarks"] = (
-                        ArticleFragmentContext.get_all_user_bookmarks_for_article_fragment(
-                            user.id,
-                            fragment["context_identifier"]["article_fragment_id"],
-                        )
+                if user_diff_feedback is not None:
+                    returned_info["relative_difficulty"] = (
+                        user_diff_feedback.difficulty_feedback
                     )
-            if "tokenized_title_new" in returned_info:
-                returned_info["tokenized_title_new"]["past_bookmarks"] = (
-                    ArticleTitleContext.get_all_user_bookmarks_for_article_title(
-                        user.id, article.id
+
+                if with_translations:
+                    translations = translations_by_source.get(article.source_id, [])
+                    returned_info["translations"] = [
+                        each.as_dictionary() for each in translations
+                    ]
+                if "tokenized_fragments" in returned_info:
+                    for i, fragment in enumerate(returned_info["tokenized_fragments"]):
+                        returned_info["tokenized_fragments"][i]["past_bookmarks"] = (
+                            ArticleFragmentContext.get_all_user_bookmarks_for_article_fragment(
+                                user.id,
+                                fragment["context_identifier"]["article_fragment_id"],
+                            )
+                        )
+                if "tokenized_title_new" in returned_info:
+                    returned_info["tokenized_title_new"]["past_bookmarks"] = (
+                        ArticleTitleContext.get_all_user_bookmarks_for_article_title(
+                            user.id, article.id
+                        )
                     )
-                )
 
-        if PersonalCopy.exists_for(user, article):
-            returned_info["has_personal_copy"] = True
-        else:
-            returned_info["has_personal_copy"] = False
+            returned_info["has_personal_copy"] = article.id in saved_article_ids
+
+            infos.append(returned_info)
 
         # Include tokenized summary if requested (enabled by default for homepage performance)
         if with_summary and not with_content:
             # Only include summary if we're not already including full content
             # (full content tokenization includes everything)
-            summary_info = cls.user_article_summary_info(user, article)
-            # Merge summary-specific keys into the returned info
-            # Map to frontend-expected keys for backwards compatibility
-            if "tokenized_summary" in summary_info:
-                returned_info["interactiveSummary"] = summary_info["tokenized_summary"]
-            if "tokenized_title" in summary_info:
-                returned_info["interactiveTitle"] = summary_info["tokenized_title"]
+            # This comes last: it may add tokenization caches to the session,
+            # which should not be flushed by the queries above
+            summaries_info = cls._user_article_summary_info_many(user, articles)
+            for article, returned_info in zip(articles, infos):
+                summary_info = summaries_info[article.id]
+                # Merge summary-specific keys into the returned info
+                # Map to frontend-expected keys for backwards compatibility
+                if "tokenized_summary" in summary_info:
+                    returned_info["interactiveSummary"] = summary_info["tokenized_summary"]
+                if "tokenized_title" in summary_info:
+                    returned_info["interactiveTitle"] = summary_info["tokenized_title"]
+
+        return infos
+
+    @classmethod
+    def _user_article_summary_info_many(cls, user: User, articles: "list[Article]"):
+        """
+        user_article_summary_info for every article, with the tokenization
+        caches and the past bookmarks of all of them prefetched
+        :return: dict from article id to summary info
+        """
+        from zeeguu.core.model.article_summary_context import ArticleSummaryContext
+        from zeeguu.core.model.article_title_context import ArticleTitleContext
+        from zeeguu.core.model.article_tokenization_cache import ArticleTokenizationCache
+        from . import db
 
-        return returned_info
+        article_ids = list({article.id for article in articles})
+        caches = ArticleTokenizationCache.find_or_create_many(db.session, articles)
+        with db.session.no_autoflush:
+            summary_bookmarks = ArticleSummaryContext.get_all_user_bookmarks_for_article_summaries(
+                user.id, article_ids
+            )
+            title_bookmarks = ArticleTitleContext.get_all_user_bookmarks_for_article_titles(
+                user.id, article_ids
+            )
+
+        return {
+            article.id: cls.user_article_summary_info(
+                user,
+                article,
+                cache=caches[article.id],
+                past_summary_bookmarks=summary_bookmarks.get(article.id, []),
+                past_title_bookmarks=title_bookmarks.get(article.id, []),
+            )
+            for article in articles
+        }
 
     @classmethod
-    def user_article_summary_info(cls, user: User, article: Article):
+    def user_article_summary_info(
+        cls,
+        user: User,
+        article: Article,
+        cache=None,
+        past_summary_bookmarks=None,
+        past_title_bookmarks=None,
+    ):
         """
         Returns tokenized summary and title for an article with user bookmarks.
         This is a lightweight version of user_article_info that only processes
@@ -515,6 +632,8 @@ class UserArticle(db.Model):
         Args:
             user: The user requesting the article summary
             article: The article to get summary info for
+            cache, past_summary_bookmarks, past_title_bookmarks: prefetched
+                by _user_article_summary_info_many; looked up when None
         """
         import json
         from zeeguu.core.model.article_summary_context import ArticleSummaryContext
@@ -537,7 +656,8 @@ class UserArticle(db.Model):
         # Get or create tokenization cache
         from zeeguu.core.model.article_tokenization_cache import ArticleTokenizationCache
         cache_start = time.time()
-        cache = ArticleTokenizationCache.find_or_create(db.session, article)
+        if cache is None:
+            cache = ArticleTokenizationCache.find_or_create(db.session, article)
         cache_time = time.time() - cache_start
         log(f"[TOKENIZATION-CACHE] Article {article.id} - Cache lookup took {cache_time:.3f}s")
 
@@ -572,25 +692,28 @@ class UserArticle(db.Model):
                 tokenize_time = time.time() - tokenize_start
                 log(f"[TOKENIZATION-SUMMARY] Article {article.id} - Tokenized summary in {tokenize_time:.3f}s")
 
-                json_start = time.time()
-                cache.tokenized_summary = json.dumps(tokenized_summary)
-                json_time = time.time() - json_start
-                log(f"[TOKENIZATION-SUMMARY] Article {article.id} - JSON dumps took {json_time:.3f}s")
+                if not tokenizer.degraded:
+                    json_start = time.time()
+                    cache.tokenized_summary = json.dumps(tokenized_summary)
+                    json_time = time.time() - json_start
+                    log(f"[TOKENIZATION-SUMMARY] Article {article.id} - JSON dumps took {json_time:.3f}s")
 
-                db.session.add(cache)
-                log(f"[TOKENIZATION-SUMMARY] Article {article.id} - Added cache to session")
+                    db.session.add(cache)
+                    log(f"[TOKENIZATION-SUMMARY] Article {article.id} - Added cache to session")
                 # Don't commit here - let Flask teardown handle it to avoid transaction conflicts
 
             bookmark_start = time.time()
             # Use no_autoflush to prevent premature flush of tokenization cache
             # while querying for bookmarks (avoids lock timeouts)
             with db.session.no_autoflush:
+                if past_summary_bookmarks is None:
+                    past_summary_bookmarks = ArticleSummaryContext.get_all_user_bookmarks_for_article_summary(
+                        user.id, article.id
+                    )
                 result["tokenized_summary"] = {
                     "tokens": tokenized_summary,
                     "context_identifier": summary_context_id.as_dictionary(),
-                    "past_bookmarks": ArticleSummaryContext.get_all_user_bookmarks_for_article_summary(
-                        user.id, article.id
-                    ),
+                    "past_bookmarks": past_summary_bookmarks,
                 }
             bookmark_time = time.time() - bookmark_start
             log(f"[TOKENIZATION-SUMMARY] Article {article.id} - Built result dict in {bookmark_time:.3f}s")
@@ -624,25 +747,28 @@ class UserArticle(db.Model):
             tokenize_time = time.time() - tokenize_start
             log(f"[TOKENIZATION-TITLE] Article {article.id} - Tokenized title in {tokenize_time:.3f}s")
 
-            json_start = time.time()
-            cache.tokenized_title = json.dumps(tokenized_title)
-            json_time = time.time() - json_start
-            log(f"[TOKENIZATION-TITLE] Article {article.id} - JSON dumps took {json_time:.3f}s")
+            if not tokenizer.degraded:
+                json_start = time.time()
+                cache.tokenized_title = json.dumps(tokenized_title)
+                json_time = time.time() - json_start
+                log(f"[TOKENIZATION-TITLE] Article {article.id} - JSON dumps took {json_time:.3f}s")
 
-            db.session.add(cache)
-            log(f"[TOKENIZATION-TITLE] Article {article.id} - Added cache to session")
+                db.session.add(cache)
+                log(f"[TOKENIZATION-TITLE] Article {article.id} - Added cache to session")
             # Don't commit here - let Flask teardown handle it to avoid transaction conflicts
 
         bookmark_start = time.time()
         # Use no_autoflush to prevent premature flush of tokenization cache
         # while querying for bookmarks (avoids lock timeouts)
         with db.session.no_autoflush:
+            if past_title_bookmarks is None:
+                past_title_bookmarks = ArticleTitleContext.get_all_user_bookmarks_for_article_title(
+                    user.id, article.id
+                )
             result["tokenized_title"] = {
                 "tokens": tokenized_title,
                 "context_identifier": title_context_id.as_dictionary(),
-                "past_bookmarks": ArticleTitleContext.get_all_user_bookmarks_for_article_title(
-                    user.id, article.id
-                ),
+                "past_bookmarks": past_title_bookmarks,
             }
         bookmark_time = time.time() - bookmark_start
         log(f"[TOKENIZATION-TITLE] Article {article.id} - Built result dict in {bookmark_time:.3f}s")
@@ -392,6 +392,12 @@ class UserWord(db.Model):
 
         db_session.commit()
 
+        from zeeguu.core.word_scheduling.basicSR.basicSR import (
+            invalidate_count_of_user_words_to_study,
+        )
+
+        invalidate_count_of_user_words_to_study(self.user_id)
+
         # This needs to be re-thought, currently the updates are done in
         # the BasicSRSchedule.update call.
         # self.update_fit_for_study(db_session)
@@ -85,6 +85,32 @@ class Video(db.Model):
     def find_by_id(cls, video_id: int):
         return cls.query.filter_by(id=video_id).first()
 
+    @classmethod
+    def find_by_ids(cls, video_ids: "list[int]"):
+        """
+        Loads all the videos with the given ids in a single query, together
+        with the relationships that video_info needs.
+
+        :return: dict from video id to video; missing ids are absent
+        """
+        from sqlalchemy.orm import joinedload, selectinload
+
+        if not video_ids:
+            return {}
+
+        videos = (
+            cls.query.filter(cls.id.in_(set(video_ids)))
+            .options(
+                joinedload(cls.source),
+                joinedload(cls.channel),
+                joinedload(cls.thumbnail_url),
+                joinedload(cls.language),
+                selectinload(cls.topics).joinedload(VideoTopicMap.topic),
+            )
+            .all()
+        )
+        return {video.id: video for video in videos}
+
     @classmethod
     def find_or_create(
         cls,
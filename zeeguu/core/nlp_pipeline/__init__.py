@@ -1,23 +1,105 @@
+"""
+
+The spaCy models (and the objects built on them) are loaded lazily, the
+first time a language is used, since every *_core_news_md model costs a
+couple of seconds and a few hundred MB in every process that imports
+this package.
+
+The languages in ZEEGUU_SPACY_PRELOAD_LANGUAGES (e.g. "da,en,de") are
+loaded by preload_nlp_pipelines() when the API starts. If that happens in
+the gunicorn master (--preload), the forked workers share the models
+copy-on-write instead of loading their own.
+
+"""
+
+import gc
+import os
+
 from .spacy_wrapper import SpacyWrapper
 from .confusion_generator import NoiseGenerator
 from .automatic_gec_tagging import AutoGECTagging
 from .reduce_context import ContextReducer
-import confusionwords
-from confusionwords import ConfusionSets
+from .lazy_registry import LazyRegistry
 
-# Initialize the models, use the WV.
-SPACY_EN_MODEL = SpacyWrapper("english", False, True)
-SPACY_DK_MODEL = SpacyWrapper("danish", False, True)
-SPACY_DE_MODEL = SpacyWrapper("german", False, True)
+SPACY_PRELOAD_LANGUAGES = [
+    code
+    for code in os.environ.get("ZEEGUU_SPACY_PRELOAD_LANGUAGES", "").split(",")
+    if code
+]
 
-SpacyWrappers = {"en": SPACY_EN_MODEL, "da": SPACY_DK_MODEL, "de": SPACY_DE_MODEL}
+SPACY_LANGUAGE_NAMES = {"en": "english", "da": "danish", "de": "german"}
 
-NoiseWordsGenerator = {
-    "da": NoiseGenerator(SPACY_DK_MODEL, "danish",
-                         confusionwords.ConfusionSets["da"].get_lemma_set(),
-                         confusionwords.ConfusionSets["da"].get_filter_dictionary(),
-                         confusionwords.ConfusionSets["da"].word_list)
-}
-AutoGECTagger = {
-    "da": AutoGECTagging(SPACY_DK_MODEL, "danish")
+
+def _spacy_wrapper(code):
+    # Initialize the models, use the WV.
+    return lambda: SpacyWrapper(SPACY_LANGUAGE_NAMES[code], False, True)
+
+
+def _noise_generator(code):
+    def create():
+        import confusionwords
+
+        confusion_set = confusionwords.ConfusionSets[code]
+        return NoiseGenerator(
+            SpacyWrappers[code],
+            SPACY_LANGUAGE_NAMES[code],
+            confusion_set.get_lemma_set(),
+            confusion_set.get_filter_dictionary(),
+            confusion_set.word_list,
+        )
+
+    return create
+
+
+def _auto_gec_tagger(code):
+    return lambda: AutoGECTagging(SpacyWrappers[code], SPACY_LANGUAGE_NAMES[code])
+
+
+SpacyWrappers = LazyRegistry(
+    "SpacyWrappers", {code: _spacy_wrapper(code) for code in SPACY_LANGUAGE_NAMES}
+)
+NoiseWordsGenerator = LazyRegistry("NoiseWordsGenerator", {"da": _noise_generator("da")})
+# one tagger per language, so that its cache of parsed reference sentences
+# is shared by all the requests
+AutoGECTagger = LazyRegistry(
+    "AutoGECTagger", {code: _auto_gec_tagger(code) for code in SPACY_LANGUAGE_NAMES}
+)
+
+# the module level names of the models, loaded on first access
+_SPACY_MODEL_NAMES = {
+    "SPACY_EN_MODEL": "en",
+    "SPACY_DK_MODEL": "da",
+    "SPACY_DE_MODEL": "de",
 }
+
+
+def __getattr__(name):
+    if name in _SPACY_MODEL_NAMES:
+        return SpacyWrappers[_SPACY_MODEL_NAMES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def preload_nlp_pipelines(language_codes=None):
+    """
+    Loads the models (and the objects built on them) of the given languages,
+    by default those in ZEEGUU_SPACY_PRELOAD_LANGUAGES.
+    """
+    if language_codes is None:
+        language_codes = SPACY_PRELOAD_LANGUAGES
+
+    for registry in [SpacyWrappers, NoiseWordsGenerator, AutoGECTagger]:
+        for code in language_codes:
+            if code in registry:
+                registry[code]
+
+    # the loaded models are never freed; moving them out of the reach of the
+    # garbage collector keeps it from touching (and thus un-sharing) their
+    # pages in the forked workers
+    gc.freeze()
+
+
+def loaded_nlp_pipelines():
+    return {
+        registry.name: registry.loaded()
+        for registry in [SpacyWrappers, NoiseWordsGenerator, AutoGECTagger]
+    }
@@ -1,5 +1,7 @@
 from itertools import groupby
+import numpy as np
 from rapidfuzz.distance import Indel
+from rapidfuzz.process import cdist
 import spacy.parts_of_speech as POS
 from .edit_errant import Edit
 
@@ -7,7 +9,12 @@ from .edit_errant import Edit
 Code from https://github.com/chrisjbryant/errant/blob/master/errant/alignment.py
 (ERRANT v2.3.3)
 
-No changes were made.
+The only change is in align: the substitution costs and the matches of all
+the token pairs are computed up front with NumPy (and rapidfuzz's cdist for
+the character costs), instead of in the double loop. The dynamic programming
+itself still fills the matrices row by row, in the same order and with the
+same float operations, so the resulting align_seq is identical to that of
+the original implementation, which is kept as align_cell_by_cell.
 """
 
 class ERRANT_Alignment:
@@ -29,6 +36,111 @@ class ERRANT_Alignment:
     # Input: A flag for standard Levenshtein alignment
     # Output: The cost matrix and the operation matrix of the alignment
     def align(self, lev):
+        # Sentence lengths
+        o_len = len(self.orig)
+        c_len = len(self.cor)
+        # Lower case token IDs (for transpositions)
+        o_low = [o.lower for o in self.orig]
+        c_low = [c.lower for c in self.cor]
+        # The first position of every lower case token ID
+        o_first = {}
+        for position, low in enumerate(o_low): o_first.setdefault(low, position)
+        c_first = {}
+        for position, low in enumerate(c_low): c_first.setdefault(low, position)
+        # Matches and substitution costs of all the token pairs
+        matches = self._pairwise_equal("orth")
+        if lev: sub_costs = np.ones((o_len, c_len))
+        else: sub_costs = self.get_sub_costs()
+        # The first row of the matrices; the first column is filled row by row
+        cost_matrix = [[float(j) for j in range(c_len+1)]]
+        op_matrix = [["O"] + ["I"] * c_len]
+
+        # Fill in the matrices row by row
+        for i in range(o_len):
+            prev_costs = cost_matrix[i]
+            costs_row = [prev_costs[0] + 1] + [0.0] * c_len
+            ops_row = ["D"] + ["O"] * c_len
+            cost_matrix.append(costs_row)
+            op_matrix.append(ops_row)
+            # The substitution costs of the whole row at once
+            sub_costs_row = (np.array(prev_costs[:-1]) + sub_costs[i]).tolist()
+            matches_row = matches[i].tolist()
+            for j in range(c_len):
+                # Matches
+                if matches_row[j]:
+                    costs_row[j+1] = prev_costs[j]
+                    ops_row[j+1] = "M"
+                # Non-matches
+                else:
+                    del_cost = prev_costs[j+1] + 1
+                    ins_cost = costs_row[j] + 1
+                    trans_cost = float("inf")
+                    sub_cost = sub_costs_row[j]
+                    # Linguistic Damerau-Levenshtein; a transposition is
+                    # only possible if each token occurs earlier in the other
+                    # sentence
+                    if not lev and o_first.get(c_low[j], o_len) <= i \
+                            and c_first.get(o_low[i], c_len) <= j:
+                        # Transpositions require >=2 tokens
+                        # Traverse the diagonal while there is not a Match.
+                        # o_low[i-k:i+1] and c_low[j-k:j+1] are permutations
+                        # of each other when no token count is unbalanced.
+                        k = 1
+                        counts = {o_low[i]: 1}
+                        counts[c_low[j]] = counts.get(c_low[j], 0) - 1
+                        unbalanced = sum(1 for count in counts.values() if count)
+                        while i-k >= 0 and j-k >= 0 and \
+                                cost_matrix[i-k+1][j-k+1] != cost_matrix[i-k][j-k]:
+                            for token, delta in ((o_low[i-k], 1), (c_low[j-k], -1)):
+                                before = counts.get(token, 0)
+                                counts[token] = before + delta
+                                unbalanced += (before + delta != 0) - (before != 0)
+                            if not unbalanced:
+                                trans_cost = cost_matrix[i-k][j-k] + k
+                                break
+                            k += 1
+                    # Costs
+                    costs = [trans_cost, sub_cost, ins_cost, del_cost]
+                    # Get the index of the cheapest (first cheapest if tied)
+                    l = costs.index(min(costs))
+                    # Save the cost and the op in the matrices
+                    costs_row[j+1] = costs[l]
+                    if   l == 0: ops_row[j+1] = "T"+str(k+1)
+                    elif l == 1: ops_row[j+1] = "S"
+                    elif l == 2: ops_row[j+1] = "I"
+                    else: ops_row[j+1] = "D"
+        # Return the matrices
+        return cost_matrix, op_matrix
+
+    # Input: The name of a spacy Token attribute
+    # Output: A boolean matrix, True where orig[i] and cor[j] have the same value
+    def _pairwise_equal(self, attribute):
+        o_values = np.array([getattr(o, attribute) for o in self.orig], dtype=np.uint64)
+        c_values = np.array([getattr(c, attribute) for c in self.cor], dtype=np.uint64)
+        return o_values[:, None] == c_values[None, :]
+
+    # Output: The matrix of the get_sub_cost of all the orig x cor token pairs
+    def get_sub_costs(self):
+        if len(self.orig) == 0 or len(self.cor) == 0:
+            return np.zeros((len(self.orig), len(self.cor)))
+        # Lemma cost
+        lemma_cost = np.where(self._pairwise_equal("lemma"), 0, 0.499)
+        # POS cost
+        open_pos = list(self._open_pos)
+        o_open = np.isin([o.pos for o in self.orig], open_pos)
+        c_open = np.isin([c.pos for c in self.cor], open_pos)
+        pos_cost = np.where(self._pairwise_equal("pos"), 0,
+                            np.where(o_open[:, None] & c_open[None, :], 0.25, 0.5))
+        # Char cost
+        char_cost = cdist([o.text for o in self.orig], [c.text for c in self.cor],
+                          scorer=Indel.normalized_distance, dtype=np.float64)
+        # Combine the costs; short circuit if the only difference is case
+        return np.where(self._pairwise_equal("lower"), 0,
+                        lemma_cost + pos_cost + char_cost)
+
+    # The original ERRANT implementation of align, used as the reference
+    # for the results of align in the tests and the benchmark.
+    def align_cell_by_cell(self, lev):
         # Sentence lengths
         o_len = len(self.orig)
         c_len = len(self.cor)
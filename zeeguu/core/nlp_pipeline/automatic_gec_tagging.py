@@ -2,6 +2,9 @@ from .alignment_errant import ERRANT_Alignment
 import regex as re
 import numpy as np
 import json
+import os
+import threading
+from collections import OrderedDict
 from rapidfuzz.fuzz import ratio
 from .spacy_wrapper import SpacyWrapper
 """
@@ -95,6 +98,9 @@ the other errors can be highlighted.
 
 """
 LEMMA_SIM_WEIGHT = 0.55
+# Parsed reference sentences kept by every tagger; a learner retrying an
+# exercise is compared against the same reference sentence every time.
+REFERENCE_CACHE_SIZE = int(os.environ.get("ZEEGUU_GEC_REFERENCE_CACHE_SIZE", 1000))
 SWAP_WORDS = re.compile(r'T([0-9])')
 PROPERTIES_TO_CHECK = ["Tense", "Gender", "Person", "Number", "Case"]
 DICTIONARY_UD_MAP = {
@@ -131,10 +137,35 @@ UD_TO_WORD_CLASS = {
 }
 
 class AutoGECTagging():
-    def __init__(self, spacy_pipe:SpacyWrapper, language:str) -> None:
+    def __init__(self, spacy_pipe:SpacyWrapper, language:str,
+                 reference_cache_size=REFERENCE_CACHE_SIZE) -> None:
         
         self.language_pipe = language
         self.spacy_pipeline = spacy_pipe.spacy_pipe
+        self.reference_cache_size = reference_cache_size
+        self._parsed_references = OrderedDict()
+        self._parsed_references_lock = threading.Lock()
+
+    def parse_reference(self, corr_sentence):
+        """
+            Parses the correct (reference) sentence, memoized in an LRU cache.
+            Returns the spaCy doc and the morphology dictionaries of its tokens,
+            which are only read, never modified, by generate_labels.
+        """
+        with self._parsed_references_lock:
+            parsed = self._parsed_references.get(corr_sentence)
+            if parsed is not None:
+                self._parsed_references.move_to_end(corr_sentence)
+                return parsed
+
+        doc_corr = self.spacy_pipeline(corr_sentence)
+        parsed = (doc_corr, [token.morph.to_dict() for token in doc_corr])
+
+        with self._parsed_references_lock:
+            self._parsed_references[corr_sentence] = parsed
+            while len(self._parsed_references) > self.reference_cache_size:
+                self._parsed_references.popitem(last=False)
+        return parsed
 
     def word_lemma_token_sim(self, token_err, token_ref, verbose=False):
         lemma_ref_str = str(token_ref.lemma_).lower()
@@ -227,7 +258,7 @@ class AutoGECTagging():
             return (operation, (s_err,e_err)) if flag else operation
         
         doc_err = self.spacy_pipeline(error_sentence)
-        doc_corr = self.spacy_pipeline(corr_sentence)
+        doc_corr, morph_corr = self.parse_reference(corr_sentence)
 
         alignment = ERRANT_Alignment(doc_err, doc_corr)
 
@@ -266,7 +297,7 @@ class AutoGECTagging():
                     labels.append(_include_start_end(f"R:SPELL/MORPH", start_err, end_err, include_o_start_end))
                     continue
                 sim_weighted = self.word_lemma_token_sim(token_err, token_ref, verbose)
-                morph_ref = token_ref.morph.to_dict()
+                morph_ref = morph_corr[start_ref]
                 morph_err = token_err.morph.to_dict()
                 if verbose:
                     print("REF Morph dict: ", morph_ref)
@@ -0,0 +1,48 @@
+import threading
+import time
+
+from collections.abc import Mapping
+
+from zeeguu.logging import log
+
+
+class LazyRegistry(Mapping):
+    """
+    A read-only dict of language code to a (spaCy based) object that is
+    expensive to build: every object is only built the first time it is
+    looked up, and then shared by all the threads of the process.
+
+    Checking whether a language is supported (`code in registry` or
+    `registry.keys()`) does not build anything.
+    """
+
+    def __init__(self, name, factories):
+        self.name = name
+        self._factories = dict(factories)
+        self._instances = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, code):
+        instance = self._instances.get(code)
+        if instance is not None:
+            return instance
+
+        factory = self._factories[code]
+        with self._lock:
+            if code not in self._instances:
+                start = time.time()
+                self._instances[code] = factory()
+                log(f"{self.name}: loaded '{code}' in {time.time() - start:.2f}s")
+            return self._instances[code]
+
+    def __contains__(self, code):
+        return code in self._factories
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self):
+        return len(self._factories)
+
+    def loaded(self):
+        return list(self._instances)
@@ -4,26 +4,63 @@ from .spacy_wrapper import SpacyWrapper
 
 class ContextReducer():
     @classmethod
-    def get_similar_sentences(cls, nlp_pipe:SpacyWrapper, sentence:str, article:str, max_length:int = 15):
-        sentences = nlp_pipe.get_sent_list(article)
-        short_sentences_in_article = [sent for sent in sentences if len(nlp_pipe.tokenize_sentence(sent)) <= max_length]
-        
-        context_doc = nlp_pipe.get_doc(sentence)
-        heap = []
-        for f_sent in short_sentences_in_article:
-            sent_doc = nlp_pipe.get_doc(f_sent)
-            heapq.heappush(heap, (context_doc.similarity(sent_doc), f_sent))
-        
-        most_similar_sent = heapq.nlargest(1, heap)[0][1]
-        top_10_results = heapq.nlargest(10, heap)
+    def get_similar_sentences(cls, nlp_pipe:SpacyWrapper, sentence:str, article:str, max_length:int = 15, top_k:int = 10):
+        """
+            Finds the sentences of the article with at most max_length tokens that
+            are most similar to the given sentence.
+
+            The sentence and the article are parsed in a single pass of the pipeline;
+            the article sentences are not parsed again: since the word vectors are
+            static, the vector of a sentence span is that of the sentence parsed on
+            its own. The similarities are the cosines of the sentence vectors,
+            computed all at once.
+        """
+        context_doc, article_doc = nlp_pipe.get_docs([sentence, article])
+
+        short_sentences = []
+        for sent in article_doc.sents:
+            sent = cls._strip_span(sent)
+            if 0 < len(sent) <= max_length:
+                short_sentences.append(sent)
+
+        if not short_sentences:
+            return {"top_1_sent": None, "top_10_sents_w_sim": []}
+
+        sent_vectors = np.array([sent.vector for sent in short_sentences])
+        similarities = cls._cosine_similarities(context_doc.vector, sent_vectors)
+
+        top = np.arange(len(similarities))
+        if len(similarities) > top_k:
+            top = np.argpartition(-similarities, top_k - 1)[:top_k]
+        top_results = sorted(
+            ((float(similarities[i]), short_sentences[i].text) for i in top),
+            reverse=True,
+        )
 
         result_json = {
-            "top_1_sent": most_similar_sent,
-            "top_10_sents_w_sim": top_10_results
+            "top_1_sent": top_results[0][1],
+            "top_10_sents_w_sim": top_results
         }
 
         return result_json
-    
+
+    @staticmethod
+    def _strip_span(span):
+        # the same tokens as the stripped sentence text, parsed on its own
+        start, end = 0, len(span)
+        while start < end and span[start].is_space:
+            start += 1
+        while end > start and span[end - 1].is_space:
+            end -= 1
+        return span[start:end]
+
+    @staticmethod
+    def _cosine_similarities(vector, matrix):
+        # like Doc.similarity, 0 when one of the vectors is all zeros
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vector)
+        dots = matrix @ vector
+        return np.divide(dots, norms, out=np.zeros_like(dots, dtype=float), where=norms != 0)
+
     @classmethod
     def reduce_context_for_bookmark(cls, nlp_pipe:SpacyWrapper, sentence:str, bookmark:str, max_length:int = 15):
         def filter_non_consecutive(l, bookmark_word_i):
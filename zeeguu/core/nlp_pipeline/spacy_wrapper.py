@@ -85,6 +85,10 @@ class SpacyWrapper:
     def get_doc(self, sentence):
         return self.spacy_pipe(sentence)
 
+    def get_docs(self, texts):
+        # A single (batched) pass of the pipeline over all the texts
+        return list(self.spacy_pipe.pipe(texts))
+
     def get_sent_list(self, lines):
         # Get tokenized sentences from spaCy.
         return [str(sent).strip() for sent in self.spacy_pipe(lines).sents]
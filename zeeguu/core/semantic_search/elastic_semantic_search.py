@@ -1,4 +1,4 @@
-from elasticsearch import Elasticsearch
+from zeeguu.core.elastic.client import get_es_client
 from elastic_transport import ConnectionError
 
 from zeeguu.core.model import (
@@ -15,7 +15,8 @@ from zeeguu.core.content_recommender.elastic_recommender import (
     _to_articles_from_ES_hits,
 )
 from zeeguu.core.util.timer_logging_decorator import time_this
-from zeeguu.core.elastic.settings import ES_CONN_STRING, ES_ZINDEX
+from zeeguu.core.elastic.settings import ES_ZINDEX
+from zeeguu.core.elastic.indexing import stored_sem_vec
 from zeeguu.core.semantic_vector_api import (
     get_embedding_from_article,
     get_embedding_from_text,
@@ -34,7 +35,7 @@ def article_semantic_search_for_user(
 @time_this
 def articles_like_this_tfidf(article: Article):
     query_body = more_like_this_query(10, article.get_content(), article.language)
-    es = Elasticsearch(ES_CONN_STRING)
+    es = get_es_client()
     res = es.search(index=ES_ZINDEX, body=query_body)
     final_article_mix = []
     hit_list = res["hits"].get("hits")
@@ -45,13 +46,15 @@ def articles_like_this_tfidf(article: Article):
 
 @time_this
 def articles_like_this_semantic(article: Article):
-    query_body = build_elastic_semantic_sim_query_for_article(
-        10, article.language, get_embedding_from_article(article), article
-    )
     final_article_mix = []
 
     try:
-        es = Elasticsearch(ES_CONN_STRING)
+        # the embedding of an indexed article is already in its document
+        sem_vec = stored_sem_vec(article) or get_embedding_from_article(article)
+        query_body = build_elastic_semantic_sim_query_for_article(
+            10, article.language, sem_vec, article
+        )
+        es = get_es_client()
         res = es.search(index=ES_ZINDEX, body=query_body)
 
         hit_list = res["hits"].get("hits")
@@ -83,7 +86,7 @@ def get_article_w_topics_based_on_text_similarity(text, k: int = 9, filter_ids=N
     final_article_mix = []
 
     try:
-        es = Elasticsearch(ES_CONN_STRING)
+        es = get_es_client()
         res = es.search(index=ES_ZINDEX, body=query_body)
 
         hit_list = res["hits"].get("hits")
@@ -142,7 +145,7 @@ def find_articles_based_on_text(text, k: int = 9):  # hood = (slang) neighborhoo
     final_article_mix = []
 
     try:
-        es = Elasticsearch(ES_CONN_STRING)
+        es = get_es_client()
         res = es.search(index=ES_ZINDEX, body=query_body)
 
         hit_list = res["hits"].get("hits")
@@ -2,5 +2,6 @@ from .retrieve_embeddings import (
     get_embedding_from_article,
     get_embedding_from_text,
     get_embedding_from_video,
+    get_embeddings_from_texts,
     EMB_API_CONN_STRING,
 )
@@ -0,0 +1,65 @@
+"""
+
+Store of the embeddings computed by the embedding API, keyed by the hash of
+the language and the text, so that the same text is only ever sent to the
+API once: a TwoTierCache (see zeeguu.core.util.two_tier_cache).
+
+Every process keeps a bounded LRU of the recently used embeddings
+(ZEEGUU_EMBEDDING_CACHE_MAX_SIZE). Behind it, only when
+ZEEGUU_EMBEDDING_CACHE_DB is set to the path of a file, the embeddings are
+also saved in a local SQLite database, shared by the processes of the
+machine and kept across restarts. The database keeps the most recent
+ZEEGUU_EMBEDDING_CACHE_MAX_PERSISTENT_SIZE embeddings; every one is a
+JSON list of 512 floats, about 10 KB, so the default bounds the file to
+about 200 MB.
+
+The embeddings do not expire: the file should be deleted when the model of
+the embedding API changes.
+
+"""
+
+import hashlib
+import os
+
+from zeeguu.core.util.two_tier_cache import TwoTierCache
+
+EMBEDDING_CACHE_MAX_SIZE = int(os.environ.get("ZEEGUU_EMBEDDING_CACHE_MAX_SIZE", 1000))
+EMBEDDING_CACHE_MAX_PERSISTENT_SIZE = int(
+    os.environ.get("ZEEGUU_EMBEDDING_CACHE_MAX_PERSISTENT_SIZE", 20000)
+)
+EMBEDDING_CACHE_DB = os.environ.get("ZEEGUU_EMBEDDING_CACHE_DB")
+
+
+def content_hash(text, language=None):
+    return hashlib.sha256(f"{language or ''}\n{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingStore:
+    def __init__(
+        self,
+        max_size=EMBEDDING_CACHE_MAX_SIZE,
+        db_path=EMBEDDING_CACHE_DB,
+        max_persistent_size=EMBEDDING_CACHE_MAX_PERSISTENT_SIZE,
+    ):
+        self._cache = TwoTierCache(
+            "embedding",
+            max_size,
+            db_path=db_path,
+            max_persistent_size=max_persistent_size,
+        )
+
+    def get(self, text, language=None):
+        return self._cache.get(content_hash(text, language))
+
+    def put(self, text, language, embedding, persist=True):
+        self._cache.put(content_hash(text, language), embedding, persist)
+
+    def stats(self):
+        return self._cache.stats()
+
+
+embedding_store = EmbeddingStore()
+
+
+def embedding_store_stats():
+    return embedding_store.stats()
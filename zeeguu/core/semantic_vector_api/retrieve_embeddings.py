@@ -1,46 +1,106 @@
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from zeeguu.core.model import Article
-
+from zeeguu.core.semantic_vector_api.embedding_store import embedding_store
 
 EMB_API_CONN_STRING = os.environ.get(
     "ZEEGUU_EMB_API_CONN_STRING", "http://127.0.0.1:8000"
 )
+# the number of concurrent requests of get_embeddings_from_texts
+EMB_API_WORKERS = int(os.environ.get("ZEEGUU_EMB_API_WORKERS", 8))
+EMB_API_TIMEOUT = int(os.environ.get("ZEEGUU_EMB_API_TIMEOUT", 60))
+
+
+def _post_for_embedding(content, language=None, timeout=None, session=requests):
+    data = {
+        "article_content": content,
+    }
+    if language:
+        data["article_language"] = language
+    r = session.post(
+        url=f"{EMB_API_CONN_STRING}/get_article_embedding", json=data, timeout=timeout
+    )
+    r.raise_for_status()
+    return r.json()
+
+
+def _embedding(content, language=None, timeout=None, persist=True):
+    """
+    The embedding of the content, from the embedding store if it was
+    already computed, otherwise from the embedding API.
+    """
+    embedding = embedding_store.get(content, language)
+    if embedding is None:
+        embedding = _post_for_embedding(content, language, timeout)
+        if isinstance(embedding, list):
+            embedding_store.put(content, language, embedding, persist)
+    return embedding
 
 
 def get_embedding_from_video(v):
 
     # TODO: At some point update the Embedding API to not talk only about articles
-    r = requests.post(
-        url=f"{EMB_API_CONN_STRING}/get_article_embedding",
-        json={
-            "article_content": v.get_content(),
-            "article_language": v.language.name.lower(),
-        },
-    )
-    return r.json()
+    return _embedding(v.get_content(), v.language.name.lower())
 
 
 def get_embedding_from_article(a: Article):
-    r = requests.post(
-        url=f"{EMB_API_CONN_STRING}/get_article_embedding",
-        json={
-            "article_content": a.get_content(),
-            "article_language": a.language.name.lower(),
-        },
-    )
-    return r.json()
+    return _embedding(a.get_content(), a.language.name.lower())
 
 
 def get_embedding_from_text(text: str, language: str = None):
-    data = {
-        "article_content": text,
-    }
-    if language:
-        data["article_language"] = language
     try:
-        r = requests.post(url=f"{EMB_API_CONN_STRING}/get_article_embedding", json=data, timeout=5)
-        return r.json()
+        # the search queries are rarely repeated across restarts, so they
+        # are not saved in the database of the store
+        return _embedding(text, language, timeout=5, persist=False)
     except Exception as e:
         print(f"Warning: Embedding service unavailable: {e}")
         return None
+
+
+_sessions = threading.local()
+
+
+def _session():
+    # one keep-alive connection per thread
+    if not hasattr(_sessions, "session"):
+        _sessions.session = requests.Session()
+    return _sessions.session
+
+
+def _embedding_or_none(content, language):
+    try:
+        return _post_for_embedding(
+            content, language, timeout=EMB_API_TIMEOUT, session=_session()
+        )
+    except Exception as e:
+        print(f"Warning: Embedding failed: {e}")
+        return None
+
+
+def get_embeddings_from_texts(contents_and_languages, max_workers=EMB_API_WORKERS):
+    """
+    Embeds many texts at once, e.g. when (re)indexing. The embedding API
+    embeds one text per request, so the requests are sent in parallel.
+
+    :param contents_and_languages: (content, lowercase language name) pairs;
+        not model objects, since the session can't be used from the threads
+    :return: the embeddings, in the same order; None for the failed ones
+    """
+    contents_and_languages = list(contents_and_languages)
+    embeddings = [embedding_store.get(*pair) for pair in contents_and_languages]
+    missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+    if not missing:
+        return embeddings
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        computed = pool.map(
+            lambda i: _embedding_or_none(*contents_and_languages[i]), missing
+        )
+        for i, embedding in zip(missing, computed):
+            embeddings[i] = embedding
+            if isinstance(embedding, list):
+                embedding_store.put(*contents_and_languages[i], embedding)
+    return embeddings
@@ -0,0 +1,301 @@
+"""
+Runs unguided or coverage-guided fuzzing campaigns of the GEC tagging
+(AutoGECTagging.anottate_clues) in parallel worker processes.
+
+A campaign fuzzes several seed sentences generated by gec_generate_seed at
+once. It runs in rounds: in every round, each sentence is fuzzed by `shards`
+tasks of `sync_interval` iterations. Every task starts from the merged
+corpus, coverage set and path frequencies of the previous rounds, and the
+new seeds and coverages that the tasks find are merged at the end of the
+round.
+
+Every worker process loads the spaCy model when it starts, and uses the same
+tagger for all the iterations.
+
+Mutation-guided fuzzing is not supported: the mutation testing rewrites the
+source code of the system under test on disk, so it cannot run concurrently.
+
+Usage:
+    python -m zeeguu.core.test.fuzzing_test.gec_campaign [--mode coverage-guided]
+        [--sentences 4] [--workers N] [--iterations 10000] [--sync-interval 250]
+"""
+
+import argparse
+import math
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+from fuzzingbook.GreyboxFuzzer import PowerSchedule
+from fuzzingbook.MutationFuzzer import FunctionCoverageRunner
+
+from zeeguu.core.test.fuzzing_test.gec_fuzzer import (
+    AFLFastSchedule,
+    CountingGreyboxFuzzer,
+    Seed,
+    TestResult,
+    UnguidedFuzzer,
+    save_test_result,
+)
+from zeeguu.core.test.fuzzing_test.gec_generate_seed import gec_generate_seed
+from zeeguu.core.test.fuzzing_test.gec_grammar import GEC_INPUT_GRAMMAR, MUTATOR
+
+MODES = ["unguided", "coverage-guided"]
+
+
+@dataclass
+class CorpusState:
+    """The findings of the fuzzing of one seed sentence"""
+
+    original_sentence: str
+    population: List[Seed] = field(default_factory=list)
+    expected_results: Dict[str, Any] = field(default_factory=dict)
+    coverages_seen: Set[frozenset] = field(default_factory=set)
+    path_frequency: Dict[str, int] = field(default_factory=dict)
+    executions: int = 0
+
+    def merge(self, other: "CorpusState", base_path_frequency: Dict[str, int]):
+        """
+        Adds the findings of a task that started from this state when its
+        path frequencies were base_path_frequency.
+        """
+        known = {seed.data for seed in self.population}
+        # coverage-guided seeds are only kept for the first input that took
+        # a path; several tasks may have found the same one in the round
+        known_paths = {
+            seed.coverage_hash for seed in self.population if seed.coverage_hash
+        }
+        for seed in other.population:
+            if seed.coverage_hash and seed.coverage_hash in known_paths:
+                continue
+            if seed.data not in known:
+                known.add(seed.data)
+                known_paths.add(seed.coverage_hash)
+                self.population.append(seed)
+                self.expected_results[seed.data] = other.expected_results[seed.data]
+        self.coverages_seen |= other.coverages_seen
+        for path_id, count in other.path_frequency.items():
+            self.path_frequency[path_id] = (
+                self.path_frequency.get(path_id, 0)
+                + count
+                - base_path_frequency.get(path_id, 0)
+            )
+        self.executions += other.executions
+
+    def to_test_result(self) -> TestResult:
+        return TestResult(
+            original_sentence=self.original_sentence,
+            corpus_size=len(self.population),
+            corpus_result_mapping=[
+                {"input": str(seed), "output": self.expected_results[seed.data]}
+                for seed in self.population
+            ],
+            coverage_size=len(self.coverages_seen),
+        )
+
+
+# the tagger of the worker process
+_tagger = None
+
+
+def _init_worker():
+    global _tagger
+    from zeeguu.core.nlp_pipeline import AutoGECTagger
+
+    _tagger = AutoGECTagger["en"]
+
+
+def _annotate_clues_of(original_sentence):
+    def annotate_clues_wrapper(mutated_sentence: str):
+        user_tokens = mutated_sentence.split(" ")
+        word_dictionary_list = [{"word": w, "isInSentence": True} for w in user_tokens]
+        return _tagger.anottate_clues(word_dictionary_list, original_sentence)
+
+    return annotate_clues_wrapper
+
+
+def _create_fuzzer(mode, state: CorpusState):
+    seeds = [state.original_sentence]
+    if mode == "unguided":
+        fuzzer = UnguidedFuzzer(seeds, MUTATOR, PowerSchedule())
+    else:
+        fuzzer = CountingGreyboxFuzzer(seeds, MUTATOR, AFLFastSchedule(5))
+        fuzzer.schedule.path_frequency = dict(state.path_frequency)
+
+    if state.population:
+        # the seed sentence was already run in a previous round
+        fuzzer.seed_index = len(seeds)
+        fuzzer.population = list(state.population)
+        fuzzer.expected_results = dict(state.expected_results)
+    fuzzer.coverages_seen = set(state.coverages_seen)
+    return fuzzer
+
+
+def _fuzz(mode, state: CorpusState, iterations, random_seed) -> CorpusState:
+    # runs in a worker process
+    random.seed(random_seed)
+    fuzzer = _create_fuzzer(mode, state)
+    runner = FunctionCoverageRunner(_annotate_clues_of(state.original_sentence))
+
+    for _ in range(iterations):
+        fuzzer.run(runner)
+
+    return CorpusState(
+        original_sentence=state.original_sentence,
+        population=fuzzer.population,
+        expected_results=fuzzer.expected_results,
+        coverages_seen=fuzzer.coverages_seen,
+        path_frequency=getattr(fuzzer.schedule, "path_frequency", {}),
+        executions=iterations,
+    )
+
+
+class GecFuzzingCampaign:
+    def __init__(
+        self,
+        sentences: List[str],
+        mode: str = "coverage-guided",
+        workers: Optional[int] = None,
+        shards: Optional[int] = None,
+        iterations: int = 1000,
+        sync_interval: int = 250,
+        random_seed: Optional[int] = None,
+    ):
+        """
+        :param iterations: the number of fuzzing iterations of every
+            sentence, over all its shards
+        :param shards: the number of tasks that fuzz a sentence in parallel
+            in every round; by default as many as the workers
+        """
+        assert mode in MODES, f"mode should be one of {MODES}"
+        self.sentences = sentences
+        self.mode = mode
+        self.workers = workers or os.cpu_count()
+        self.shards = shards or self.workers
+        self.iterations = iterations
+        self.sync_interval = sync_interval
+        self.random = random.Random(random_seed)
+        self.states = [CorpusState(sentence) for sentence in sentences]
+
+    def run(self, save=True):
+        start = time.time()
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            # the workers should not inherit the threads (or the spaCy
+            # models) of the process that starts them
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        ) as pool:
+            done = 0
+            round_index = 0
+            while done < self.iterations:
+                per_shard = min(
+                    self.sync_interval,
+                    math.ceil((self.iterations - done) / self.shards),
+                )
+                self._run_round(pool, per_shard)
+                done += per_shard * self.shards
+                round_index += 1
+                print(
+                    f"Round #{round_index}: {done} iterations per sentence, "
+                    f"{self.executions_per_second(time.time() - start):.1f} executions/s"
+                )
+
+        report = self.report(time.time() - start)
+        if save:
+            for state in self.states:
+                report["files"].append(
+                    save_test_result(state.to_test_result(), f"{self.mode}-parallel")
+                )
+        return report
+
+    def _run_round(self, pool, iterations):
+        futures = []
+        for state in self.states:
+            base_path_frequency = dict(state.path_frequency)
+            futures.append(
+                (
+                    state,
+                    base_path_frequency,
+                    [
+                        pool.submit(
+                            _fuzz,
+                            self.mode,
+                            state,
+                            iterations,
+                            self.random.getrandbits(32),
+                        )
+                        for _ in range(self.shards)
+                    ],
+                )
+            )
+        for state, base_path_frequency, shard_futures in futures:
+            for future in shard_futures:
+                state.merge(future.result(), base_path_frequency)
+
+    def executions(self):
+        return sum(state.executions for state in self.states)
+
+    def executions_per_second(self, seconds):
+        return self.executions() / seconds if seconds else 0
+
+    def report(self, seconds):
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "shards": self.shards,
+            "executions": self.executions(),
+            "seconds": round(seconds, 2),
+            "executions_per_second": round(self.executions_per_second(seconds), 2),
+            "sentences": [
+                {
+                    "original_sentence": state.original_sentence,
+                    "corpus_size": len(state.population),
+                    "coverage_size": len(state.coverages_seen),
+                }
+                for state in self.states
+            ],
+            "files": [],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel GEC fuzzing campaign")
+    parser.add_argument("--mode", choices=MODES, default="coverage-guided")
+    parser.add_argument("--sentences", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shards", type=int, default=None)
+    parser.add_argument("--iterations", type=int, default=10000)
+    parser.add_argument("--sync-interval", type=int, default=250)
+    parser.add_argument("--random-seed", type=int, default=None)
+    args = parser.parse_args()
+
+    sentences = [
+        gec_generate_seed(grammar=GEC_INPUT_GRAMMAR) for _ in range(args.sentences)
+    ]
+    campaign = GecFuzzingCampaign(
+        sentences,
+        mode=args.mode,
+        workers=args.workers,
+        shards=args.shards,
+        iterations=args.iterations,
+        sync_interval=args.sync_interval,
+        random_seed=args.random_seed,
+    )
+    report = campaign.run()
+
+    print(f"\n{report['executions']} executions in {report['seconds']}s")
+    print(f"{report['executions_per_second']} executions/s")
+    for sentence in report["sentences"]:
+        print(
+            f"'{sentence['original_sentence']}': corpus {sentence['corpus_size']}, "
+            f"unique execution paths {sentence['coverage_size']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,16 @@ class TestResult:
         return TestResult(**data)
 
 
+def save_test_result(result: TestResult, postfix: str) -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = "zeeguu/core/test/fuzzing_test/results"
+    filename = f"{path}/corpus-{timestamp}-{postfix}.json"
+    if not os.path.exists(path):
+        os.makedirs(path)
+    result.to_json(filename)
+    return filename
+
+
 def getPathID(coverage: Any) -> str:
     pickled = pickle.dumps(sorted(coverage))
     return hashlib.md5(pickled).hexdigest()
@@ -126,12 +136,7 @@ class AdvancedMutationFuzzer(Fuzzer):
                                    for seed in self.population],
             coverage_size=len(self.coverages_seen)
         )
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = "zeeguu/core/test/fuzzing_test/results"
-        filename = f"{path}/corpus-{timestamp}-{postfix}.json"
-        if not os.path.exists(path):
-            os.makedirs(path)
-        result.to_json(filename)
+        save_test_result(result, postfix)
 
 
 class UnguidedFuzzer(AdvancedMutationFuzzer):
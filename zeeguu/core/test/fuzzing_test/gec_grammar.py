@@ -0,0 +1,110 @@
+from typing import List
+
+from fuzzingbook.Grammars import Grammar
+
+from zeeguu.core.test.fuzzing_test.gec_mutator import GecMutator
+
+GEC_INPUT_GRAMMAR: Grammar = {
+    "<start>": ["<sentence>"],
+    "<sentence>": [
+        "<subject> <verb_phrase> .",
+        "<subject> <verb_phrase> <object> .",
+        "<subject> <verb_phrase> <prep_phrase> .",
+        "<subject> <verb_phrase> <object> <prep_phrase> .",
+    ],
+    "<subject>": ["<article> <noun>", "<article> <adj> <noun>", "<pron>"],
+    "<verb_phrase>": ["<verb>", "<verb> <adv>"],
+    "<object>": [
+        "<article> <noun>",
+        "<article> <adj> <noun>",
+    ],
+    "<prep_phrase>": ["<prep> <article> <noun>", "<prep> <article> <adj> <noun>"],
+    "<noun>": ["cat", "cats", "book", "books", "airplane", "plane"],
+    "<verb>": [
+        "am",
+        "are",
+        "is",
+        "was",
+        "were",
+        "go",
+        "goes",
+        "went",
+        "run",
+        "runs",
+        "running",
+        "eat",
+        "eats",
+        "eating",
+    ],
+    "<prep>": ["in", "on", "at", "with", "without", "before", "after"],
+    "<adj>": ["big", "small", "tiny", "large", "larger"],
+    "<adv>": ["quickly", "slowly", "silently"],
+    "<pron>": ["he", "she", "they", "them", "me", "I", "who", "whom"],
+    "<article>": ["the", "a", "an"],
+    "<punct>": [".", ",", ";", ":", "!"],
+}
+
+TERMINALS: list[str] = sorted(
+    {
+        token
+        for expansions in GEC_INPUT_GRAMMAR.values()
+        for expansion in expansions
+        for token in expansion.split()
+        if "<" not in token and ">" not in token
+    }
+)
+
+GEC_REPLACE: dict[str, List[str]] = {
+    "cat": ["cats"],
+    "cats": ["cat"],
+    "book": ["books"],
+    "books": ["book"],
+    "airplane": ["plane"],
+    "plane": ["airplane"],
+    "am": ["are", "is", "was", "were"],
+    "are": ["am", "is", "was", "were"],
+    "is": ["am", "are", "was", "were"],
+    "was": ["am", "are", "is", "were"],
+    "were": ["am", "are", "is", "was"],
+    "go": ["goes", "went", "going"],
+    "goes": ["go", "went", "going"],
+    "went": ["go", "goes", "going"],
+    "eat": ["eats", "ate", "eating"],
+    "eats": ["eat", "ate", "eating"],
+    "ate": ["eat", "eats", "eating"],
+    "eating": ["eat", "eats", "ate"],
+    "run": ["runs", "ran", "running"],
+    "runs": ["run", "ran", "running"],
+    "ran": ["run", "runs", "running"],
+    "running": ["run", "runs", "ran"],
+    "I": ["me"],
+    "me": ["I"],
+    "he": ["she", "it", "him", "her"],
+    "she": ["he", "it", "him", "her"],
+    "it": ["he", "she", "him", "her"],
+    "him": ["he", "she", "it", "her"],
+    "her": ["he", "she", "it", "him"],
+    "they": ["them"],
+    "them": ["they"],
+    "who": ["whom"],
+    "whom": ["who"],
+    "in": ["on", "at"],
+    "on": ["in", "at"],
+    "at": ["in", "on"],
+    "the": ["a", "an"],
+    "a": ["the", "an"],
+    "an": ["the", "a"],
+    "big": ["bigger", "biggest"],
+    "bigger": ["big", "biggest"],
+    "biggest": ["bigger", "big"],
+    "large": ["larger", "largest"],
+    "larger": ["large", "largest"],
+    "largest": ["large", "larger"],
+    "small": ["smaller", "smallest"],
+    "smaller": ["small", "smallest"],
+    "smallest": ["small", "smaller"],
+    "quickly": ["slowly"],
+    "slowly": ["quickly"],
+}
+
+MUTATOR = GecMutator(TERMINALS, GEC_REPLACE)
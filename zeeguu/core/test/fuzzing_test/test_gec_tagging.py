@@ -4,120 +4,20 @@ import json
 import os
 import pkgutil
 import sqlite3
-from typing import List
 
 from cosmic_ray.cli import handle_exec_inprocess_batch
-from fuzzingbook.Grammars import Grammar
 from fuzzingbook.GreyboxFuzzer import PowerSchedule
 from fuzzingbook.MutationFuzzer import FunctionCoverageRunner
 
 from zeeguu.core.test.fuzzing_test.gec_fuzzer import CountingGreyboxFuzzer, UnguidedFuzzer, Seed, AFLFastSchedule
 from zeeguu.core.test.fuzzing_test.gec_fuzzer import getPathID
+from zeeguu.core.test.fuzzing_test.gec_campaign import GecFuzzingCampaign
 from zeeguu.core.test.fuzzing_test.gec_generate_seed import gec_generate_seed
-from zeeguu.core.test.fuzzing_test.gec_mutator import GecMutator
+from zeeguu.core.test.fuzzing_test.gec_grammar import GEC_INPUT_GRAMMAR, MUTATOR
 from zeeguu.core.test.fuzzing_test.test_gec_tagging_setup import COSMIC_RAY_SESSION, COSMIC_RAY_CONFIG
 from zeeguu.core.test.fuzzing_test.test_gec_tagging_setup import reset_sut_source_code
 from zeeguu.core.test.fuzzing_test.test_gec_tagging_setup import test_env, MUTATION_BRIDGE_FILE_PATH
 
-GEC_INPUT_GRAMMAR: Grammar = {
-    "<start>": ["<sentence>"],
-    "<sentence>": [
-        "<subject> <verb_phrase> .",
-        "<subject> <verb_phrase> <object> .",
-        "<subject> <verb_phrase> <prep_phrase> .",
-        "<subject> <verb_phrase> <object> <prep_phrase> ."
-    ],
-    "<subject>": [
-        "<article> <noun>",
-        "<article> <adj> <noun>",
-        "<pron>"
-    ],
-    "<verb_phrase>": [
-        "<verb>",
-        "<verb> <adv>"
-    ],
-    "<object>": [
-        "<article> <noun>",
-        "<article> <adj> <noun>",
-    ],
-    "<prep_phrase>": [
-        "<prep> <article> <noun>",
-        "<prep> <article> <adj> <noun>"
-    ],
-    "<noun>": ["cat", "cats", "book", "books", "airplane", "plane"],
-    "<verb>": ["am", "are", "is", "was", "were", "go", "goes", "went", "run", "runs", "running", "eat", "eats",
-               "eating"],
-    "<prep>": ["in", "on", "at", "with", "without", "before", "after"],
-    "<adj>": ["big", "small", "tiny", "large", "larger"],
-    "<adv>": ["quickly", "slowly", "silently"],
-    "<pron>": ["he", "she", "they", "them", "me", "I", "who", "whom"],
-    "<article>": ["the", "a", "an"],
-    "<punct>": [".", ",", ";", ":", "!"]
-}
-
-TERMINALS: list[str] = sorted({
-    token
-    for expansions in GEC_INPUT_GRAMMAR.values()
-    for expansion in expansions
-    for token in expansion.split()
-    if "<" not in token and ">" not in token
-})
-
-GEC_REPLACE: dict[str, List[str]] = {
-    "cat": ["cats"],
-    "cats": ["cat"],
-    "book": ["books"],
-    "books": ["book"],
-    "airplane": ["plane"],
-    "plane": ["airplane"],
-    "am": ["are", "is", "was", "were"],
-    "are": ["am", "is", "was", "were"],
-    "is": ["am", "are", "was", "were"],
-    "was": ["am", "are", "is", "were"],
-    "were": ["am", "are", "is", "was"],
-    "go": ["goes", "went", "going"],
-    "goes": ["go", "went", "going"],
-    "went": ["go", "goes", "going"],
-    "eat": ["eats", "ate", "eating"],
-    "eats": ["eat", "ate", "eating"],
-    "ate": ["eat", "eats", "eating"],
-    "eating": ["eat", "eats", "ate"],
-    "run": ["runs", "ran", "running"],
-    "runs": ["run", "ran", "running"],
-    "ran": ["run", "runs", "running"],
-    "running": ["run", "runs", "ran"],
-    "I": ["me"],
-    "me": ["I"],
-    "he": ["she", "it", "him", "her"],
-    "she": ["he", "it", "him", "her"],
-    "it": ["he", "she", "him", "her"],
-    "him": ["he", "she", "it", "her"],
-    "her": ["he", "she", "it", "him"],
-    "they": ["them"],
-    "them": ["they"],
-    "who": ["whom"],
-    "whom": ["who"],
-    "in": ["on", "at"],
-    "on": ["in", "at"],
-    "at": ["in", "on"],
-    "the": ["a", "an"],
-    "a": ["the", "an"],
-    "an": ["the", "a"],
-    "big": ["bigger", "biggest"],
-    "bigger": ["big", "biggest"],
-    "biggest": ["bigger", "big"],
-    "large": ["larger", "largest"],
-    "larger": ["large", "largest"],
-    "largest": ["large", "larger"],
-    "small": ["smaller", "smallest"],
-    "smaller": ["small", "smallest"],
-    "smallest": ["small", "smaller"],
-    "quickly": ["slowly"],
-    "slowly": ["quickly"]
-}
-
-MUTATOR = GecMutator(TERMINALS, GEC_REPLACE)
-
 
 def test_gec_tagging_labels(test_env):
     original_sentence = gec_generate_seed(grammar=GEC_INPUT_GRAMMAR)
@@ -137,6 +37,24 @@ def test_gec_tagging_labels(test_env):
     mutation_guided_fuzz(annotate_clues_wrapper, original_sentence, max_iteration)
 
 
+PARALLEL_FUZZING_SENTENCES = int(os.environ.get("ZEEGUU_FUZZING_SENTENCES", 4))
+PARALLEL_FUZZING_ITERATIONS = int(os.environ.get("ZEEGUU_FUZZING_ITERATIONS", 1000))
+
+
+def test_gec_tagging_labels_parallel():
+    sentences = [gec_generate_seed(grammar=GEC_INPUT_GRAMMAR) for _ in range(PARALLEL_FUZZING_SENTENCES)]
+    print(f"\nOriginal sentences: {sentences}")
+
+    for mode in ["unguided", "coverage-guided"]:
+        campaign = GecFuzzingCampaign(sentences, mode=mode, iterations=PARALLEL_FUZZING_ITERATIONS)
+        report = campaign.run()
+        print(f"{mode}: {report['executions_per_second']} executions/s")
+
+        assert report["executions"] >= len(sentences) * PARALLEL_FUZZING_ITERATIONS
+        for sentence in report["sentences"]:
+            assert sentence["corpus_size"] > 0
+
+
 def unguided_fuzz(method, original_sentence, max_iteration):
     print("\nStarting unguided fuzzing...\n")
     seeds = [original_sentence]
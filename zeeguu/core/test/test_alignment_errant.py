@@ -0,0 +1,73 @@
+import json
+import random
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import TestCase
+
+import spacy.parts_of_speech as POS
+
+from zeeguu.core.nlp_pipeline.alignment_errant import ERRANT_Alignment
+
+CORPORA = Path(__file__).parent / "fuzzing_test" / "final_results"
+SOME_POS = [POS.NOUN, POS.VERB, POS.ADJ, POS.ADV, POS.DET, POS.ADP, POS.PUNCT]
+
+
+def _id(string):
+    # spacy's string ids are unsigned 64 bit hashes
+    return hash(string) % 2**64
+
+
+def _tokens(sentence):
+    # stand-ins for the spacy tokens, with the attributes that the alignment uses;
+    # the lemma and the POS are made up, but consistent for the same word
+    return [
+        SimpleNamespace(
+            text=word,
+            orth=_id(word),
+            lower=_id(word.lower()),
+            lemma=_id(word.lower().rstrip("s")),
+            pos=SOME_POS[len(word.lower().rstrip("s")) % len(SOME_POS)],
+        )
+        for word in sentence.split()
+    ]
+
+
+def _sentence_pairs():
+    for corpus_file in sorted(CORPORA.glob("corpus-*.json")):
+        corpus = json.loads(corpus_file.read_text())
+        original = corpus["original_sentence"]
+        for mutated in corpus["mutants_killed"]:
+            yield mutated, original
+            yield original, mutated
+
+
+class ERRANTAlignmentTest(TestCase):
+    def assert_same_alignment(self, err, corr, lev=False):
+        alignment = ERRANT_Alignment(_tokens(err), _tokens(corr), lev)
+        cost_matrix, op_matrix = alignment.align_cell_by_cell(lev)
+
+        assert alignment.cost_matrix == cost_matrix, (err, corr)
+        assert alignment.op_matrix == op_matrix, (err, corr)
+
+    def test_same_alignment_as_errant_on_the_fuzzing_corpora(self):
+        pairs = list(_sentence_pairs())
+        assert pairs
+
+        for err, corr in pairs:
+            self.assert_same_alignment(err, corr)
+            self.assert_same_alignment(err, corr, lev=True)
+
+    def test_same_alignment_as_errant_on_shuffled_sentences(self):
+        words = "the cat are before an books . who went a plane slowly".split()
+        rng = random.Random(42)
+        for _ in range(200):
+            err = " ".join(rng.choices(words, k=rng.randint(0, 25)))
+            corr = " ".join(rng.choices(words, k=rng.randint(0, 25)))
+            self.assert_same_alignment(err, corr)
+
+    def test_transposition(self):
+        alignment = ERRANT_Alignment(
+            _tokens("cat the sleeps"), _tokens("the cat sleeps")
+        )
+
+        assert alignment.align_seq[0] == ("T2", 0, 2, 0, 2)
@@ -67,3 +67,29 @@ class ArticleTest(ModelTestMixIn, TestCase):
     def test_load_article_without_language_information(self):
         art = Article.find_or_create(session, URL_CNN_KATHMANDU)
         assert art
+
+    def test_find_by_ids(self):
+        found = Article.find_by_ids([self.article2.id, self.article1.id, -1])
+        assert found == {
+            self.article1.id: self.article1,
+            self.article2.id: self.article2,
+        }
+        assert Article.find_by_ids([]) == {}
+
+    def test_tokenization_cache_is_invalidated_by_edits(self):
+        from zeeguu.core.model.article_tokenization_cache import (
+            ArticleTokenizationCache,
+        )
+
+        cache = ArticleTokenizationCache(article_id=self.article1.id)
+        content_hash = ArticleTokenizationCache.content_hash_for(self.article1, [])
+        cache.set_tokenized_content(content_hash, "v1", {"tokenized_title": []})
+
+        assert cache.get_tokenized_content(content_hash, "v1") == {
+            "tokenized_title": []
+        }
+        assert cache.get_tokenized_content(content_hash, "v2") is None
+
+        self.article1.title = self.article1.title + " (updated)"
+        new_hash = ArticleTokenizationCache.content_hash_for(self.article1, [])
+        assert cache.get_tokenized_content(new_hash, "v1") is None
@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+from unittest import TestCase
+
+from zeeguu.core.nlp_pipeline.automatic_gec_tagging import AutoGECTagging
+
+
+class _Morph:
+    def __init__(self, features):
+        self.features = features
+
+    def to_dict(self):
+        return dict(self.features)
+
+
+class _CountingPipeline:
+    def __init__(self):
+        self.parsed = []
+
+    def __call__(self, sentence):
+        self.parsed.append(sentence)
+        return [
+            SimpleNamespace(text=word, morph=_Morph({"Number": "Sing"}))
+            for word in sentence.split()
+        ]
+
+
+class AutoGECTaggingReferenceCacheTest(TestCase):
+    def setUp(self):
+        self.pipeline = _CountingPipeline()
+        self.tagger = AutoGECTagging(
+            SimpleNamespace(spacy_pipe=self.pipeline), "en", reference_cache_size=2
+        )
+
+    def test_reference_is_parsed_once(self):
+        doc, morph = self.tagger.parse_reference("the cat sleeps")
+        again, _ = self.tagger.parse_reference("the cat sleeps")
+
+        assert again is doc
+        assert morph == [{"Number": "Sing"}] * 3
+        assert self.pipeline.parsed == ["the cat sleeps"]
+
+    def test_least_recently_used_reference_is_evicted(self):
+        self.tagger.parse_reference("a")
+        self.tagger.parse_reference("b")
+        self.tagger.parse_reference("a")
+        self.tagger.parse_reference("c")
+        self.tagger.parse_reference("a")
+        self.tagger.parse_reference("b")
+
+        assert self.pipeline.parsed == ["a", "b", "c", "b"]
@@ -0,0 +1,38 @@
+import threading
+from unittest import TestCase
+
+from zeeguu.core.background_jobs import BackgroundJobQueue
+
+
+class BackgroundJobQueueTest(TestCase):
+    def setUp(self):
+        self.batches = []
+        self.release = threading.Event()
+
+    def _handle(self, keys):
+        self.release.wait(5)
+        self.batches.append(keys)
+
+    def test_duplicate_keys_are_handled_once_and_batched(self):
+        queue = BackgroundJobQueue(
+            "test", self._handle, workers=1, max_batch_size=10, batch_wait=0.2
+        )
+        for key in [1, 2, 1, 3, 2]:
+            queue.submit(key)
+        self.release.set()
+
+        assert queue.drain(timeout=5)
+        assert [[1, 2, 3]] == self.batches
+        assert 2 == queue.stats()["duplicates"]
+
+    def test_full_queue_rejects_new_keys(self):
+        queue = BackgroundJobQueue(
+            "test", self._handle, workers=1, max_pending=1, batch_wait=1
+        )
+        assert queue.submit(1)
+        assert not queue.submit(2)
+        self.release.set()
+
+        assert queue.drain(timeout=5)
+        assert 1 == queue.stats()["rejected"]
+        assert not queue.submit(3)
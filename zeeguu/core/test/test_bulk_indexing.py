@@ -0,0 +1,114 @@
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from zeeguu.core.elastic import bulk_indexing
+from zeeguu.core.elastic.bulk_indexing import (
+    ReindexProgress,
+    bulk_actions,
+    existing_documents,
+)
+
+
+class FakeES:
+    def __init__(self, docs_by_article_id, legacy_docs):
+        self.docs_by_article_id = docs_by_article_id
+        self.legacy_docs = legacy_docs
+        self.calls = []
+
+    def search(self, index, body):
+        self.calls.append("search")
+        ids = body["query"]["terms"]["article_id"]
+        return {
+            "hits": {
+                "hits": [
+                    {"_id": es_id, "_source": source}
+                    for article_id, (es_id, source) in self.docs_by_article_id.items()
+                    if article_id in ids
+                ]
+            }
+        }
+
+    def mget(self, index, ids, source_includes):
+        self.calls.append("mget")
+        return {
+            "docs": [
+                (
+                    {"_id": each, "found": True, "_source": self.legacy_docs[each]}
+                    if each in self.legacy_docs
+                    else {"_id": each, "found": False}
+                )
+                for each in ids
+            ]
+        }
+
+
+def article(article_id, content):
+    return SimpleNamespace(
+        id=article_id,
+        get_content=lambda: content,
+        language=SimpleNamespace(name="Danish"),
+        topics=[],
+    )
+
+
+class BulkIndexingTest(TestCase):
+    def test_existing_documents_are_looked_up_once_per_batch(self):
+        es = FakeES(
+            {1: ("abc", {"article_id": 1, "content": "one", "sem_vec": [1]})},
+            {"2": {"content": "two", "sem_vec": [2]}},
+        )
+
+        found = existing_documents(es, [1, 2, 3])
+
+        assert es.calls == ["search", "mget"]
+        assert found[1][0] == "abc"
+        assert found[2][0] == "2"
+        assert 3 not in found
+
+    def test_only_new_and_changed_articles_are_embedded(self):
+        articles = [article(1, "same"), article(2, "changed"), article(3, "new")]
+        existing = {
+            1: ("a", {"content": "same", "sem_vec": [1.0]}),
+            2: ("b", {"content": "before", "sem_vec": [2.0]}),
+        }
+        embedded = []
+
+        def embeddings(pairs):
+            pairs = list(pairs)
+            embedded.extend(content for content, _ in pairs)
+            return [[0.5] for _ in pairs]
+
+        def document(article, session, current_doc, topics, is_disturbing, sem_vec):
+            if sem_vec is None:
+                sem_vec = current_doc["sem_vec"]
+            return {"article_id": article.id, "sem_vec": sem_vec}
+
+        progress = ReindexProgress()
+        with patch.object(
+            bulk_indexing, "get_embeddings_from_texts", embeddings
+        ), patch.object(
+            bulk_indexing, "_disturbing_article_ids", lambda ids: set()
+        ), patch.object(
+            bulk_indexing, "document_from_article", document
+        ):
+            actions = bulk_actions(articles, None, existing, progress)
+
+        assert embedded == ["changed", "new"]
+        assert [a["_op_type"] for a in actions] == ["update", "update", "create"]
+        assert actions[0]["doc"]["sem_vec"] == [1.0]
+        assert actions[2]["_source"]["sem_vec"] == [0.5]
+        assert progress.embeddings_computed == 2
+        assert progress.embeddings_reused == 1
+
+    def test_checkpoint(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "checkpoint.json")
+            assert ReindexProgress.load(path).last_article_id == 0
+
+            ReindexProgress(last_article_id=42, articles=10).save(path)
+
+            assert ReindexProgress.load(path).last_article_id == 42
+            assert ReindexProgress.load(path).articles == 10
@@ -0,0 +1,25 @@
+from unittest import TestCase
+
+from zeeguu.core.content_cleaning.content_cleaner import _remove_junk_patterns
+
+
+class RemoveJunkPatternsTest(TestCase):
+    def test_removes_the_patterns_in_the_text(self):
+        removed = []
+        text = "Det var koldt.\nAdvertisement\nArtiklen fortsætter efter annoncenI dag."
+
+        assert _remove_junk_patterns(text, removed.append) == "Det var koldt.I dag."
+        assert removed == ["\nAdvertisement\n", "Artiklen fortsætter efter annoncen"]
+
+    def test_a_removal_can_reveal_a_later_pattern(self):
+        # "\ntrue\n" is only in the text after "\nAdvertisement\n" is removed,
+        # as it would be when replacing the patterns one after the other
+        text = "Det var koldt.\ntr\nAdvertisement\nue\nI dag."
+
+        assert _remove_junk_patterns(text) == "Det var koldt.I dag."
+
+    def test_an_earlier_pattern_revealed_by_a_removal_stays(self):
+        # the patterns are removed in the order of the list, once
+        text = "Det var koldt.\nAdver\ntrue\ntisement\nI dag."
+
+        assert _remove_junk_patterns(text) == "Det var koldt.\nAdvertisement\nI dag."
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from zeeguu.core.semantic_vector_api import retrieve_embeddings
+from zeeguu.core.semantic_vector_api.embedding_store import EmbeddingStore
+
+
+class EmbeddingStoreTest(TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.folder.name, "embedding_cache.sqlite")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_embeddings_are_keyed_by_language_and_text(self):
+        store = EmbeddingStore(max_size=10, db_path=None)
+        store.put("hund", "danish", [0.1, 0.2])
+
+        assert store.get("hund", "danish") == [0.1, 0.2]
+        assert store.get("hund", "german") is None
+        assert store.get("hunde", "danish") is None
+
+    def test_persistent_embeddings_are_shared(self):
+        EmbeddingStore(db_path=self.db_path).put("hund", "danish", [0.1, 0.2])
+
+        # e.g. another worker, or the same one after a restart
+        store = EmbeddingStore(db_path=self.db_path)
+        assert store.get("hund", "danish") == [0.1, 0.2]
+        assert store.stats()["persistent_hits"] == 1
+
+    def test_only_new_texts_are_sent_to_the_api(self):
+        store = EmbeddingStore(db_path=None)
+        store.put("known", "danish", [1.0])
+        sent = []
+
+        def embed(content, language):
+            sent.append(content)
+            return None if content == "failing" else [2.0]
+
+        with patch.object(retrieve_embeddings, "embedding_store", store), patch.object(
+            retrieve_embeddings, "_embedding_or_none", embed
+        ):
+            texts = [("known", "danish"), ("new", "danish"), ("failing", "danish")]
+            assert retrieve_embeddings.get_embeddings_from_texts(texts) == [
+                [1.0],
+                [2.0],
+                None,
+            ]
+            assert retrieve_embeddings.get_embeddings_from_texts(texts) == [
+                [1.0],
+                [2.0],
+                None,
+            ]
+
+        assert sorted(sent) == ["failing", "failing", "new"]
@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from zeeguu.core.elastic.client import (
+    get_es_client,
+    es_client_stats,
+    reset_es_client_stats,
+    _stats,
+)
+
+
+class ElasticsearchClientTest(TestCase):
+    def setUp(self):
+        reset_es_client_stats()
+
+    def test_client_is_reused(self):
+        # creating the client does not connect to ES, so this works offline
+        assert get_es_client() is get_es_client()
+
+    def test_stats_histogram(self):
+        _stats.record(3, waited_for_pool=False, failed=False)
+        _stats.record(120, waited_for_pool=True, failed=False)
+        _stats.record(9000, waited_for_pool=False, failed=True)
+
+        stats = es_client_stats()
+        assert stats["requests"] == 3
+        assert stats["failed_requests"] == 1
+        assert stats["pool_waits"] == 1
+        assert stats["latency_histogram"]["<=5ms"] == 1
+        assert stats["latency_histogram"]["<=250ms"] == 1
+        assert stats["latency_histogram"][">5000ms"] == 1
@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from zeeguu.core.util.multi_pattern_matcher import MultiPatternMatcher
+
+PATTERNS = ["shot", "shot dead", "dead", "killed", "Killed"]
+TEXT = "one man shot dead, two killed; shot"
+
+
+class MultiPatternMatcherTest(TestCase):
+    def test_finds_overlapping_matches_with_positions(self):
+        matcher = MultiPatternMatcher(PATTERNS)
+        assert matcher.matches(TEXT) == [
+            (8, 0),
+            (8, 1),
+            (13, 2),
+            (23, 3),
+            (31, 0),
+        ]
+        assert matcher.first_occurrences(TEXT) == {0: 8, 1: 8, 2: 13, 3: 23}
+
+    def test_first_found_follows_the_order_of_the_patterns(self):
+        matcher = MultiPatternMatcher(PATTERNS)
+        assert matcher.first_found(TEXT) == 0
+        assert matcher.first_found("nothing here") is None
+        # the only occurrence of "dead" starts the text
+        assert matcher.first_found("dead end", min_start=1) is None
+
+    def test_ignore_case(self):
+        matcher = MultiPatternMatcher(PATTERNS, ignore_case=True)
+        assert matcher.found("Two KILLED") == [3, 4]
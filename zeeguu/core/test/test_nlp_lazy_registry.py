@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from zeeguu.core.nlp_pipeline.lazy_registry import LazyRegistry
+
+
+class LazyRegistryTest(TestCase):
+    def setUp(self):
+        self.built = []
+
+        def factory(code):
+            def create():
+                self.built.append(code)
+                return f"pipeline-{code}"
+
+            return create
+
+        self.registry = LazyRegistry(
+            "test", {code: factory(code) for code in ["en", "da"]}
+        )
+
+    def test_membership_does_not_load(self):
+        assert "da" in self.registry
+        assert "fr" not in self.registry
+        assert list(self.registry.keys()) == ["en", "da"]
+        assert self.built == []
+
+    def test_loads_once_on_first_use(self):
+        assert self.registry["da"] == "pipeline-da"
+        assert self.registry["da"] == "pipeline-da"
+        assert self.built == ["da"]
+        assert self.registry.loaded() == ["da"]
+
+    def test_unknown_language(self):
+        with self.assertRaises(KeyError):
+            self.registry["fr"]
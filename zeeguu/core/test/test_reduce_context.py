@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from pytest import approx
+
+from zeeguu.core.nlp_pipeline import ContextReducer
+from zeeguu.core.test.stub_nlp_pipeline import animal_pipeline
+
+ARTICLE = (
+    "Cars honk. "
+    "Dogs bark. "
+    "Cats sleep. "
+    "Cats and dogs and cars are all over the place in this very long sentence."
+)
+
+
+class ContextReducerSimilarSentencesTest(TestCase):
+    def setUp(self):
+        self.pipeline = animal_pipeline()
+
+    def test_most_similar_sentences_first(self):
+        result = ContextReducer.get_similar_sentences(
+            self.pipeline, sentence="cats purr", article=ARTICLE
+        )
+
+        assert result["top_1_sent"] == "Cats sleep."
+        assert [text for _, text in result["top_10_sents_w_sim"]] == [
+            "Cats sleep.",
+            "Dogs bark.",
+            "Cars honk.",
+        ]
+        similarities = [sim for sim, _ in result["top_10_sents_w_sim"]]
+        assert similarities == approx([1.0, 0.8, 0.0], abs=1e-6)
+
+    def test_only_the_top_k_sentences(self):
+        result = ContextReducer.get_similar_sentences(
+            self.pipeline, sentence="cats purr", article=ARTICLE, top_k=2
+        )
+
+        assert [text for _, text in result["top_10_sents_w_sim"]] == [
+            "Cats sleep.",
+            "Dogs bark.",
+        ]
+
+    def test_longer_sentences_are_left_out(self):
+        result = ContextReducer.get_similar_sentences(
+            self.pipeline, sentence="cats purr", article=ARTICLE, max_length=2
+        )
+
+        # "Cats sleep." has three tokens
+        assert result == {"top_1_sent": None, "top_10_sents_w_sim": []}
+
+        result = ContextReducer.get_similar_sentences(
+            self.pipeline, sentence="cats purr", article=ARTICLE, max_length=100
+        )
+        assert len(result["top_10_sents_w_sim"]) == 4
+
+    def test_empty_article(self):
+        result = ContextReducer.get_similar_sentences(
+            self.pipeline, sentence="cats purr", article=""
+        )
+
+        assert result == {"top_1_sent": None, "top_10_sents_w_sim": []}
@@ -9,7 +9,7 @@ from zeeguu.core.test.rules.scheduler_rule import SchedulerRule
 from zeeguu.core.model.db import db
 from datetime import datetime, timedelta
 
-from zeeguu.core.word_scheduling import ONE_DAY
+from zeeguu.core.word_scheduling import ONE_DAY, FourLevelsPerWord
 
 db_session = db.session
 
@@ -229,6 +229,73 @@ class SchedulerTest(ModelTestMixIn):
 
         self.assert_schedule(schedule, 0, 2, 0, 0)
 
+    def test_words_to_study_are_sorted_by_priority(self):
+        from zeeguu.core.word_scheduling.basicSR.basicSR import (
+            BasicSRSchedule,
+            priority_by_rank,
+        )
+
+        bookmarks = [BookmarkRule(self.four_levels_user).bookmark for _ in range(4)]
+        # the first three words have the same rank, so they are
+        # only ordered by their cooling intervals
+        for bookmark in bookmarks[:3]:
+            bookmark.user_word.meaning.origin.rank = 100
+        bookmarks[3].user_word.meaning.origin.rank = 50
+        db_session.commit()
+
+        # after a wrong answer the word is due again today
+        self._new_schedule_after_exercise(
+            bookmarks[0], OutcomeRule().wrong, datetime.now()
+        )
+        # a word closer to being learned, which is due today as well
+        schedule = self._new_schedule_after_exercise(
+            bookmarks[1], OutcomeRule().correct, datetime.now()
+        )
+        schedule.next_practice_time = datetime.now()
+        db_session.add(schedule)
+        db_session.commit()
+
+        to_study = FourLevelsPerWord.user_words_to_study(self.four_levels_user)
+
+        def cooling_interval(user_word):
+            schedule = BasicSRSchedule.find_by_user_word(user_word)
+            return schedule.cooling_interval if schedule else None
+
+        expected = sorted(
+            to_study, key=lambda each: priority_by_rank(each, cooling_interval(each))
+        )
+        assert to_study == expected
+
+        user_words = [each.user_word for each in bookmarks]
+        # lowest rank first; then, for the same rank, the highest cooling
+        # interval first, and the unscheduled word last
+        assert [each for each in to_study if each in user_words] == [
+            user_words[3],
+            user_words[1],
+            user_words[0],
+            user_words[2],
+        ]
+
+    def test_count_of_user_words_to_study(self):
+        bookmarks = [BookmarkRule(self.four_levels_user).bookmark for _ in range(3)]
+        self._new_schedule_after_exercise(
+            bookmarks[0], OutcomeRule().wrong, datetime.now()
+        )
+
+        to_study = FourLevelsPerWord.user_words_to_study(self.four_levels_user)
+        assert len(to_study) == FourLevelsPerWord.count_of_user_words_to_study(
+            self.four_levels_user
+        )
+
+        # the outcome of an exercise invalidates the cached count
+        self._new_schedule_after_exercise(
+            bookmarks[0], OutcomeRule().correct, datetime.now()
+        )
+        to_study = FourLevelsPerWord.user_words_to_study(self.four_levels_user)
+        assert len(to_study) == FourLevelsPerWord.count_of_user_words_to_study(
+            self.four_levels_user
+        )
+
     # ================================================================================================================
     # A few helper functions
     # ================================================================================================================
@@ -0,0 +1,76 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from zeeguu.core.test.model_test_mixin import ModelTestMixIn
+from zeeguu.core.test.rules.language_rule import LanguageRule
+from zeeguu.core.tokenization import NLTKTokenizer, TokenizerModel
+from zeeguu.core.tokenization import tokenization_pool
+from zeeguu.core.tokenization.tokenization_pool import PooledStanzaTokenizer
+
+
+class TokenizationPoolTest(ModelTestMixIn):
+    def setUp(self):
+        super().setUp()
+        self.en_lang = LanguageRule.get_or_create_language("en")
+
+    def test_overloaded_pool_falls_back_to_nltk(self):
+        text = "This is a test sentence."
+        tokenizer = PooledStanzaTokenizer(
+            self.en_lang, TokenizerModel.STANZA_TOKEN_ONLY
+        )
+
+        with patch.object(tokenization_pool, "TOKENIZATION_MAX_PENDING", 0):
+            overloaded_before = tokenization_pool.tokenization_pool_stats()[
+                "overloaded"
+            ]
+            tokens = tokenizer.tokenize_text(text)
+
+        assert tokens == NLTKTokenizer(self.en_lang).tokenize_text(text)
+        assert tokenizer.degraded
+        assert (
+            tokenization_pool.tokenization_pool_stats()["overloaded"]
+            == overloaded_before + 1
+        )
+
+    def test_timed_out_call_keeps_its_slot_until_it_finishes(self):
+        text = "This is a test sentence."
+        tokenizer = PooledStanzaTokenizer(
+            self.en_lang, TokenizerModel.STANZA_TOKEN_ONLY
+        )
+        release_worker = threading.Event()
+
+        def slow_tokenize_in_worker(*args):
+            release_worker.wait()
+            return []
+
+        pool = ThreadPoolExecutor(max_workers=1)
+        with patch.object(
+            tokenization_pool, "_get_pool", return_value=pool
+        ), patch.object(
+            tokenization_pool, "_tokenize_in_worker", slow_tokenize_in_worker
+        ), patch.object(
+            tokenization_pool, "TOKENIZATION_TIMEOUT", 0.01
+        ), patch.object(
+            tokenization_pool, "TOKENIZATION_MAX_PENDING", 1
+        ):
+            pending_before = tokenization_pool.tokenization_pool_stats()["pending"]
+            timeouts_before = tokenization_pool.tokenization_pool_stats()["timeouts"]
+            overloaded_before = tokenization_pool.tokenization_pool_stats()[
+                "overloaded"
+            ]
+
+            tokenizer.tokenize_text(text)
+            stats = tokenization_pool.tokenization_pool_stats()
+            assert stats["timeouts"] == timeouts_before + 1
+            assert stats["pending"] == pending_before + 1
+
+            # the worker is still busy, so the next call is not admitted
+            tokenizer.tokenize_text(text)
+            stats = tokenization_pool.tokenization_pool_stats()
+            assert stats["overloaded"] == overloaded_before + 1
+
+            release_worker.set()
+            pool.shutdown(wait=True)
+
+        assert tokenization_pool.tokenization_pool_stats()["pending"] == pending_before
@@ -390,3 +390,16 @@ class TokenizationTest(ModelTestMixIn):
         )
         assert ["En", "20-årig", "mand"] == [t.text for t in token_number_with_text]
         assert not token_number_with_text[1].is_like_num
+
+    def test_tokenize_many_matches_tokenize_text(self):
+        texts = [
+            "It's a sentence. Sentence two is here.",
+            "",
+            "First paragraph.\n\nSecond paragraph, with two sentences. Here.",
+        ]
+        one_by_one = [
+            self.en_tokenizer.tokenize_text(t, flatten=False, start_token_i=3)
+            for t in texts
+        ]
+        in_bulk = self.en_tokenizer.tokenize_many(texts, flatten=False, start_token_i=3)
+        assert in_bulk == one_by_one
@@ -0,0 +1,69 @@
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from zeeguu.core.util import two_tier_cache
+from zeeguu.core.util.two_tier_cache import TwoTierCache
+
+
+class TwoTierCacheTest(TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.folder.name, "cache.sqlite")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_persistent_tier_keeps_the_newest_entries(self):
+        cache = TwoTierCache(
+            "test", max_size=10, db_path=self.db_path, max_persistent_size=3
+        )
+        with patch.object(two_tier_cache, "PRUNE_EVERY_N_WRITES", 5):
+            for i in range(5):
+                with patch.object(two_tier_cache.time, "time", return_value=i):
+                    cache.put(f"key {i}", i)
+
+        assert cache.stats()["persistent_size"] == 3
+        reader = TwoTierCache("test", max_size=10, db_path=self.db_path)
+        assert [reader.get(f"key {i}") for i in range(5)] == [None, None, 2, 3, 4]
+
+    def test_namespaces_are_pruned_separately(self):
+        other = TwoTierCache("other", max_size=10, db_path=self.db_path)
+        other.put("key", "value")
+        cache = TwoTierCache(
+            "test", max_size=10, db_path=self.db_path, max_persistent_size=0
+        )
+        with patch.object(two_tier_cache, "PRUNE_EVERY_N_WRITES", 1):
+            cache.put("key", "value")
+
+        assert cache.stats()["persistent_size"] == 0
+        assert other.stats()["persistent_size"] == 1
+
+    def test_entries_can_be_kept_out_of_the_persistent_tier(self):
+        cache = TwoTierCache("test", max_size=10, db_path=self.db_path)
+        cache.put("query", [1.0], persist=False)
+
+        assert cache.get("query") == [1.0]
+        assert cache.stats()["persistent_size"] == 0
+
+    def test_unusable_database_behaves_like_a_miss(self):
+        cache = TwoTierCache("test", max_size=10, db_path=self.folder.name)
+
+        cache.put("key", "value")
+        assert cache.get("key") == "value"
+        assert (
+            TwoTierCache("test", max_size=10, db_path=self.folder.name).get("key")
+            is None
+        )
+
+    def test_invalidate_drops_the_key_from_both_tiers(self):
+        cache = TwoTierCache("test", max_size=10, db_path=self.db_path)
+        cache.put("key", 1)
+        cache.put("other", 2)
+
+        cache.invalidate("key")
+
+        assert cache.get("key") is None
+        assert cache.get("other") == 2
+        assert cache.stats()["persistent_size"] == 1
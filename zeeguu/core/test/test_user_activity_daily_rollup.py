@@ -0,0 +1,156 @@
+from datetime import datetime
+
+from zeeguu.core.model import UserActivityDailyRollup
+from zeeguu.core.model.db import db
+from zeeguu.core.test.model_test_mixin import ModelTestMixIn
+from zeeguu.core.test.rules.bookmark_rule import BookmarkRule
+from zeeguu.core.test.rules.cohort_rule import CohortRule
+from zeeguu.core.test.rules.exercise_rule import ExerciseRule
+from zeeguu.core.test.rules.exercise_session_rule import ExerciseSessionRule
+from zeeguu.core.test.rules.language_rule import LanguageRule
+from zeeguu.core.test.rules.outcome_rule import OutcomeRule
+from zeeguu.core.test.rules.user_reading_session_rule import ReadingSessionRule
+from zeeguu.core.test.rules.user_rule import UserRule
+from zeeguu.core.user_statistics.activity import (
+    activity_duration_by_day,
+    activity_totals_for_cohort,
+)
+
+db_session = db.session
+
+
+class UserActivityDailyRollupTest(ModelTestMixIn):
+    def setUp(self):
+        super().setUp()
+        self.user = UserRule().user
+
+    def _rollup(self, user_id, date, language_id):
+        db_session.expire_all()
+        return UserActivityDailyRollup.query.filter_by(
+            user_id=user_id, date=date, language_id=language_id
+        ).one()
+
+    def _total(self, user_id, date, counter):
+        db_session.expire_all()
+        return sum(
+            getattr(each, counter)
+            for each in UserActivityDailyRollup.query.filter_by(
+                user_id=user_id, date=date
+            )
+        )
+
+    def test_reading_duration_is_rolled_up_by_day(self):
+        reading_session = ReadingSessionRule().w_session
+        reading_session.duration = 30000
+        db_session.commit()
+        reading_session.duration = 45000
+        db_session.commit()
+
+        day = reading_session.start_time.date()
+        language_id = reading_session.article.language_id
+        rollup = self._rollup(reading_session.user_id, day, language_id)
+        assert rollup.reading_ms == 45000
+
+        activity = activity_duration_by_day(reading_session.user)
+        assert activity["reading"] == [
+            {"date": day.strftime("%Y-%m-%d"), "seconds": 45}
+        ]
+        assert activity["exercises"] == []
+
+    def test_exercises_are_counted_by_day_in_the_language_of_the_word(self):
+        exercise_session = ExerciseSessionRule(self.user).exerciseSession
+        today = datetime.now()
+        correct = ExerciseRule(exercise_session, OutcomeRule().correct, today)
+        ExerciseRule(exercise_session, OutcomeRule().wrong, today)
+
+        assert self._total(self.user.id, today.date(), "exercises") == 2
+        assert self._total(self.user.id, today.date(), "correct_first_try") == 1
+
+        language_id = correct.exercise.user_word.meaning.origin.language_id
+        assert (
+            self._rollup(self.user.id, today.date(), language_id).correct_first_try == 1
+        )
+
+    def test_deleted_activity_is_subtracted(self):
+        reading_session = ReadingSessionRule().w_session
+        reading_session.duration = 30000
+        exercise_session = ExerciseSessionRule(self.user).exerciseSession
+        today = datetime.now()
+        exercise = ExerciseRule(exercise_session, OutcomeRule().correct, today)
+        db_session.commit()
+
+        db_session.delete(reading_session)
+        db_session.delete(exercise.exercise)
+        db_session.commit()
+
+        day = reading_session.start_time.date()
+        assert self._total(reading_session.user_id, day, "reading_ms") == 0
+        assert self._total(self.user.id, today.date(), "exercises") == 0
+        assert self._total(self.user.id, today.date(), "correct_first_try") == 0
+
+    def test_cohort_totals_are_in_the_language_of_the_cohort(self):
+        reading_session = ReadingSessionRule().w_session
+        reading_session.article.language = LanguageRule().de
+        db_session.commit()
+        reading_session.duration = 30000
+        db_session.commit()
+        student_id = reading_session.user_id
+        day = reading_session.start_time
+        cohort = CohortRule().cohort
+
+        cohort.language = LanguageRule().de
+        db_session.commit()
+        totals = activity_totals_for_cohort([student_id], cohort.id, day, day)
+        assert totals[student_id]["reading_ms"] == 30000
+
+        cohort.language = LanguageRule().fr
+        db_session.commit()
+        totals = activity_totals_for_cohort([student_id], cohort.id, day, day)
+        assert totals[student_id]["reading_ms"] == 0
+
+    def test_translations_are_counted_in_the_language_of_the_word(self):
+        bookmark = BookmarkRule(self.user).bookmark
+        day = bookmark.time.date()
+        language_id = bookmark.user_word.meaning.origin.language_id
+
+        assert self._rollup(self.user.id, day, language_id).translations == 1
+
+        db_session.delete(bookmark)
+        db_session.commit()
+        assert self._rollup(self.user.id, day, language_id).translations == 0
+
+    def test_exercise_time_is_counted_in_the_languages_of_the_words(self):
+        exercise_session = ExerciseSessionRule(self.user).exerciseSession
+        exercise_session.duration = 10000
+        db_session.commit()
+        day = exercise_session.start_time.date()
+        # no word exercised yet
+        assert self._total(self.user.id, day, "exercise_ms") == 0
+
+        exercise = ExerciseRule(exercise_session, OutcomeRule().correct).exercise
+        language_id = exercise.user_word.meaning.origin.language_id
+        assert self._rollup(self.user.id, day, language_id).exercise_ms == 10000
+
+        exercise_session.duration = 25000
+        db_session.commit()
+        assert self._rollup(self.user.id, day, language_id).exercise_ms == 25000
+
+        db_session.delete(exercise)
+        db_session.commit()
+        db_session.delete(exercise_session)
+        db_session.commit()
+        assert self._rollup(self.user.id, day, language_id).exercise_ms == 0
+
+    def test_cohort_without_language_only_has_exercise_time(self):
+        exercise_session = ExerciseSessionRule(self.user).exerciseSession
+        ExerciseRule(exercise_session, OutcomeRule().correct, datetime.now())
+        exercise_session.duration = 10000
+        db_session.commit()
+        day = exercise_session.start_time
+        cohort = CohortRule().cohort
+        cohort.language = None
+        db_session.commit()
+
+        totals = activity_totals_for_cohort([self.user.id], cohort.id, day, day)
+        assert totals[self.user.id]["exercise_ms"] == 10000
+        assert totals[self.user.id]["exercises"] == 0
@@ -7,6 +7,7 @@ from zeeguu.core.test.rules.article_rule import ArticleRule
 from zeeguu.core.test.rules.language_rule import LanguageRule
 from zeeguu.core.test.rules.user_article_rule import UserArticleRule
 from zeeguu.core.test.rules.user_rule import UserRule
+from zeeguu.core.model.personal_copy import PersonalCopy
 from zeeguu.core.model.user_article import UserArticle
 
 db_session = zeeguu.core.model.db.session
@@ -30,3 +31,22 @@ class UserArticleTest(ModelTestMixIn, TestCase):
     def test_all_starred_or_liked_articles(self):
         self.article.star_for_user(db_session, self.user)
         assert 1 == len(UserArticle.all_starred_or_liked_articles_of_user(self.user))
+
+    def test_user_article_info_many(self):
+        other_article = ArticleRule().article
+        self.article.star_for_user(db_session, self.user)
+        db_session.add(PersonalCopy(self.user, other_article))
+        db_session.commit()
+
+        infos = UserArticle.user_article_info_many(
+            self.user, [other_article, self.article], with_summary=False
+        )
+
+        assert [other_article.id, self.article.id] == [i["id"] for i in infos]
+        assert not infos[0]["starred"]
+        assert infos[0]["has_personal_copy"]
+        assert infos[1]["starred"]
+        assert not infos[1]["has_personal_copy"]
+        assert infos[1] == UserArticle.user_article_info(
+            self.user, self.article, with_summary=False
+        )
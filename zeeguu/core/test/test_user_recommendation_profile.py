@@ -0,0 +1,43 @@
+from zeeguu.core.test.model_test_mixin import ModelTestMixIn
+from zeeguu.core.test.rules.topic_rule import TopicRule
+from zeeguu.core.test.rules.user_rule import UserRule
+from zeeguu.core.content_recommender.user_recommendation_profile import (
+    recommendation_profile_for,
+)
+from zeeguu.core.model import TopicFilter, UserLanguage
+from zeeguu.core.model.db import db
+
+
+class UserRecommendationProfileTest(ModelTestMixIn):
+    def setUp(self):
+        super().setUp()
+        self.user = UserRule().user
+        UserLanguage.find_or_create(db.session, self.user, self.user.learned_language)
+        db.session.commit()
+
+    def test_profile_is_cached(self):
+        assert recommendation_profile_for(self.user) is recommendation_profile_for(
+            self.user
+        )
+
+    def test_new_filter_invalidates_profile(self):
+        before = recommendation_profile_for(self.user)
+        assert before.topics_to_exclude == []
+
+        topic = TopicRule.get_or_create_topic(1)
+        TopicFilter.find_or_create(db.session, self.user, topic)
+
+        after = recommendation_profile_for(self.user)
+        assert after is not before
+        assert after.topics_to_exclude == [topic.title]
+
+    def test_profile_is_only_invalidated_on_commit(self):
+        before = recommendation_profile_for(self.user)
+
+        topic = TopicRule.get_or_create_topic(1)
+        db.session.add(TopicFilter(self.user, topic))
+        db.session.flush()
+        assert recommendation_profile_for(self.user) is before
+
+        db.session.commit()
+        assert recommendation_profile_for(self.user) is not before
@@ -185,3 +185,33 @@ class FleschKincaidReadingEaseDifficultyEstimatorTest(ModelTestMixIn, TestCase):
             DA_TEXT_YING_MEDIUM, lan, self.user
         )
         self.assertEqual(d["discrete"], "MEDIUM")
+
+    # BATCH ESTIMATION
+    def test_batch_estimation_same_as_one_by_one(self):
+        lan = LanguageRule().de
+        texts = [DE_EASY_TEXT, DE_MEDIUM_TEXT, DE_HARD_TEXT, ""]
+
+        batch = FleschKincaidDifficultyEstimator.estimate_difficulties(texts, lan)
+
+        self.assertEqual(len(texts), len(batch))
+        for text, difficulty in zip(texts, batch):
+            self.assertEqual(
+                FleschKincaidDifficultyEstimator.estimate_difficulty(
+                    text, lan, self.user
+                ),
+                difficulty,
+            )
+
+    def test_syllable_counts_are_memoized_per_language(self):
+        lan = LanguageRule().de
+        FleschKincaidDifficultyEstimator.syllables_in_words(["kino"], lan)
+
+        self.assertIn(
+            "kino", FleschKincaidDifficultyEstimator._syllable_counts[lan.code]
+        )
+        self.assertEqual(
+            2,
+            FleschKincaidDifficultyEstimator.estimate_number_of_syllables_in_word_pyphen(
+                "kino", lan
+            ),
+        )
@@ -2,6 +2,7 @@ from .token import Token
 from .stanza_tokenizer import StanzaTokenizer
 from .nltk_tokenizer import NLTKTokenizer
 from .zeeguu_tokenizer import TokenizerModel
+from .tokenization_pool import PooledStanzaTokenizer, tokenization_pool_enabled
 
 
 """
@@ -14,6 +15,20 @@ TOKENIZER_MODEL = TokenizerModel.STANZA_TOKEN_ONLY
 
 def get_tokenizer(language, model):
     if model in StanzaTokenizer.STANZA_MODELS:
+        if tokenization_pool_enabled():
+            return PooledStanzaTokenizer(language, model)
         return StanzaTokenizer(language, model)
     else:
         return NLTKTokenizer(language)
+
+
+def get_tokenizer_version(model):
+    """
+    Identifies the model and library version of the tokenizer that
+    get_tokenizer returns, without having to load it. Cached tokenizations
+    are only valid for the version they were computed with.
+    """
+    if model in StanzaTokenizer.STANZA_MODELS:
+        return StanzaTokenizer.version(model)
+    else:
+        return NLTKTokenizer.version(TokenizerModel.NLTK)
@@ -53,6 +53,10 @@ class NLTKTokenizer(ZeeguuTokenizer):
         text = APOSTROPHE_BEFORE_WORD.sub(lambda m: f"{m.group(1)} {m.group(2)}", text)
         return text
 
+    @classmethod
+    def version(cls, model: TokenizerModel = TokenizerModel.NLTK):
+        return f"{model.name}-nltk-{nltk.__version__}"
+
     def is_language_supported(self, language: Language):
         return language.name.lower() in NLTK_SUPPORTED_LANGUAGES
 
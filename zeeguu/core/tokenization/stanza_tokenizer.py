@@ -57,6 +57,10 @@ class StanzaTokenizer(ZeeguuTokenizer):
                         StanzaTokenizer.CACHED_NLP_PIPELINES[key] = pipeline
         self.nlp_pipeline = StanzaTokenizer.CACHED_NLP_PIPELINES[key]
 
+    @classmethod
+    def version(cls, model: TokenizerModel):
+        return f"{model.name}-stanza-{stanza.__version__}"
+
     def is_language_supported(self, language: Language):
         #   This is based on the models installed, if we expand the languages we support
         # we then have to install them too.
@@ -85,6 +89,52 @@ class StanzaTokenizer(ZeeguuTokenizer):
         start_token_i: int = 0,
         start_sentence_i: int = 0,
         start_paragraph_i: int = 0,
+    ):
+        return self._tokens_from_doc(
+            self.nlp_pipeline(text),
+            as_serializable_dictionary,
+            flatten,
+            start_token_i,
+            start_sentence_i,
+            start_paragraph_i,
+        )
+
+    def tokenize_many(
+        self,
+        texts: "list[str]",
+        as_serializable_dictionary: bool = True,
+        flatten: bool = True,
+        start_token_i: int = 0,
+        start_sentence_i: int = 0,
+        start_paragraph_i: int = 0,
+    ):
+        # Stanza runs all the texts through the pipeline in one call when
+        # it's given a list of Documents. Each text is still tokenized on
+        # its own, so the coordinates of every result start from the given
+        # offsets, as in tokenize_text.
+        if not texts:
+            return []
+        docs = self.nlp_pipeline([stanza.Document([], text=text) for text in texts])
+        return [
+            self._tokens_from_doc(
+                doc,
+                as_serializable_dictionary,
+                flatten,
+                start_token_i,
+                start_sentence_i,
+                start_paragraph_i,
+            )
+            for doc in docs
+        ]
+
+    def _tokens_from_doc(
+        self,
+        doc,
+        as_serializable_dictionary: bool,
+        flatten: bool,
+        start_token_i: int,
+        start_sentence_i: int,
+        start_paragraph_i: int,
     ):
         # Backwards compatability (to texts without coordinates.)
         if start_token_i is None:
@@ -94,7 +144,6 @@ class StanzaTokenizer(ZeeguuTokenizer):
         if start_paragraph_i is None:
             start_paragraph_i = 0
         paragraphs = []
-        doc = self.nlp_pipeline(text)
         current_paragraph = []
         s_i = 0
         for sentence in doc.sentences:
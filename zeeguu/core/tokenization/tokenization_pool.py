@@ -0,0 +1,224 @@
+"""
+
+Optional pool of worker processes that run the Stanza tokenization
+out of the API request threads.
+
+Stanza is CPU-bound and holds the GIL, so a long article tokenized inline
+blocks all the other threads of the gunicorn worker. When
+ZEEGUU_TOKENIZATION_WORKERS > 0, get_tokenizer returns a PooledStanzaTokenizer
+instead, which sends the work to a process pool; the Stanza pipelines of the
+languages in ZEEGUU_TOKENIZATION_PRELOAD_LANGUAGES are loaded when the pool
+workers start.
+
+The pool is bounded: when more than ZEEGUU_TOKENIZATION_MAX_PENDING calls are
+waiting for it, or when a call takes longer than ZEEGUU_TOKENIZATION_TIMEOUT
+seconds, the text is tokenized inline with the (much cheaper) NLTKTokenizer
+instead. Such a tokenizer is marked as degraded, so that its results are not
+cached as if they came from Stanza. A call that timed out keeps occupying
+its worker, so it still counts as pending until it really finishes.
+
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+
+from zeeguu.core.model.language import Language
+from zeeguu.core.tokenization.nltk_tokenizer import NLTKTokenizer
+from zeeguu.core.tokenization.zeeguu_tokenizer import ZeeguuTokenizer, TokenizerModel
+from zeeguu.logging import log
+
+TOKENIZATION_WORKERS = int(os.environ.get("ZEEGUU_TOKENIZATION_WORKERS", 0))
+TOKENIZATION_MAX_PENDING = int(
+    os.environ.get("ZEEGUU_TOKENIZATION_MAX_PENDING", 4 * max(TOKENIZATION_WORKERS, 1))
+)
+TOKENIZATION_TIMEOUT = float(os.environ.get("ZEEGUU_TOKENIZATION_TIMEOUT", 10))
+TOKENIZATION_PRELOAD_LANGUAGES = [
+    code
+    for code in os.environ.get("ZEEGUU_TOKENIZATION_PRELOAD_LANGUAGES", "").split(",")
+    if code
+]
+
+
+def _preload_pipelines(language_codes, model):
+    # runs in every worker process when it starts
+    from zeeguu.core.tokenization.stanza_tokenizer import StanzaTokenizer
+
+    for code in language_codes:
+        try:
+            StanzaTokenizer(Language(code, code), TokenizerModel(model))
+        except Exception as e:
+            print(f"Could not preload the Stanza pipeline for '{code}': {e}")
+
+
+def _tokenize_in_worker(language_code, language_name, model, method, args, kwargs):
+    # StanzaTokenizer.CACHED_NLP_PIPELINES keeps the pipeline loaded
+    # in the worker process between calls
+    from zeeguu.core.tokenization.stanza_tokenizer import StanzaTokenizer
+
+    tokenizer = StanzaTokenizer(
+        Language(language_code, language_name), TokenizerModel(model)
+    )
+    return getattr(tokenizer, method)(*args, **kwargs)
+
+
+class _PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.max_pending_seen = 0
+        self.calls = 0
+        self.overloaded = 0
+        self.timeouts = 0
+        self.failures = 0
+        self.total_service_time_ms = 0.0
+
+    def try_enter(self):
+        with self._lock:
+            if self.pending >= TOKENIZATION_MAX_PENDING:
+                self.overloaded += 1
+                return False
+            self.pending += 1
+            self.max_pending_seen = max(self.max_pending_seen, self.pending)
+            return True
+
+    def release(self, future=None):
+        # a call keeps its slot until its future is really done, even if
+        # the caller stopped waiting for it: cancel() can't stop a task
+        # that is already running in a worker
+        with self._lock:
+            self.pending -= 1
+
+    def record(self, elapsed_ms, timed_out=False, failed=False):
+        with self._lock:
+            self.calls += 1
+            self.total_service_time_ms += elapsed_ms
+            if timed_out:
+                self.timeouts += 1
+            if failed:
+                self.failures += 1
+
+    def as_dict(self):
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "workers": TOKENIZATION_WORKERS,
+                "max_pending": TOKENIZATION_MAX_PENDING,
+                "pending": self.pending,
+                "max_pending_seen": self.max_pending_seen,
+                "calls": self.calls,
+                "overloaded": self.overloaded,
+                "timeouts": self.timeouts,
+                "failures": self.failures,
+                "avg_service_time_ms": (
+                    round(self.total_service_time_ms / self.calls, 2)
+                    if self.calls
+                    else 0
+                ),
+            }
+
+
+_stats = _PoolStats()
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def tokenization_pool_enabled():
+    return TOKENIZATION_WORKERS > 0
+
+
+def _get_pool(model: TokenizerModel) -> ProcessPoolExecutor:
+    # one pool per process, like the ES client; a pool inherited
+    # through a fork from the parent process cannot be used
+    pid = os.getpid()
+    pool = _pools.get(pid)
+    if pool is not None:
+        return pool
+
+    with _pools_lock:
+        pool = _pools.get(pid)
+        if pool is None:
+            _pools.clear()
+            pool = ProcessPoolExecutor(
+                max_workers=TOKENIZATION_WORKERS,
+                # forking a process that already runs threads (and maybe
+                # torch) is not safe; the workers are started from scratch
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_preload_pipelines,
+                initargs=(TOKENIZATION_PRELOAD_LANGUAGES, int(model)),
+            )
+            _pools[pid] = pool
+        return pool
+
+
+def tokenization_pool_stats():
+    return _stats.as_dict()
+
+
+class PooledStanzaTokenizer(ZeeguuTokenizer):
+    """
+    Same interface as the StanzaTokenizer, but the work is done in the
+    tokenization pool, falling back to the NLTKTokenizer when the pool
+    is overloaded or too slow.
+    """
+
+    @classmethod
+    def version(cls, model: TokenizerModel):
+        from zeeguu.core.tokenization.stanza_tokenizer import StanzaTokenizer
+
+        return StanzaTokenizer.version(model)
+
+    def is_language_supported(self, language: Language):
+        return language.name.lower() in Language.CODES_OF_LANGUAGES_THAT_CAN_BE_LEARNED
+
+    def _run(self, method, *args, **kwargs):
+        if not _stats.try_enter():
+            log(f"Tokenization pool overloaded, using NLTK for {method}")
+            return self._fallback(method, *args, **kwargs)
+
+        start = time.time()
+        try:
+            future = _get_pool(self.model_type).submit(
+                _tokenize_in_worker,
+                self.language.code,
+                self.language.name,
+                int(self.model_type),
+                method,
+                args,
+                kwargs,
+            )
+        except Exception as e:
+            _stats.release()
+            _stats.record((time.time() - start) * 1000, failed=True)
+            log(f"Tokenization pool failed ({e}), using NLTK for {method}")
+            return self._fallback(method, *args, **kwargs)
+        future.add_done_callback(_stats.release)
+
+        try:
+            result = future.result(timeout=TOKENIZATION_TIMEOUT)
+            _stats.record((time.time() - start) * 1000)
+            return result
+        except TimeoutError:
+            # only cancels the call if it did not start yet
+            future.cancel()
+            _stats.record((time.time() - start) * 1000, timed_out=True)
+            log(f"Tokenization pool timed out, using NLTK for {method}")
+        except Exception as e:
+            _stats.record((time.time() - start) * 1000, failed=True)
+            log(f"Tokenization pool failed ({e}), using NLTK for {method}")
+        return self._fallback(method, *args, **kwargs)
+
+    def _fallback(self, method, *args, **kwargs):
+        self.degraded = True
+        return getattr(NLTKTokenizer(self.language), method)(*args, **kwargs)
+
+    def tokenize_text(self, text: str, *args, **kwargs):
+        return self._run("tokenize_text", text, *args, **kwargs)
+
+    def tokenize_many(self, texts: "list[str]", *args, **kwargs):
+        return self._run("tokenize_many", texts, *args, **kwargs)
+
+    def get_sentences(self, text: str):
+        return self._run("get_sentences", text)
@@ -16,6 +16,9 @@ class ZeeguuTokenizer:
     def __init__(self, language: Language, model: TokenizerModel):
         self.language = language
         self.model_type = model
+        # set by tokenizers that had to fall back to a cheaper model;
+        # their results should not be cached
+        self.degraded = False
 
     @classmethod
     def split_into_paragraphs(cls, text):
@@ -28,6 +31,10 @@ class ZeeguuTokenizer:
         """
         return PARAGRAPH_DELIMITER.split(text)
 
+    @classmethod
+    def version(cls, model: TokenizerModel):
+        raise NotImplementedError
+
     def is_language_supported(self, language: Language):
         raise NotImplementedError
 
@@ -61,5 +68,31 @@ class ZeeguuTokenizer:
         """
         raise NotImplementedError
 
+    def tokenize_many(
+        self,
+        texts: "list[str]",
+        as_serializable_dictionary=True,
+        flatten=True,
+        start_token_i: int = 0,
+        start_sentence_i: int = 0,
+        start_paragraph_i: int = 0,
+    ):
+        """
+        Tokenizes each of the texts as tokenize_text would, returning the
+        results in the same order. Tokenizers that can process several
+        documents at once override this to do it in bulk.
+        """
+        return [
+            self.tokenize_text(
+                text,
+                as_serializable_dictionary,
+                flatten,
+                start_token_i,
+                start_sentence_i,
+                start_paragraph_i,
+            )
+            for text in texts
+        ]
+
     def get_sentences(self, text: str):
         raise NotImplementedError
@@ -3,18 +3,35 @@ from sqlalchemy import text
 import zeeguu.core
 
 from zeeguu.core.model.db import db
+from zeeguu.core.user_statistics.activity import activity_totals_for_cohort
 
 
 def exercise_count_and_correctness_percentage(user_id, cohort_id, start_date, end_date):
-    outcome_stats = exercise_outcome_stats(user_id, cohort_id, start_date, end_date)
+    return exercise_count_and_correctness_percentage_for_cohort(
+        [user_id], cohort_id, start_date, end_date
+    )[user_id]
 
-    total = 0
-    for each in outcome_stats.values():
-        total += each
 
+def exercise_count_and_correctness_percentage_for_cohort(
+    user_ids, cohort_id, start_date, end_date
+):
+    """
+    exercise_count_and_correctness_percentage for many students, from the
+    daily activity rollup
+    :return: dict from user id to the count and correctness
+    """
+    totals = activity_totals_for_cohort(user_ids, cohort_id, start_date, end_date)
+    return {
+        user_id: _count_and_correctness_percentage(
+            totals[user_id]["exercises"], totals[user_id]["correct_first_try"]
+        )
+        for user_id in user_ids
+    }
+
+
+def _count_and_correctness_percentage(total, correct_count):
     correct_on_1st_try = "0"
     if total != 0:
-        correct_count = outcome_stats.get("C", 0) + outcome_stats.get("Correct", 0)
         correct_on_1st_try = int(correct_count / total * 100) / 100
 
     r = {"correct_on_1st_try": correct_on_1st_try, "number_of_exercises": total}
@@ -124,32 +141,8 @@ def number_of_distinct_words_in_exercises(user_id, cohort_id, start_date, end_da
 
 
 def number_of_learned_words(user_id, cohort_id, start_date, end_date):
-    query = """
-        select 	count(um.id)
-                
-            from user_word as um
-            
-            join meaning as m on um.meaning_id = m.id
-                
-            join phrase as origin_phrase on m.origin_id = origin_phrase.id
-            
-            where um.user_id=:userid 
-                and	um.learned_time > :startDate
-                and	um.learned_time < :endDate
-                and origin_phrase.language_id = (select language_id from cohort where cohort.id=:cohortId)
-    """
-
-    rows = db.session.execute(
-        text(query),
-        {
-            "userid": user_id,
-            "startDate": start_date,
-            "endDate": end_date,
-            "cohortId": cohort_id,
-        },
-    )
-
-    return {"learned_words_count": rows.first()[0]}
+    totals = activity_totals_for_cohort([user_id], cohort_id, start_date, end_date)
+    return {"learned_words_count": totals[user_id]["learned_words"]}
 
 
 def exercise_outcome_stats(user_id, cohort_id, start_date: str, end_date: str):
@@ -1,44 +1,30 @@
-from sqlalchemy import text
-
 import zeeguu.core
 
-from zeeguu.core.model.db import db
-from zeeguu.core.model.cohort import Cohort
+from zeeguu.core.user_statistics.activity import activity_totals_for_cohort
 
 
 def total_time_in_exercise_sessions(user_id, cohort_id, start_time, end_time):
-    # TODO: use also the cohort_id somehow
-    cohort = Cohort.find(cohort_id)
-
-    same_language_as_cohort_condition = ""
-    if cohort.language_id:
-        same_language_as_cohort_condition = (
-            f" WHERE p.language_id = {cohort.language_id} "
-        )
-
-    query = f"""
-        select sum(duration)
-        from user_exercise_session as ues
-        WHERE ues.id in (SELECT e.session_id from exercise e
-                        INNER JOIN user_word um on e.user_word_id = um.id 
-                        INNER JOIN meaning m on um.meaning_id = m.id
-                        INNER JOIN phrase p ON m.origin_id = p.id
-                        {same_language_as_cohort_condition})
-        and ues.start_time > :start_time
-        and ues.last_action_time < :end_time
-        and ues.user_id = :user_id
+    return total_time_in_exercise_sessions_for_cohort(
+        [user_id], cohort_id, start_time, end_time
+    )[user_id]
+
+
+def total_time_in_exercise_sessions_for_cohort(
+    user_ids, cohort_id, start_time, end_time
+):
     """
+    total_time_in_exercise_sessions for many students, from the daily
+    activity rollup, where the time of a session is counted in the
+    languages of the words exercised in it
+    :return: dict from user id to the exercise time
+    """
+    totals = activity_totals_for_cohort(user_ids, cohort_id, start_time, end_time)
+    return {
+        user_id: _exercise_time(totals[user_id]["exercise_ms"]) for user_id in user_ids
+    }
 
-    rows = db.session.execute(
-        text(query),
-        {
-            "user_id": user_id,
-            "start_time": start_time,
-            "end_time": end_time,
-        },
-    )
-    result = rows.first()[0]
 
+def _exercise_time(result):
     exercise_time_in_sec = 0
     if result:
         exercise_time_in_sec = int(result / 1000)
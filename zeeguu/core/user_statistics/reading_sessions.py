@@ -1,22 +1,58 @@
 from statistics import mean
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
 import zeeguu.core
 
 from zeeguu.core.model.db import db
+from zeeguu.core.user_statistics.activity import activity_totals_for_cohort
 
 
 def summarize_reading_activity(user_id, cohort_id, start_date, end_date):
+    return summarize_reading_activity_for_cohort(
+        [user_id], cohort_id, start_date, end_date
+    )[user_id]
+
+
+def summarize_reading_activity_for_cohort(user_ids, cohort_id, start_date, end_date):
+    """
+    summarize_reading_activity for many students, with a single query for
+    the texts, and the reading time from the daily activity rollup
+    :return: dict from user id to summary
+    """
+    sessions_by_user = {user_id: [] for user_id in user_ids}
+    if user_ids:
+        rows = db.session.execute(
+            text(
+                READING_SESSIONS_QUERY.format(user_condition="user_id in :userIds")
+            ).bindparams(bindparam("userIds", expanding=True)),
+            {
+                "userIds": list(user_ids),
+                "startDate": start_date,
+                "endDate": end_date,
+                "cohortId": cohort_id,
+            },
+        )
+        for row in rows:
+            session = dict(row._mapping)
+            sessions_by_user[session["user_id"]].append(session)
+
+    totals = activity_totals_for_cohort(user_ids, cohort_id, start_date, end_date)
+    return {
+        user_id: _summarize_reading_sessions(
+            sessions, totals[user_id]["reading_ms"] // 1000
+        )
+        for user_id, sessions in sessions_by_user.items()
+    }
+
+
+def _summarize_reading_sessions(r_sessions, reading_time):
     def _mean(l):
         if len(l) == 0:
             return 0
         return int(mean(l))
 
-    r_sessions = reading_sessions(user_id, cohort_id, start_date, end_date)
-
     distinct_texts = set()
-    reading_time = 0
     text_lengths = []
     text_difficulties = []
     for session in r_sessions:
@@ -25,8 +61,6 @@ def summarize_reading_activity(user_id, cohort_id, start_date, end_date):
             text_difficulties.append(session["difficulty"])
             distinct_texts.add(session["title"])
 
-        reading_time += int(session["duration_in_sec"])
-
     number_of_texts = len(distinct_texts)
 
     return {
@@ -50,8 +84,7 @@ def summarize_reading_activity(user_id, cohort_id, start_date, end_date):
 """
 
 
-def reading_sessions(user_id, cohort_id, from_date: str, to_date: str):
-    query = """
+READING_SESSIONS_QUERY = """
             select  u.id as session_id, 
                 user_id, 
                 start_time, 
@@ -70,7 +103,7 @@ def reading_sessions(user_id, cohort_id, from_date: str, to_date: str):
             on u.article_id = a.id
             
         where 
-            user_id = :userId
+            {user_condition}
             and start_time > :startDate
             and last_action_time <= :endDate
             and duration > 0
@@ -80,8 +113,10 @@ def reading_sessions(user_id, cohort_id, from_date: str, to_date: str):
         order by start_time desc
     """
 
+
+def reading_sessions(user_id, cohort_id, from_date: str, to_date: str):
     rows = db.session.execute(
-        text(query),
+        text(READING_SESSIONS_QUERY.format(user_condition="user_id = :userId")),
         {
             "userId": user_id,
             "startDate": from_date,
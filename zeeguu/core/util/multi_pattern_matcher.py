@@ -0,0 +1,101 @@
+"""
+
+Finds which of a list of literal patterns occur in a text, for the pattern
+lists of the content quality filters, the content cleaner and the
+disturbing content detection.
+
+A matcher is built once per pattern list (see matcher_for). Every pattern
+is looked up with str.find: that is one pass per pattern, but each one runs
+in C, and for lists of a few dozen patterns (the longest has 47) it is
+faster than a single pass of an Aho-Corasick automaton.
+
+Matches are reported as (start position, pattern id), where the pattern id
+is the index of the pattern in the list the matcher was built with.
+
+"""
+
+import threading
+
+
+class MultiPatternMatcher:
+    def __init__(self, patterns, ignore_case=False):
+        """
+        :param ignore_case: the patterns and the texts are lowercased
+            before matching
+        """
+        self.patterns = list(patterns)
+        self.ignore_case = ignore_case
+        self._needles = [self._normalize(p) for p in self.patterns]
+
+    def _normalize(self, text):
+        return text.lower() if self.ignore_case else text
+
+    def matches(self, text):
+        """
+        :return: all the (start, pattern id) occurrences of the patterns,
+            including overlapping ones, ordered by start and pattern id;
+            with ignore_case, the starts are positions in the lowercased text
+        """
+        text = self._normalize(text)
+        found = []
+        for pattern_id, needle in enumerate(self._needles):
+            if not needle:
+                continue
+            start = text.find(needle)
+            while start >= 0:
+                found.append((start, pattern_id))
+                start = text.find(needle, start + 1)
+        return sorted(found)
+
+    def first_occurrences(self, text):
+        """
+        :return: dict of pattern id to the start of its first occurrence,
+            for the patterns that occur in the text
+        """
+        text = self._normalize(text)
+        positions = (
+            (pattern_id, text.find(needle) if needle else -1)
+            for pattern_id, needle in enumerate(self._needles)
+        )
+        return {pattern_id: start for pattern_id, start in positions if start >= 0}
+
+    def found(self, text):
+        """
+        :return: the ids of the patterns that occur in the text, in order
+        """
+        return sorted(self.first_occurrences(text))
+
+    def first_found(self, text, min_start=0):
+        """
+        :return: the id of the first pattern (in the order of the list) whose
+            first occurrence starts at min_start or later, or None
+        """
+        # stops at the first pattern found
+        text = self._normalize(text)
+        for pattern_id, needle in enumerate(self._needles):
+            if needle and text.find(needle) >= min_start:
+                return pattern_id
+        return None
+
+    def __len__(self):
+        return len(self.patterns)
+
+
+_matchers = {}
+_matchers_lock = threading.Lock()
+
+
+def matcher_for(name, patterns, ignore_case=False):
+    """
+    :return: the matcher of the given pattern list, built on first use and
+        then shared by all the threads; name identifies the list (e.g.
+        "disturbing_keywords:da")
+    """
+    matcher = _matchers.get(name)
+    if matcher is None:
+        with _matchers_lock:
+            matcher = _matchers.get(name)
+            if matcher is None:
+                matcher = MultiPatternMatcher(patterns, ignore_case=ignore_case)
+                _matchers[name] = matcher
+    return matcher
@@ -0,0 +1,283 @@
+"""
+
+A cache with two tiers, used for the results of the third party services
+(translations, embeddings):
+
+1. every process keeps a bounded LRU of the recently used entries;
+2. behind it, optionally, a local SQLite database keeps the entries across
+   restarts and shares them with the other processes of the machine
+   (e.g. the gunicorn workers). Every thread (of every process) opens its
+   own connection; WAL mode lets the processes read while one of them
+   writes.
+
+A database can hold the entries of several caches, one per namespace.
+Entries can expire after a TTL, in both tiers, and the number of entries
+of a namespace in the database can be capped; the expired and the oldest
+entries are deleted every PRUNE_EVERY_N_WRITES writes.
+
+Failures of the SQLite tier are logged and counted, but never fail the
+caller: it then behaves like a miss.
+
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from zeeguu.logging import warning
+
+# the expired and the extra rows of the SQLite tier are deleted once every
+# that many writes
+PRUNE_EVERY_N_WRITES = 1000
+
+
+class SQLiteCacheStore:
+    """
+    The persistent tier: the values are saved as JSON, by namespace and key.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._writes = 0
+        connection = self._connection()
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entry (
+                namespace TEXT NOT NULL,
+                cache_key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (namespace, cache_key)
+            )
+            """)
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS cache_entry_created_at "
+            "ON cache_entry (namespace, created_at)"
+        )
+
+    def _connection(self):
+        # connections must not be shared with the processes forked after
+        # they were opened
+        if getattr(self._local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.db_path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return self._local.connection
+
+    def get(self, namespace, cache_key, ttl=None):
+        not_before = time.time() - ttl if ttl else 0
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM cache_entry "
+                "WHERE namespace = ? AND cache_key = ? AND created_at > ?",
+                (namespace, cache_key, not_before),
+            )
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else None
+
+    def put(self, namespace, cache_key, value, ttl=None, max_size=None):
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO cache_entry "
+            "(namespace, cache_key, value, created_at) VALUES (?, ?, ?, ?)",
+            (namespace, cache_key, json.dumps(value), time.time()),
+        )
+        self._writes += 1
+        if self._writes % PRUNE_EVERY_N_WRITES == 0:
+            self.prune(namespace, ttl, max_size)
+
+    def prune(self, namespace, ttl=None, max_size=None):
+        """
+        Deletes the expired entries of the namespace, and the oldest ones
+        beyond max_size
+        """
+        connection = self._connection()
+        if ttl:
+            connection.execute(
+                "DELETE FROM cache_entry WHERE namespace = ? AND created_at <= ?",
+                (namespace, time.time() - ttl),
+            )
+        if max_size is not None:
+            connection.execute(
+                "DELETE FROM cache_entry WHERE namespace = ? AND cache_key IN ("
+                "SELECT cache_key FROM cache_entry WHERE namespace = ? "
+                "ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                (namespace, namespace, max_size),
+            )
+
+    def delete(self, namespace, cache_key):
+        self._connection().execute(
+            "DELETE FROM cache_entry WHERE namespace = ? AND cache_key = ?",
+            (namespace, cache_key),
+        )
+
+    def clear(self, namespace):
+        self._connection().execute(
+            "DELETE FROM cache_entry WHERE namespace = ?", (namespace,)
+        )
+
+    def count(self, namespace):
+        return (
+            self._connection()
+            .execute(
+                "SELECT COUNT(*) FROM cache_entry WHERE namespace = ?",
+                (namespace,),
+            )
+            .fetchone()[0]
+        )
+
+
+class TwoTierCache:
+    """
+    :param namespace: identifies the entries of this cache in the database
+    :param max_size: of the LRU of the process
+    :param ttl: seconds after which the entries expire; None for never
+    :param db_path: the SQLite file of the persistent tier; None for none
+    :param max_persistent_size: of the namespace in the database; None for
+        unbounded
+
+    The keys must be JSON serializable (e.g. strings or tuples of strings).
+    """
+
+    def __init__(
+        self, namespace, max_size, ttl=None, db_path=None, max_persistent_size=None
+    ):
+        self.namespace = namespace
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_persistent_size = max_persistent_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.persistent_errors = 0
+
+        self._store = None
+        if db_path:
+            try:
+                self._store = SQLiteCacheStore(db_path)
+            except sqlite3.Error as e:
+                warning(f"{namespace} cache: can't open {db_path}: {e}")
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or time.time() <= expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        value = self._persistent_get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.persistent_hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key, value, persist=True):
+        """
+        :param persist: False to only keep the value in the LRU of the
+            process, e.g. when it is not likely to be needed again later
+        """
+        with self._lock:
+            self._remember(key, value)
+        if persist:
+            self._persistent_put(key, value)
+
+    def _remember(self, key, value):
+        expires_at = time.time() + self.ttl if self.ttl else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _persistent_get(self, key):
+        if not self._store:
+            return None
+        try:
+            return self._store.get(self.namespace, json.dumps(key), self.ttl)
+        except (sqlite3.Error, ValueError) as e:
+            self._persistent_failed(e)
+            return None
+
+    def _persistent_put(self, key, value):
+        if not self._store:
+            return
+        try:
+            self._store.put(
+                self.namespace,
+                json.dumps(key),
+                value,
+                self.ttl,
+                self.max_persistent_size,
+            )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            self._persistent_failed(e)
+
+    def _persistent_failed(self, e):
+        with self._lock:
+            self.persistent_errors += 1
+        warning(f"{self.namespace} cache: {e}")
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+        if self._store:
+            try:
+                self._store.delete(self.namespace, json.dumps(key))
+            except sqlite3.Error as e:
+                self._persistent_failed(e)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+        if self._store:
+            try:
+                self._store.clear(self.namespace)
+            except sqlite3.Error as e:
+                self._persistent_failed(e)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.persistent_hits + self.misses
+            stats = {
+                "pid": os.getpid(),
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "persistent": bool(self._store),
+                "hits": self.hits,
+                "persistent_hits": self.persistent_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "persistent_errors": self.persistent_errors,
+                "hit_rate": (
+                    round((self.hits + self.persistent_hits) / lookups, 3)
+                    if lookups
+                    else 0
+                ),
+            }
+        if self._store:
+            try:
+                stats["persistent_size"] = self._store.count(self.namespace)
+            except sqlite3.Error as e:
+                self._persistent_failed(e)
+        return stats
+
+    def __len__(self):
+        return len(self._entries)
@@ -1,17 +1,29 @@
+import os
 from datetime import datetime, timedelta
 
-from wordstats import Word
+from sqlalchemy import event
+from sqlalchemy.orm import contains_eager
 
 from zeeguu.core.model import Phrase, ExerciseOutcome, UserPreference
 from zeeguu.core.model.db import db
 from zeeguu.core.model.meaning import Meaning
 from zeeguu.core.model.user_word import UserWord
+from zeeguu.core.util.two_tier_cache import TwoTierCache
+from zeeguu.core.word_stats import word_rank
 
 ONE_DAY = 60 * 24
 
 DEFAULT_MAX_WORDS_TO_SCHEDULE = 20
 MAX_WORDS_TO_SCHEDULE_CAP = 100  # Maximum allowed value to prevent SQL LIMIT errors
 
+# the count of words to study is polled by the frontend on every navigation;
+# it is cached per user for this many seconds, or until the user's words change,
+# for the most recent this many users
+WORDS_TO_STUDY_COUNT_TTL = int(os.environ.get("ZEEGUU_WORDS_TO_STUDY_COUNT_TTL", 30))
+WORDS_TO_STUDY_COUNT_CACHE_SIZE = int(
+    os.environ.get("ZEEGUU_WORDS_TO_STUDY_COUNT_CACHE_SIZE", 10000)
+)
+
 
 class BasicSRSchedule(db.Model):
     __table_args__ = {"mysql_collate": "utf8_bin"}
@@ -137,8 +149,8 @@ class BasicSRSchedule(db.Model):
         schedule.update_schedule(db_session, correctness, time)
 
     @classmethod
-    def user_words_not_scheduled(cls, user, limit):
-        unscheduled_meanings = (
+    def _not_scheduled_user_words_query(cls, user):
+        return (
             UserWord.query
             .filter(UserWord.user_id == user.id)
             .outerjoin(BasicSRSchedule)
@@ -148,6 +160,13 @@ class BasicSRSchedule(db.Model):
             .join(Phrase, Meaning.origin_id == Phrase.id)
             .filter(Phrase.language_id == user.learned_language_id)
             .filter(BasicSRSchedule.cooling_interval == None)
+        )
+
+    @classmethod
+    def user_words_not_scheduled(cls, user, limit):
+        unscheduled_meanings = (
+            cls._not_scheduled_user_words_query(user)
+            .options(contains_eager(UserWord.meaning).contains_eager(Meaning.origin))
             .order_by(
                 -Phrase.rank.desc()
             )  # By using the negative for rank, we ensure NULL is last.
@@ -186,11 +205,53 @@ class BasicSRSchedule(db.Model):
 
             scheduled_candidates = scheduled_candidates + unscheduled_bookmarks
 
+        # the cooling intervals of all the candidates, in one query;
+        # the unscheduled ones simply don't have one
+        cooling_intervals = dict(
+            db.session.query(cls.user_word_id, cls.cooling_interval)
+            .filter(cls.user_word_id.in_([each.id for each in scheduled_candidates]))
+            .all()
+        )
+
         sorted_candidates = sorted(
-            scheduled_candidates, key=lambda x: priority_by_rank(x)
+            scheduled_candidates,
+            key=lambda x: priority_by_rank(x, cooling_intervals.get(x.id)),
         )
         return sorted_candidates
 
+    @classmethod
+    def count_of_user_words_to_study(cls, user) -> int:
+        """
+        Same as len(user_words_to_study(user)), but computed with count
+        queries, and cached for WORDS_TO_STUDY_COUNT_TTL seconds
+        """
+        count = _words_to_study_counts.get(user.id)
+        if count is None:
+            count = cls._count_of_user_words_to_study(user)
+            _words_to_study_counts.put(user.id, count)
+        return count
+
+    @classmethod
+    def _count_of_user_words_to_study(cls, user) -> int:
+        max_words_to_schedule = UserPreference.get_max_words_to_schedule(user)
+
+        # the limit inside the count mirrors the limit of scheduled_words_due_today
+        count = (
+            cls._scheduled_user_words_query(user)
+            .filter(cls.next_practice_time < _get_end_of_today())
+            .limit(max_words_to_schedule)
+            .count()
+        )
+
+        scheduled_for_this_user = cls.scheduled_user_words_count(user)
+        if scheduled_for_this_user < max_words_to_schedule:
+            count_needed = max_words_to_schedule - scheduled_for_this_user
+            count += (
+                cls._not_scheduled_user_words_query(user).limit(count_needed).count()
+            )
+
+        return count
+
     @classmethod
     def _scheduled_user_words_query(cls, user, language=None):
         _lang_to_look_at = language.id if language else user.learned_language_id
@@ -203,6 +264,7 @@ class BasicSRSchedule(db.Model):
             .join(Phrase, Meaning.origin_id == Phrase.id)
             .filter(Phrase.language_id == _lang_to_look_at)
             .filter(BasicSRSchedule.id != None)
+            .options(contains_eager(UserWord.meaning).contains_eager(Meaning.origin))
         )
         return query
 
@@ -261,24 +323,43 @@ class BasicSRSchedule(db.Model):
             )
 
 
-def priority_by_rank(user_word):
+_words_to_study_counts = TwoTierCache(
+    "words_to_study_count",
+    WORDS_TO_STUDY_COUNT_CACHE_SIZE,
+    ttl=WORDS_TO_STUDY_COUNT_TTL,
+)
+
+
+def invalidate_count_of_user_words_to_study(user_id):
+    _words_to_study_counts.invalidate(user_id)
+
+
+def _invalidate_count_for_user_word(mapper, connection, target):
+    # e.g. a new translation, or a word that is not fit for study anymore
+    if target.user_id is not None:
+        invalidate_count_of_user_words_to_study(target.user_id)
+
+
+for _event in ["after_insert", "after_update", "after_delete"]:
+    event.listen(UserWord, _event, _invalidate_count_for_user_word)
+
+
+def priority_by_rank(user_word, cooling_interval=None):
     # If this is updated remember to update the order_by in
     # get_scheduled_bookmarks_for_user and get_unscheduled_bookmarks_for_user
 
-    word_info = Word.stats(
-        user_word.meaning.origin.content,
-        user_word.meaning.origin.language.code,
-    )
+    phrase = user_word.meaning.origin
 
-    basic_sr_schedule = BasicSRSchedule.find_by_user_word(user_word)
+    # the rank is stored with the phrase; wordstats is only
+    # consulted for the (older) phrases that don't have one yet
+    rank = phrase.rank
+    if rank is None:
+        rank = word_rank(phrase.content, phrase.language.code)
 
-    cooling_interval = (
-        basic_sr_schedule.cooling_interval
-        if basic_sr_schedule and basic_sr_schedule.cooling_interval is not None
-        else -1
-    )
-    word_rank = word_info.rank if word_info.rank else Phrase.IMPOSSIBLE_RANK
-    return word_rank, -cooling_interval
+    if cooling_interval is None:
+        cooling_interval = -1
+    word_rank_or_impossible = rank if rank else Phrase.IMPOSSIBLE_RANK
+    return word_rank_or_impossible, -cooling_interval
 
 
 def _get_end_of_date(date):
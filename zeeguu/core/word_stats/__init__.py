@@ -1,3 +1,6 @@
+import os
+from functools import lru_cache
+
 from wordstats import LanguageInfo
 
 lang_cache = {}
@@ -10,6 +13,23 @@ def lang_info(lang_code):
     return lang_cache[lang_code]
 
 
+# The ranks looked up in wordstats are cached: the same words keep coming
+# back when sorting the study lists, and they never change; the least
+# recently used ones are dropped, since every phrase ever sorted would
+# otherwise stay in memory for the life of the process
+WORD_RANK_CACHE_SIZE = int(os.environ.get("ZEEGUU_WORD_RANK_CACHE_SIZE", 50000))
+
+
+@lru_cache(maxsize=WORD_RANK_CACHE_SIZE)
+def word_rank(word, lang_code):
+    """
+    :return: the rank of the word in wordstats, or None if unknown
+    """
+    from wordstats import Word
+
+    return Word.stats(word, lang_code).rank
+
+
 # lang_info("da")
 # lang_info("de")
 # lang_info("nl")